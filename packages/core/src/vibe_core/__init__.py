@@ -2,19 +2,43 @@
 
 This package contains the core functionality for the VIBE coding template system,
 including AI model integration, template processing, and project generation.
+
+Public names are re-exported lazily (PEP 562) so that ``import vibe_core`` and
+CLI start-up only pay for the submodules that are actually used.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 __version__ = "0.1.0"
 __author__ = "VIBE Coding Team"
 
-from .generators import CodeArchitect
-from .parsers import ClaudeResponseParser, FileObject
-from .utils import ContextManager, JsonVectorMemory
-from .models import ProjectConfig, GenerationResponse, DryRunResponse
-# CLI is available as vibe_core.cli - avoid circular imports
-from .validators import ProjectIntegrityValidator, PromptValidator
-from .api import DebugAPI
-from .workflows import GenerationWorkflow
+# Public name -> (module, attribute). CLI is available as vibe_core.cli.
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "CodeArchitect": ("vibe_core.generators", "CodeArchitect"),
+    "ClaudeResponseParser": ("vibe_core.parsers", "ClaudeResponseParser"),
+    "FileObject": ("vibe_core.parsers", "FileObject"),
+    "ContextManager": ("vibe_core.utils", "ContextManager"),
+    "JsonVectorMemory": ("vibe_core.utils", "JsonVectorMemory"),
+    "ProjectConfig": ("vibe_core.models", "ProjectConfig"),
+    "GenerationResponse": ("vibe_core.models", "GenerationResponse"),
+    "DryRunResponse": ("vibe_core.models", "DryRunResponse"),
+    "ProjectIntegrityValidator": ("vibe_core.validators", "ProjectIntegrityValidator"),
+    "PromptValidator": ("vibe_core.validators", "PromptValidator"),
+    "DebugAPI": ("vibe_core.api", "DebugAPI"),
+    "GenerationWorkflow": ("vibe_core.workflows", "GenerationWorkflow"),
+}
+
+if TYPE_CHECKING:
+    from .api import DebugAPI
+    from .generators import CodeArchitect
+    from .models import DryRunResponse, GenerationResponse, ProjectConfig
+    from .parsers import ClaudeResponseParser, FileObject
+    from .utils import ContextManager, JsonVectorMemory
+    from .validators import ProjectIntegrityValidator, PromptValidator
+    from .workflows import GenerationWorkflow
 
 __all__ = [
     "CodeArchitect",
@@ -23,10 +47,27 @@ __all__ = [
     "ContextManager",
     "JsonVectorMemory",
     "ProjectConfig",
-    "GenerationResponse", 
+    "GenerationResponse",
     "DryRunResponse",
     "ProjectIntegrityValidator",
     "PromptValidator",
     "DebugAPI",
     "GenerationWorkflow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them in the module."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in ``dir(vibe_core)``."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,12 @@
+"""Debug-mode switch for VIBE Core.
+
+Set ``VIBE_DEBUG=1`` to turn on checks that only guard internal invariants,
+such as bounds on values the package computes itself. Input from users or
+the frontend is always validated.
+"""
+
+from __future__ import annotations
+
+import os
+
+DEBUG = os.getenv("VIBE_DEBUG", "").strip().lower() not in ("", "0", "false", "no")
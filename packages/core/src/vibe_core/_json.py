@@ -0,0 +1,75 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional dependency (``pip install vibe-core[fast]``). Without it
+the standard library ``json`` module is used with matching output settings.
+"""
+
+from __future__ import annotations
+
+import json
+from types import ModuleType
+from typing import Any, Optional, Union
+
+# The orjson module, or None when it is not installed
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON from text or UTF-8 bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to a JSON string.
+
+    Non-ASCII characters are written as-is rather than escaped.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        text: str = orjson.dumps(obj, option=option).decode("utf-8")
+        return text
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Same output as ``dumps(obj)``, without a round trip through ``str``
+    when orjson is available.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return data
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
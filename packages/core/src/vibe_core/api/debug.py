@@ -2,16 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from .. import _json
 from ..models.project import ProjectConfig
 
 logger = logging.getLogger(__name__)
 
+# Micro-batching limits for the /debug-agent endpoint
+_MAX_BATCH_SIZE = 32
+_MAX_BATCH_WAIT = 0.005  # seconds
+
+# Known values used by validate_project_config
+_VALID_ARCHITECTURES = frozenset({
+    "monolith", "microservices", "serverless",
+    "event-driven", "layered", "hexagonal",
+})
+_VALID_PROVIDERS = frozenset({"aws", "azure", "gcp", "vercel", "netlify", "heroku"})
+
+# Alphanumerics, "-" and "_", with at least one alphanumeric character
+_PROJECT_NAME_RE = re.compile(r"[\w-]*[^\W_][\w-]*")
+
+# Fixed log lines emitted by every debug simulation
+_MEMORY_LOGS = ("Simulating memory recording", "Simulating context hydration")
+_GENERATION_LOGS = ("Simulating plan generation", "Simulating file creation")
+
+# Mock output files used by _generate_mock_outputs
+_BASE_FILES = (
+    "README.md",
+    "package.json",
+    ".gitignore",
+    "src/main.py",
+    "src/__init__.py",
+    "tests/test_main.py",
+    "docs/API.md",
+)
+_ARCH_FILES = {
+    "microservices": (
+        "services/user-service/main.py",
+        "services/auth-service/main.py",
+        "docker-compose.yml",
+    ),
+    "serverless": (
+        "functions/handler.py",
+        "serverless.yml",
+        "requirements.txt",
+    ),
+}
+_CLOUD_FILES = {
+    "aws": ("cloudformation.yml", "lambda_function.py"),
+    "azure": ("azure-pipelines.yml", "arm-template.json"),
+    "gcp": ("cloudbuild.yaml", "app.yaml"),
+}
+_TECH_FILES = {
+    "react": ("src/components/App.jsx", "public/index.html"),
+    "fastapi": ("src/api/routes.py", "src/models/schemas.py"),
+}
+
 
 class DebugRequest(BaseModel):
     """Request model for debug API."""
@@ -33,24 +89,176 @@ class DebugResponse(BaseModel):
     errors: List[str] = Field(default_factory=list, description="Any errors encountered")
 
 
+class _JSONResponse(JSONResponse):
+    """JSON response rendered through ``vibe_core._json``.
+    
+    Uses orjson's encoder when it is installed and the standard library
+    otherwise.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Encode the response body."""
+        return _json.dumps_bytes(content)
+
+
+# A queued debug request and the future its caller awaits
+_QueueItem = Tuple[DebugRequest, "asyncio.Future[DebugResponse]"]
+
+
+class _DebugBatcher:
+    """Collect debug requests arriving close together and process them in batches.
+    
+    Requests are queued together with a future; a single consumer task drains
+    up to ``max_batch_size`` items (or whatever arrives within ``max_wait``
+    seconds of the first one), runs the handler over the batch in one loop
+    and resolves each future with its own result or exception.
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[DebugRequest], DebugResponse],
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_wait: float = _MAX_BATCH_WAIT,
+    ) -> None:
+        """Initialize the batcher.
+        
+        Args:
+            handler: Function processing a single request
+            max_batch_size: Maximum number of requests per batch
+            max_wait: Maximum time to wait for a batch to fill, in seconds
+        """
+        self._handler = handler
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._queue: Optional[asyncio.Queue[_QueueItem]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the consumer task is running."""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> None:
+        """Start the consumer task on the running event loop."""
+        if self.running:
+            return
+        queue: asyncio.Queue[_QueueItem] = asyncio.Queue()
+        self._queue = queue
+        self._task = asyncio.create_task(self._consume(queue))
+    
+    async def stop(self) -> None:
+        """Stop the consumer task and fail any requests still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        
+        queue = self._queue
+        while queue is not None and not queue.empty():
+            _fail_stopped([queue.get_nowait()])
+    
+    async def submit(self, request: DebugRequest) -> DebugResponse:
+        """Queue a request and wait for its result.
+        
+        Args:
+            request: Debug request
+            
+        Returns:
+            DebugResponse for the request
+            
+        Raises:
+            RuntimeError: If the batcher was never started or has stopped
+        """
+        queue = self._queue
+        if queue is None:
+            raise RuntimeError("Debug batcher is not running")
+        future: asyncio.Future[DebugResponse] = asyncio.get_running_loop().create_future()
+        await queue.put((request, future))
+        return await future
+    
+    async def _consume(self, queue: asyncio.Queue[_QueueItem]) -> None:
+        """Drain the queue in batches until cancelled.
+        
+        Requests already taken off the queue when the task is cancelled are
+        failed like the ones still queued, so no caller waits forever.
+        
+        Args:
+            queue: Queue filled by ``submit``
+        """
+        loop = asyncio.get_running_loop()
+        batch: List[_QueueItem] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self._max_wait
+                
+                while len(batch) < self._max_batch_size:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                logger.debug("Processing debug batch of %d requests", len(batch))
+                for request, future in batch:
+                    if future.done():  # client went away
+                        continue
+                    try:
+                        future.set_result(self._handler(request))
+                    except Exception as e:
+                        future.set_exception(e)
+                batch = []
+        except asyncio.CancelledError:
+            _fail_stopped(batch)
+            raise
+
+
+def _fail_stopped(items: List[_QueueItem]) -> None:
+    """Fail the pending futures of requests the stopped batcher never ran."""
+    for _, future in items:
+        if not future.done():
+            future.set_exception(RuntimeError("Debug batcher stopped"))
+
+
 class DebugAPI:
     """Debug API for testing and development."""
     
     def __init__(self):
         """Initialize debug API."""
+        self._batcher = _DebugBatcher(self._run_simulation)
         self.app = FastAPI(
             title="VIBE Core Debug API",
             description="Debug API for VIBE Core development and testing",
-            version="1.0.0"
+            version="1.0.0",
+            lifespan=self._lifespan,
+            default_response_class=_JSONResponse,
         )
         self._setup_routes()
     
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, _app: FastAPI) -> AsyncIterator[None]:
+        """Run the request batcher for the lifetime of the application."""
+        self._batcher.start()
+        try:
+            yield
+        finally:
+            await self._batcher.stop()
+    
     def _setup_routes(self) -> None:
         """Setup API routes."""
         
         @self.app.post("/debug-agent", response_model=DebugResponse)
         async def debug_agent(request: DebugRequest) -> DebugResponse:
             """Debug agent execution endpoint."""
+            if self._batcher.running:
+                return await self._batcher.submit(request)
             return await self.debug_agent_execution(request)
         
         @self.app.get("/health")
@@ -66,6 +274,17 @@ class DebugAPI:
     async def debug_agent_execution(self, request: DebugRequest) -> DebugResponse:
         """Simulate agent execution for debugging.
         
+        Args:
+            request: Debug request
+            
+        Returns:
+            DebugResponse with simulation results
+        """
+        return self._run_simulation(request)
+    
+    def _run_simulation(self, request: DebugRequest) -> DebugResponse:
+        """Run the agent simulation for a single request.
+        
         Args:
             request: Debug request
             
@@ -80,28 +299,29 @@ class DebugAPI:
         try:
             # Validate configuration
             config = request.project_config
-            logs.append(f"Configuration parsed for project: {config.project_name}")
             
             # Simulate prompt processing
             if request.merged_prompt:
                 prompt_length = len(request.merged_prompt)
-                logs.append(f"Merged prompt loaded ({prompt_length} characters)")
+                prompt_log = "Merged prompt loaded (" + str(prompt_length) + " characters)"
                 metadata["prompt_length"] = prompt_length
             else:
-                logs.append("No merged prompt provided")
+                prompt_log = "No merged prompt provided"
             
             # Simulate memory operations
-            logs.append("Simulating memory recording")
-            logs.append("Simulating context hydration")
+            logs = [
+                "Configuration parsed for project: " + config.project_name,
+                prompt_log,
+                *_MEMORY_LOGS,
+            ]
             
             # Simulate file generation
             if request.simulate_generation:
-                logs.append("Simulating plan generation")
-                logs.append("Simulating file creation")
+                logs += _GENERATION_LOGS
                 
                 # Generate mock file list based on configuration
                 outputs = self._generate_mock_outputs(config)
-                logs.append(f"Simulated {len(outputs)} output files")
+                logs.append("Simulated " + str(len(outputs)) + " output files")
             
             # Add metadata
             metadata.update({
@@ -111,9 +331,10 @@ class DebugAPI:
                 "simulated": True
             })
             
-            logger.info(f"Debug simulation completed for project: {config.project_name}")
+            logger.info("Debug simulation completed for project: %s", config.project_name)
             
-            return DebugResponse(
+            # The config was validated with the request; skip re-validating it
+            return DebugResponse.model_construct(
                 logs=logs,
                 outputs=outputs,
                 config=config,
@@ -127,7 +348,7 @@ class DebugAPI:
             logger.error(error_msg)
             errors.append(error_msg)
             
-            return DebugResponse(
+            return DebugResponse.model_construct(
                 logs=logs,
                 outputs=outputs,
                 config=request.project_config,
@@ -155,21 +376,17 @@ class DebugAPI:
             issues.append("Project name must be at least 2 characters")
         
         # Check for invalid characters in project name
-        if config.project_name and not config.project_name.replace("-", "").replace("_", "").isalnum():
+        if config.project_name and not _PROJECT_NAME_RE.fullmatch(config.project_name):
             warnings.append("Project name contains special characters")
         
         # Validate architecture style
-        valid_architectures = [
-            "monolith", "microservices", "serverless", 
-            "event-driven", "layered", "hexagonal"
-        ]
-        if config.architecture_style and config.architecture_style not in valid_architectures:
+        if config.architecture_style and config.architecture_style not in _VALID_ARCHITECTURES:
             warnings.append(f"Architecture style '{config.architecture_style}' is not in common patterns")
         
         # Validate cloud provider
-        valid_providers = ["aws", "azure", "gcp", "vercel", "netlify", "heroku"]
-        if config.cloud_provider and config.cloud_provider.lower() not in valid_providers:
-            warnings.append(f"Cloud provider '{config.cloud_provider}' is not commonly supported")
+        provider = config.cloud_provider
+        if provider and provider.lower() not in _VALID_PROVIDERS:
+            warnings.append(f"Cloud provider '{provider}' is not commonly supported")
         
         return {
             "valid": len(issues) == 0,
@@ -187,61 +404,14 @@ class DebugAPI:
         Returns:
             List of mock file paths
         """
-        outputs = [
-            "README.md",
-            "package.json",
-            ".gitignore",
-            "src/main.py",
-            "src/__init__.py",
-            "tests/test_main.py",
-            "docs/API.md"
-        ]
-        
-        # Add architecture-specific files
-        if config.architecture_style == "microservices":
-            outputs.extend([
-                "services/user-service/main.py",
-                "services/auth-service/main.py",
-                "docker-compose.yml"
-            ])
-        elif config.architecture_style == "serverless":
-            outputs.extend([
-                "functions/handler.py",
-                "serverless.yml",
-                "requirements.txt"
-            ])
-        
-        # Add cloud-specific files
-        if config.cloud_provider == "aws":
-            outputs.extend([
-                "cloudformation.yml",
-                "lambda_function.py"
-            ])
-        elif config.cloud_provider == "azure":
-            outputs.extend([
-                "azure-pipelines.yml",
-                "arm-template.json"
-            ])
-        elif config.cloud_provider == "gcp":
-            outputs.extend([
-                "cloudbuild.yaml",
-                "app.yaml"
-            ])
-        
-        # Add technology-specific files
-        if hasattr(config, 'technology_stack') and config.technology_stack:
-            if "react" in [tech.lower() for tech in config.technology_stack]:
-                outputs.extend([
-                    "src/components/App.jsx",
-                    "public/index.html"
-                ])
-            if "fastapi" in [tech.lower() for tech in config.technology_stack]:
-                outputs.extend([
-                    "src/api/routes.py",
-                    "src/models/schemas.py"
-                ])
-        
-        return outputs
+        techs = frozenset(
+            tech.lower() for tech in (getattr(config, "technology_stack", None) or ())
+        )
+        return list(
+            _mock_outputs_for(
+                config.architecture_style, config.cloud_provider, tuple(sorted(techs))
+            )
+        )
     
     def get_app(self) -> FastAPI:
         """Get FastAPI application instance.
@@ -252,8 +422,52 @@ class DebugAPI:
         return self.app
 
 
-# Create global instance
-debug_api = DebugAPI()
+@functools.lru_cache(maxsize=128)
+def _mock_outputs_for(
+    architecture_style: Optional[str],
+    cloud_provider: Optional[str],
+    techs: Tuple[str, ...],
+) -> Tuple[str, ...]:
+    """Build the mock output file list for a normalised configuration key.
+    
+    Args:
+        architecture_style: Architecture style from the configuration
+        cloud_provider: Cloud provider from the configuration
+        techs: Sorted, lowercased technology stack
+        
+    Returns:
+        Tuple of mock file paths
+    """
+    outputs = list(_BASE_FILES)
+    
+    # Add architecture- and cloud-specific files
+    outputs += _ARCH_FILES.get(architecture_style, ())
+    outputs += _CLOUD_FILES.get(cloud_provider, ())
+    
+    # Add technology-specific files
+    for tech, files in _TECH_FILES.items():
+        if tech in techs:
+            outputs += files
+    
+    return tuple(outputs)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_debug_api() -> DebugAPI:
+    """Create the shared DebugAPI instance on first use.
+    
+    Building the FastAPI app registers routes and Pydantic schemas, so it is
+    deferred until a caller actually needs the HTTP application.
+    """
+    return DebugAPI()
+
+
+def __getattr__(name: str) -> Any:
+    """Provide the legacy module-level ``debug_api`` instance lazily."""
+    if name == "debug_api":
+        return _get_debug_api()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_app() -> FastAPI:
     """Get FastAPI application instance - legacy compatibility.
@@ -261,4 +475,4 @@ def get_app() -> FastAPI:
     Returns:
         FastAPI application
     """
-    return debug_api.get_app()
+    return _get_debug_api().get_app()
@@ -2,11 +2,155 @@
 
 from __future__ import annotations
 
-import argparse
-import json
+import hashlib
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
+
+from .. import __version__
+from .._fs import relpath_key, walk_files
+
+if TYPE_CHECKING:
+    import argparse
+
+_VERSION_TEXT = f"VIBE Core {__version__}"
+
+# Read size used when comparing generated files during verification
+_VERIFY_CHUNK_SIZE = 1 << 16
+
+# Upper bound on threads used to check files during verification
+_VERIFY_MAX_WORKERS = 32
+
+
+def _stripped_digest(chunks: Iterable[str]) -> bytes:
+    """Return the SHA-256 digest of text chunks with outer whitespace stripped.
+    
+    Equivalent to ``sha256("".join(chunks).strip().encode()).digest()`` but
+    without materialising the joined text. Trailing whitespace is held back
+    until it is known not to be at the end of the text.
+    
+    Args:
+        chunks: Consecutive pieces of the text
+        
+    Returns:
+        Digest bytes
+    """
+    digest = hashlib.sha256()
+    started = False
+    pending = ""
+    
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        
+        body = chunk.rstrip()
+        if body:
+            if pending:
+                digest.update(pending.encode("utf-8"))
+            digest.update(body.encode("utf-8"))
+            pending = chunk[len(body):]
+        else:
+            pending += chunk
+    
+    return digest.digest()
+
+
+def _file_digest(path: Path) -> bytes:
+    """Return the stripped-content digest of a text file, read in chunks.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Digest bytes
+    """
+    with path.open("r", encoding="utf-8") as f:
+        return _stripped_digest(iter(lambda: f.read(_VERIFY_CHUNK_SIZE), ""))
+
+
+@lru_cache(maxsize=16)
+def _parse_response_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a response file, memoised on its resolved path, mtime and size.
+    
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is parsed again. The result is kept as plain path and content
+    columns; callers get their own file objects from ``_load_response``.
+    
+    Args:
+        path: Resolved path of the response file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        ParsedFiles with the path and content of each parsed file
+    """
+    del mtime_ns, size  # cache key only
+    from ..parsers import ParsedFiles, parse_claude_response
+    
+    text = Path(path).read_text(encoding="utf-8")
+    return ParsedFiles.from_files(parse_claude_response(text))
+
+
+def _load_response(path: Path) -> List[Any]:
+    """Return the files parsed from a response file, reusing earlier parses.
+    
+    Args:
+        path: Response file to parse
+        
+    Returns:
+        List of parsed FileObject instances
+        
+    Raises:
+        FileNotFoundError: If the response file does not exist
+    """
+    resolved = path.resolve()
+    try:
+        st = resolved.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Response file not found: {path}") from None
+    return _parse_response_cached(str(resolved), st.st_mtime_ns, st.st_size).to_list()
+
+
+def write_lines(lines: List[str]) -> None:
+    """Write several output lines to stdout with a single write and flush.
+    
+    Args:
+        lines: Lines to write, without trailing newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _check_one(project_dir: Path, file_obj: Any) -> Tuple[str, Optional[str]]:
+    """Check a single parsed file against the project directory.
+    
+    Args:
+        project_dir: Directory containing the generated project
+        file_obj: Parsed file with ``path`` and ``content``
+        
+    Returns:
+        ``("missing", path)``, ``("mismatch", path)`` or ``("ok", None)``
+    """
+    file_path = project_dir / file_obj.path
+    try:
+        size = file_path.stat().st_size
+    except FileNotFoundError:
+        return "missing", file_obj.path
+    
+    # Surrounding whitespace is ignored, so a matching file can be larger than
+    # the expected text but never smaller; reject those without reading them.
+    expected = file_obj.content.strip().encode("utf-8")
+    if size < len(expected):
+        return "mismatch", file_obj.path
+    if _file_digest(file_path) != hashlib.sha256(expected).digest():
+        return "mismatch", file_obj.path
+    return "ok", None
 
 
 class VibeCLI:
@@ -16,8 +160,16 @@ class VibeCLI:
         """Initialize CLI."""
         self.logger = logging.getLogger(__name__)
     
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create and configure argument parser."""
+    def create_parser(self, command: Optional[str] = None) -> argparse.ArgumentParser:
+        """Create and configure argument parser.
+        
+        Args:
+            command: If this names a known command, only that subparser is
+                built. Otherwise all subparsers are built so that help and
+                error messages list every command.
+        """
+        import argparse
+        
         parser = argparse.ArgumentParser(
             prog="vibe",
             description="VIBE - AI-powered project generation and coding assistant",
@@ -33,54 +185,77 @@ class VibeCLI:
         parser.add_argument(
             "--version",
             action="version",
-            version="VIBE Core 0.1.0"
+            version=_VERSION_TEXT
         )
         
         # Subcommands
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
         
-        # Generate command
+        builders = {
+            "generate": self._add_generate_parser,
+            "parse": self._add_parse_parser,
+            "verify": self._add_verify_parser,
+            "status": self._add_status_parser,
+        }
+        if command in builders:
+            builders[command](subparsers)
+        else:
+            for build in builders.values():
+                build(subparsers)
+        
+        return parser
+    
+    @staticmethod
+    def _add_generate_parser(subparsers: Any) -> None:
+        """Add the generate command."""
         generate_parser = subparsers.add_parser("generate", help="Generate a new project")
         generate_parser.add_argument("name", help="Project name")
         generate_parser.add_argument("--dry-run", action="store_true", help="Show what would be generated without creating files")
-        
-        # Parse command
+    
+    @staticmethod
+    def _add_parse_parser(subparsers: Any) -> None:
+        """Add the parse command."""
         parse_parser = subparsers.add_parser("parse", help="Parse a Claude response file")
         parse_parser.add_argument("source", type=Path, help="Path to text response from Claude")
         parse_parser.add_argument("out_dir", type=Path, help="Directory to write files")
         parse_parser.add_argument("--dry-run", action="store_true", help="Preview actions without writing")
-        
-        # Verify command
+    
+    @staticmethod
+    def _add_verify_parser(subparsers: Any) -> None:
+        """Add the verify command."""
         verify_parser = subparsers.add_parser("verify", help="Verify generated files against response")
         verify_parser.add_argument("response", type=Path, help="Path to Claude response file")
         verify_parser.add_argument("project_dir", type=Path, help="Path to project directory")
-        
-        # Status command
-        status_parser = subparsers.add_parser("status", help="Show VIBE status")
-        
-        return parser
+    
+    @staticmethod
+    def _add_status_parser(subparsers: Any) -> None:
+        """Add the status command."""
+        subparsers.add_parser("status", help="Show VIBE status")
     
     def run(self, args=None):
         """Run the CLI with given arguments."""
-        parser = self.create_parser()
-        parsed_args = parser.parse_args(args)
+        argv = sys.argv[1:] if args is None else args
+        # The first non-option argument is the command; build only its parser
+        command = next((arg for arg in argv if not arg.startswith("-")), None)
+        parser = self.create_parser(command)
+        parsed_args = parser.parse_args(argv)
         
         # Configure logging
         level = logging.DEBUG if parsed_args.verbose else logging.INFO
         logging.basicConfig(level=level, format='%(levelname)s: %(message)s')
         
         # Handle commands
-        if parsed_args.command == "generate":
-            return self.handle_generate(parsed_args)
-        elif parsed_args.command == "parse":
-            return self.handle_parse(parsed_args)
-        elif parsed_args.command == "verify":
-            return self.handle_verify(parsed_args)
-        elif parsed_args.command == "status":
-            return self.handle_status(parsed_args)
-        else:
+        handlers = {
+            "generate": self.handle_generate,
+            "parse": self.handle_parse,
+            "verify": self.handle_verify,
+            "status": self.handle_status,
+        }
+        handler = handlers.get(parsed_args.command)
+        if handler is None:
             parser.print_help()
             return 0
+        return handler(parsed_args)
     
     def handle_generate(self, args):
         """Handle the generate command."""
@@ -103,7 +278,7 @@ class VibeCLI:
             
             # Create workflow options
             workflow_options = WorkflowOptions(
-                config_json=json.dumps(config_data),
+                config_dict=config_data,
                 dry_run=args.dry_run,
                 verbose=args.verbose if hasattr(args, 'verbose') else False
             )
@@ -121,9 +296,9 @@ class VibeCLI:
                         print(f"Archive created at: {result.generation_result.archive_path}")
                 return 0
             else:
-                print("✗ Project generation failed:")
-                for error in result.errors:
-                    print(f"  - {error}")
+                lines = ["✗ Project generation failed:"]
+                lines.extend(f"  - {error}" for error in result.errors)
+                write_lines(lines)
                 return 1
                 
         except Exception as e:
@@ -138,8 +313,8 @@ class VibeCLI:
         try:
             from ..parsers import ClaudeResponseParser
             
-            parser = ClaudeResponseParser()
-            files = parser.parse_response_file(args.source, args.out_dir, args.dry_run)
+            files = _load_response(args.source)
+            ClaudeResponseParser().write_files(files, args.out_dir, args.dry_run)
             
             if args.dry_run:
                 print(f"✓ Found {len(files)} files in response (dry run)")
@@ -157,40 +332,53 @@ class VibeCLI:
     def handle_verify(self, args):
         """Handle the verify command."""
         try:
-            from ..parsers import parse_claude_response
-            
             # Read the Claude response
-            response_text = args.response.read_text()
-            parsed_files = parse_claude_response(response_text)
+            parsed_files = _load_response(args.response)
             
             # Check if files exist in project directory
             missing_files = []
             content_mismatches = []
             
-            for file_obj in parsed_files:
-                file_path = args.project_dir / file_obj.path
-                if not file_path.exists():
-                    missing_files.append(file_obj.path)
-                else:
-                    actual_content = file_path.read_text().strip()
-                    expected_content = file_obj.content.strip()
-                    if actual_content != expected_content:
-                        content_mismatches.append(file_obj.path)
+            if parsed_files:
+                existing = walk_files(args.project_dir)
+                present = []
+                for file_obj in parsed_files:
+                    if relpath_key(file_obj.path) in existing:
+                        present.append(file_obj)
+                    else:
+                        missing_files.append(file_obj.path)
+            else:
+                present = []
+            
+            if present:
+                # Content checks are I/O-bound; overlap them
+                workers = min(_VERIFY_MAX_WORKERS, len(present))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(
+                        executor.map(partial(_check_one, args.project_dir), present)
+                    )
+            else:
+                results = []
+            
+            for status, path in results:
+                if status == "missing":
+                    missing_files.append(path)
+                elif status == "mismatch":
+                    content_mismatches.append(path)
             
             # Report results
             if not missing_files and not content_mismatches:
                 print("✓ Verification succeeded - all files match")
                 return 0
             else:
-                print("✗ Verification failed:")
+                lines = ["✗ Verification failed:"]
                 if missing_files:
-                    print(f"  Missing files ({len(missing_files)}):")
-                    for path in missing_files:
-                        print(f"    - {path}")
+                    lines.append(f"  Missing files ({len(missing_files)}):")
+                    lines.extend(f"    - {path}" for path in missing_files)
                 if content_mismatches:
-                    print(f"  Content mismatches ({len(content_mismatches)}):")
-                    for path in content_mismatches:
-                        print(f"    - {path}")
+                    lines.append(f"  Content mismatches ({len(content_mismatches)}):")
+                    lines.extend(f"    - {path}" for path in content_mismatches)
+                write_lines(lines)
                 return 1
                 
         except Exception as e:
@@ -202,18 +390,35 @@ class VibeCLI:
     
     def handle_status(self, args):
         """Handle the status command."""
-        print("VIBE Core Status:")
-        print("✓ CLI is working")
-        print("✓ Basic functionality available")
-        print("⚠ Full generation workflow in development")
+        write_lines([
+            "VIBE Core Status:",
+            "✓ CLI is working",
+            "✓ Basic functionality available",
+            "⚠ Full generation workflow in development",
+        ])
         return 0
 
 
-def main():
-    """Main entry point for CLI."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for CLI.
+    
+    Args:
+        argv: Command line arguments (uses sys.argv if None)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Answer trivial invocations without building the argument parser
+    if argv == ["--version"]:
+        print(_VERSION_TEXT)
+        return 0
+    
     cli = VibeCLI()
+    if argv == ["status"]:
+        return cli.handle_status(None)
+    
     try:
-        return cli.run()
+        return cli.run(argv)
     except KeyboardInterrupt:
         print("\nAborted by user")
         return 1
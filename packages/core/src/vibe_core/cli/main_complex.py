@@ -3,29 +3,260 @@
 from __future__ import annotations
 
 import argparse
-import json
+import itertools
 import logging
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NoReturn, Optional, Set, Tuple
+)
 
-from ..workflows.generate import GenerationWorkflow, WorkflowOptions
-from ..validators.integrity import validate_project
-from ..parsers.claude import parse_claude_response
-from ..generators.architect import CodeArchitect
-from ..utils.env import load_api_keys
+from .. import __version__, _json
+from .._fs import relpath_key, walk_files
+from .main import write_lines
+
+if TYPE_CHECKING:
+    from ..workflows.generate import GenerationWorkflow
+
+# Heavy modules (workflows, validators, parsers, model clients) are imported
+# inside the command handlers so that --help and argument errors stay cheap.
 
 logger = logging.getLogger(__name__)
 
+# Commands that talk to the model APIs and therefore need keys
+_NEEDS_API_KEYS = frozenset({"generate"})
+
+# Below this many files, cmd_parse writes serially rather than on a thread pool
+_PARALLEL_WRITE_THRESHOLD = 16
+
+# Up to this many response files, verify stats each one instead of walking
+# the whole project directory
+_STAT_LIMIT = 200
+
+# Number of missing files listed by the verify command
+_VERIFY_DISPLAY_LIMIT = 10
+
+# Subcommand help, shared by the full subparsers and the help-only listing
+_SUBCOMMAND_HELP: Dict[str, str] = {
+    "generate": "Generate project architecture using Claude AI",
+    "parse": "Parse Claude response file into project files",
+    "validate": "Validate project integrity and structure",
+    "merge": "Merge prompt templates with configuration",
+    "verify": "Verify generated files against Claude response",
+}
+
+_VERSION_TEXT = f"VIBE Core {__version__}"
+
+# Top-level help as argparse renders it at 80 columns, built once from the
+# command table so `vibe --help` needs no parser
+_STATIC_HELP = (
+    "usage: vibe [-h] [--verbose] {" + ",".join(_SUBCOMMAND_HELP) + "} ...\n"
+    "\n"
+    "VIBE Coding Template CLI\n"
+    "\n"
+    "positional arguments:\n"
+    "  {" + ",".join(_SUBCOMMAND_HELP) + "}\n"
+    "                        Available commands\n"
+    + "".join(f"    {name:<20}{text}\n" for name, text in _SUBCOMMAND_HELP.items())
+    + "\n"
+    "options:\n"
+    "  -h, --help            show this help message and exit\n"
+    "  --verbose, -v         Enable verbose logging\n"
+)
+
+
+@cache
+def _config_parent() -> argparse.ArgumentParser:
+    """Shared ``--config``/``--json`` options for generate and merge."""
+    parent = argparse.ArgumentParser(add_help=False)
+    
+    # Config options (mutually exclusive)
+    config_group = parent.add_mutually_exclusive_group(required=True)
+    config_group.add_argument(
+        "--config", "-c",
+        type=Path,
+        help="Path to JSON configuration file"
+    )
+    config_group.add_argument(
+        "--json", "-j",
+        type=str,
+        help="Configuration as JSON string"
+    )
+    return parent
+
+
+@cache
+def _dry_run_parent() -> argparse.ArgumentParser:
+    """Shared ``--dry-run`` flag for generate and parse."""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Preview actions without writing files"
+    )
+    return parent
+
+
+def _sniff_command(argv: Optional[List[str]]) -> Optional[str]:
+    """Return the subcommand named in ``argv`` without parsing it.
+    
+    The top-level parser has no options taking values, so the first
+    non-option argument is the subcommand.
+    
+    Args:
+        argv: Command line arguments (uses sys.argv if None)
+        
+    Returns:
+        The first non-option argument, or None
+    """
+    args = sys.argv[1:] if argv is None else argv
+    return next((arg for arg in args if not arg.startswith("-")), None)
+
+
+def _prepare_targets(files: Iterable[Any], output_dir: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(target, content)`` pairs, creating parent directories first.
+    
+    Each parent directory is created at most once. ``output_dir`` must
+    already exist.
+    
+    Args:
+        files: Parsed files with ``path`` and ``content``
+        output_dir: Directory the files are written under
+        
+    Yields:
+        Target path and content for each file
+    """
+    # Plain strings in the loop avoid allocating Path objects per file
+    out_root = os.fspath(output_dir)
+    made = {out_root}
+    for file in files:
+        rel = file.path if isinstance(file.path, str) else os.fspath(file.path)
+        target = os.path.join(out_root, rel)  # noqa: PTH118  # str paths, see above
+        parent = os.path.dirname(target)  # noqa: PTH120  # str directory cache
+        if parent not in made:
+            os.makedirs(parent, exist_ok=True)  # noqa: PTH103  # str directory cache
+            made.add(parent)
+        yield target, file.content
+
+
+def _write_files(targets: Iterable[Tuple[str, str]]) -> int:
+    """Encode and write files, using a thread pool for larger batches.
+    
+    The first ``_PARALLEL_WRITE_THRESHOLD`` targets are buffered; if the input
+    ends before that they are written serially. Otherwise a pool is started and
+    the remaining targets are submitted as they arrive, so writing overlaps
+    with producing them. A path that appears again waits for its earlier
+    write, so the last content for each path wins as in a serial write.
+    
+    Args:
+        targets: ``(path, content)`` pairs
+        
+    Returns:
+        Number of files written
+    """
+    targets = iter(targets)
+    pending = list(itertools.islice(targets, _PARALLEL_WRITE_THRESHOLD))
+    if len(pending) < _PARALLEL_WRITE_THRESHOLD:
+        for path, content in pending:
+            _write_text(path, content)
+        return len(pending)
+    
+    workers = min(32, (os.cpu_count() or 4) * 4)
+    # Latest write submitted for each normalized target path
+    latest: Dict[str, Future] = {}
+    
+    def submit(path: str, content: str) -> Future:
+        key = os.path.normpath(path)
+        previous = latest.get(key)
+        if previous is not None:
+            previous.result()
+        future = latest[key] = executor.submit(_write_text, path, content)
+        return future
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [submit(*target) for target in itertools.chain(pending, targets)]
+        for future in futures:
+            future.result()
+    return len(futures)
+
+
+def _write_text(path: str, content: str) -> None:
+    """Write text to a file as UTF-8, replacing any content.
+    
+    Args:
+        path: File to write
+        content: Text to write
+    """
+    _write_bytes(path, content.encode("utf-8"))
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to a file with raw ``os`` calls, replacing any content.
+    
+    Args:
+        path: File to write
+        data: Bytes to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 
 class VibeCLI:
     """Main CLI interface for VIBE Core."""
     
-    def __init__(self):
-        """Initialize CLI."""
-        self.workflow = GenerationWorkflow()
+    __slots__ = ("_hard_exit", "_parsers", "_workflow")
+    
+    def __init__(self, hard_exit: bool = False):
+        """Initialize CLI.
+        
+        Args:
+            hard_exit: Terminate with ``os._exit`` on failures instead of
+                raising SystemExit. Only for use as the process entry point.
+        """
+        self._hard_exit = hard_exit
+        # Parsers built by run(), keyed by subcommand (None for the listing)
+        self._parsers: Dict[Optional[str], argparse.ArgumentParser] = {}
+        self._workflow: Optional[GenerationWorkflow] = None
         self.setup_logging()
     
+    def _fail(self, message: Optional[str] = None, code: int = 1) -> NoReturn:
+        """Exit with an error status, optionally printing a message to stderr.
+        
+        With ``hard_exit`` the process ends via ``os._exit`` after flushing
+        output and logging, skipping interpreter teardown of the imported
+        modules. Otherwise SystemExit is raised as usual.
+        
+        Args:
+            message: Error message to print
+            code: Exit status
+        """
+        if message:
+            print(message, file=sys.stderr)
+        if self._hard_exit:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            logging.shutdown()
+            os._exit(code)
+        sys.exit(code)
+    
+    @property
+    def workflow(self) -> GenerationWorkflow:
+        """Generation workflow, created on first use."""
+        if self._workflow is None:
+            from ..workflows.generate import GenerationWorkflow
+            
+            self._workflow = GenerationWorkflow()
+        return self._workflow
+    
     def setup_logging(self, level: int = logging.INFO) -> None:
         """Setup logging configuration.
         
@@ -38,8 +269,16 @@ class VibeCLI:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
     
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser with all subcommands.
+    def create_parser(self, argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+        """Create argument parser for the requested subcommand.
+        
+        Only the subcommand named in ``argv`` gets its full argument
+        definitions. When no known subcommand is given (``--help``, no
+        arguments, a typo), every subcommand is registered with its help
+        text only so that usage and error messages still list them all.
+        
+        Args:
+            argv: Command line arguments (uses sys.argv if None)
         
         Returns:
             Configured ArgumentParser
@@ -58,20 +297,20 @@ class VibeCLI:
         # Create subparsers
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
         
-        # Generate command
-        self._add_generate_parser(subparsers)
-        
-        # Parse command  
-        self._add_parse_parser(subparsers)
-        
-        # Validate command
-        self._add_validate_parser(subparsers)
-        
-        # Merge command
-        self._add_merge_parser(subparsers)
+        builders = {
+            "generate": self._add_generate_parser,
+            "parse": self._add_parse_parser,
+            "validate": self._add_validate_parser,
+            "merge": self._add_merge_parser,
+            "verify": self._add_verify_parser,
+        }
         
-        # Verify command
-        self._add_verify_parser(subparsers)
+        command = _sniff_command(argv)
+        if command in builders:
+            builders[command](subparsers)
+        else:
+            for name, help_text in _SUBCOMMAND_HELP.items():
+                subparsers.add_parser(name, help=help_text)
         
         return parser
     
@@ -79,20 +318,8 @@ class VibeCLI:
         """Add generate subcommand parser."""
         gen_parser = subparsers.add_parser(
             "generate",
-            help="Generate project architecture using Claude AI"
-        )
-        
-        # Config options (mutually exclusive)
-        config_group = gen_parser.add_mutually_exclusive_group(required=True)
-        config_group.add_argument(
-            "--config", "-c",
-            type=Path,
-            help="Path to JSON configuration file"
-        )
-        config_group.add_argument(
-            "--json", "-j",
-            type=str,
-            help="Configuration as JSON string"
+            parents=[_config_parent(), _dry_run_parent()],
+            help=_SUBCOMMAND_HELP["generate"]
         )
         
         # Generation options
@@ -106,11 +333,6 @@ class VibeCLI:
             type=Path,
             help="Output directory (default: ./build)"
         )
-        gen_parser.add_argument(
-            "--dry-run",
-            action="store_true",
-            help="Preview actions without generating files"
-        )
         gen_parser.add_argument(
             "--json-output",
             action="store_true", 
@@ -123,7 +345,8 @@ class VibeCLI:
         """Add parse subcommand parser."""
         parse_parser = subparsers.add_parser(
             "parse",
-            help="Parse Claude response file into project files"
+            parents=[_dry_run_parent()],
+            help=_SUBCOMMAND_HELP["parse"]
         )
         
         parse_parser.add_argument(
@@ -136,11 +359,6 @@ class VibeCLI:
             type=Path,
             help="Directory to write parsed files"
         )
-        parse_parser.add_argument(
-            "--dry-run",
-            action="store_true",
-            help="Preview actions without writing files"
-        )
         
         parse_parser.set_defaults(func=self.cmd_parse)
     
@@ -148,7 +366,7 @@ class VibeCLI:
         """Add validate subcommand parser."""
         validate_parser = subparsers.add_parser(
             "validate",
-            help="Validate project integrity and structure"
+            help=_SUBCOMMAND_HELP["validate"]
         )
         
         validate_parser.add_argument(
@@ -168,20 +386,8 @@ class VibeCLI:
         """Add merge subcommand parser."""
         merge_parser = subparsers.add_parser(
             "merge",
-            help="Merge prompt templates with configuration"
-        )
-        
-        # Config options (mutually exclusive)
-        config_group = merge_parser.add_mutually_exclusive_group(required=True)
-        config_group.add_argument(
-            "--config", "-c",
-            type=Path,
-            help="Path to JSON configuration file"
-        )
-        config_group.add_argument(
-            "--json", "-j",
-            type=str,
-            help="Configuration as JSON string"
+            parents=[_config_parent()],
+            help=_SUBCOMMAND_HELP["merge"]
         )
         
         merge_parser.add_argument(
@@ -201,7 +407,7 @@ class VibeCLI:
         """Add verify subcommand parser."""
         verify_parser = subparsers.add_parser(
             "verify",
-            help="Verify generated files against Claude response"
+            help=_SUBCOMMAND_HELP["verify"]
         )
         
         verify_parser.add_argument(
@@ -215,6 +421,15 @@ class VibeCLI:
             help="Path to generated project directory"
         )
         
+        verify_parser.add_argument(
+            "--fail-fast",
+            action="store_true",
+            help=(
+                f"Stop once more than {_VERIFY_DISPLAY_LIMIT} missing files "
+                "have been found"
+            )
+        )
+        
         verify_parser.set_defaults(func=self.cmd_verify)
     
     def cmd_generate(self, args) -> None:
@@ -223,6 +438,8 @@ class VibeCLI:
         Args:
             args: Parsed command arguments
         """
+        from ..workflows.generate import WorkflowOptions
+        
         try:
             # Setup options
             options = WorkflowOptions(
@@ -239,7 +456,7 @@ class VibeCLI:
             result = self.workflow.run(options)
             
             if args.dry_run and args.json_output and result.output_data:
-                print(json.dumps(result.output_data, indent=2))
+                print(_json.dumps(result.output_data, indent=True))
             elif result.success:
                 if result.generation_result and result.generation_result.archive_path:
                     print(result.generation_result.archive_path)
@@ -249,12 +466,11 @@ class VibeCLI:
                 print("Generation failed:")
                 for error in result.errors:
                     print(f"  - {error}")
-                sys.exit(1)
+                self._fail()
                 
         except Exception as e:
             logger.error(f"Generate command failed: {e}")
-            print(f"Error: {e}")
-            sys.exit(1)
+            self._fail(f"Error: {e}")
     
     def cmd_parse(self, args) -> None:
         """Handle parse command.
@@ -262,33 +478,31 @@ class VibeCLI:
         Args:
             args: Parsed command arguments
         """
+        from ..parsers.claude import parse_claude_response_stream
+        
         try:
             if not args.source.exists():
-                print(f"Error: Source file not found: {args.source}")
-                sys.exit(1)
+                self._fail(f"Error: Source file not found: {args.source}")
             
-            # Parse response
-            content = args.source.read_text(encoding="utf-8")
-            files = parse_claude_response(content)
+            # Read the response line by line, but parse all of it before
+            # writing so a bad response leaves no partial output behind
+            with args.source.open(encoding="utf-8") as source:
+                files = list(parse_claude_response_stream(source))
             
             if args.dry_run:
-                print(f"Would parse {len(files)} files:")
-                for file in files:
-                    print(f"  {file.path}")
+                lines = [f"  {file.path}" for file in files]
+                lines.insert(0, f"Would parse {len(lines)} files:")
+                write_lines(lines)
             else:
-                # Write files
+                # Write files, creating each parent directory only once
                 args.output_dir.mkdir(parents=True, exist_ok=True)
-                for file in files:
-                    target = args.output_dir / file.path
-                    target.parent.mkdir(parents=True, exist_ok=True)
-                    target.write_text(file.content, encoding="utf-8")
-                    
-                print(f"Parsed {len(files)} files to {args.output_dir}")
+                count = _write_files(_prepare_targets(files, args.output_dir))
+                
+                print(f"Parsed {count} files to {args.output_dir}")
                 
         except Exception as e:
             logger.error(f"Parse command failed: {e}")
-            print(f"Error: {e}")
-            sys.exit(1)
+            self._fail(f"Error: {e}")
     
     def cmd_validate(self, args) -> None:
         """Handle validate command.
@@ -296,10 +510,11 @@ class VibeCLI:
         Args:
             args: Parsed command arguments
         """
+        from ..validators.integrity import validate_project
+        
         try:
             if not args.project_dir.exists():
-                print(f"Error: Project directory not found: {args.project_dir}")
-                sys.exit(1)
+                self._fail(f"Error: Project directory not found: {args.project_dir}")
             
             # Run validation
             report = validate_project(args.project_dir, args.report)
@@ -308,23 +523,25 @@ class VibeCLI:
                 print(f"Validation report written to: {args.report}")
             else:
                 # Print summary
-                print(f"Project: {report.project_path}")
-                print(f"Files: {report.total_files}")
-                print(f"Issues: {len(report.issues)}")
+                lines = [
+                    f"Project: {report.project_path}",
+                    f"Files: {report.total_files}",
+                    f"Issues: {len(report.issues)}",
+                ]
                 
                 if report.success:
-                    print("✅ Validation passed")
+                    lines.append("✅ Validation passed")
                 else:
-                    print("❌ Validation failed")
-                    for issue in report.issues[:5]:  # Show first 5 issues
-                        print(f"  - {issue['message']}")
+                    lines.append("❌ Validation failed")
+                    # Show first 5 issues
+                    lines.extend(f"  - {issue['message']}" for issue in report.issues[:5])
                     if len(report.issues) > 5:
-                        print(f"  ... and {len(report.issues) - 5} more issues")
+                        lines.append(f"  ... and {len(report.issues) - 5} more issues")
+                write_lines(lines)
                 
         except Exception as e:
             logger.error(f"Validate command failed: {e}")
-            print(f"Error: {e}")
-            sys.exit(1)
+            self._fail(f"Error: {e}")
     
     def cmd_merge(self, args) -> None:
         """Handle merge command.
@@ -335,9 +552,9 @@ class VibeCLI:
         try:
             # Load configuration
             if args.config:
-                config_data = json.loads(args.config.read_text())
+                config_data = _json.loads(args.config.read_bytes())
             else:
-                config_data = json.loads(args.json)
+                config_data = _json.loads(args.json)
             
             # Setup merge configuration
             merge_config = config_data.copy()
@@ -356,8 +573,7 @@ class VibeCLI:
             
         except Exception as e:
             logger.error(f"Merge command failed: {e}")
-            print(f"Error: {e}")
-            sys.exit(1)
+            self._fail(f"Error: {e}")
     
     def cmd_verify(self, args) -> None:
         """Handle verify command.
@@ -365,41 +581,62 @@ class VibeCLI:
         Args:
             args: Parsed command arguments
         """
+        from ..parsers.claude import parse_claude_response_stream
+        
         try:
             if not args.response_file.exists():
-                print(f"Error: Response file not found: {args.response_file}")
-                sys.exit(1)
+                self._fail(f"Error: Response file not found: {args.response_file}")
                 
             if not args.project_dir.exists():
-                print(f"Error: Project directory not found: {args.project_dir}")
-                sys.exit(1)
+                self._fail(f"Error: Project directory not found: {args.project_dir}")
             
-            # Parse response and verify files
-            content = args.response_file.read_text(encoding="utf-8")
-            files = parse_claude_response(content)
+            # Small responses are checked with one stat per file. Past
+            # _STAT_LIMIT files a single walk of the project is cheaper,
+            # so the remaining files are looked up in the walked set. Both
+            # count regular files only, following symlinks.
+            root = os.fspath(args.project_dir)
+            present: Optional[Set[str]] = None
             
+            # Parse the response line by line and check each file as it arrives
             missing_files = []
-            for file in files:
-                file_path = args.project_dir / file.path
-                if not file_path.exists():
-                    missing_files.append(file.path)
+            total = 0
+            stopped_early = False
+            with args.response_file.open(encoding="utf-8") as source:
+                for file in parse_claude_response_stream(source):
+                    total += 1
+                    rel = file.path if isinstance(file.path, str) else os.fspath(file.path)
+                    if present is None and total > _STAT_LIMIT:
+                        present = walk_files(args.project_dir)
+                    if present is None:
+                        found = os.path.isfile(root + os.sep + rel.replace("/", os.sep))  # noqa: PTH113  # str path
+                    else:
+                        found = relpath_key(rel) in present
+                    if not found:
+                        missing_files.append(file.path)
+                        if args.fail_fast and len(missing_files) > _VERIFY_DISPLAY_LIMIT:
+                            stopped_early = True
+                            break
             
             if missing_files:
-                print("❌ Verification failed")
-                print(f"Missing {len(missing_files)} files:")
-                for path in missing_files[:10]:  # Show first 10
-                    print(f"  - {path}")
-                if len(missing_files) > 10:
-                    print(f"  ... and {len(missing_files) - 10} more")
-                sys.exit(1)
+                lines = ["❌ Verification failed"]
+                if stopped_early:
+                    lines.append(
+                        f"Missing more than {_VERIFY_DISPLAY_LIMIT} files "
+                        "(stopped early, --fail-fast):"
+                    )
+                else:
+                    lines.append(f"Missing {len(missing_files)} files:")
+                lines.extend(f"  - {path}" for path in missing_files[:_VERIFY_DISPLAY_LIMIT])
+                if len(missing_files) > _VERIFY_DISPLAY_LIMIT and not stopped_early:
+                    lines.append(f"  ... and {len(missing_files) - _VERIFY_DISPLAY_LIMIT} more")
+                write_lines(lines)
+                self._fail()
             else:
-                print("✅ Verification passed")
-                print(f"All {len(files)} files found")
+                write_lines(["✅ Verification passed", f"All {total} files found"])
                 
         except Exception as e:
             logger.error(f"Verify command failed: {e}")
-            print(f"Error: {e}")
-            sys.exit(1)
+            self._fail(f"Error: {e}")
     
     def run(self, argv: Optional[List[str]] = None) -> None:
         """Run CLI with given arguments.
@@ -407,7 +644,11 @@ class VibeCLI:
         Args:
             argv: Command line arguments (uses sys.argv if None)
         """
-        parser = self.create_parser()
+        command = _sniff_command(argv)
+        key = command if command in _SUBCOMMAND_HELP else None
+        parser = self._parsers.get(key)
+        if parser is None:
+            parser = self._parsers[key] = self.create_parser(argv)
         args = parser.parse_args(argv)
         
         # Setup verbose logging if requested
@@ -415,13 +656,17 @@ class VibeCLI:
             self.setup_logging(logging.DEBUG)
             logger.debug("Verbose logging enabled")
         
-        # Check for API keys early
-        try:
-            load_api_keys()
-        except ValueError as e:
-            print(f"Error: {e}")
-            print("Please ensure your API keys are set in environment variables or .env file")
-            sys.exit(1)
+        # Check for API keys early, only for commands that call the models
+        if args.command in _NEEDS_API_KEYS:
+            from ..utils.env import load_api_keys
+            
+            try:
+                load_api_keys()
+            except ValueError as e:
+                self._fail(
+                    f"Error: {e}\n"
+                    "Please ensure your API keys are set in environment variables or .env file"
+                )
         
         # Run command
         if hasattr(args, 'func'):
@@ -436,7 +681,16 @@ def main(argv: Optional[List[str]] = None) -> None:
     Args:
         argv: Command line arguments
     """
-    cli = VibeCLI()
+    # Answer help and version without building the CLI or any parser
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] in ("-h", "--help"):
+        sys.stdout.write(_STATIC_HELP)
+        return
+    if args[0] == "--version":
+        sys.stdout.write(_VERSION_TEXT + "\n")
+        return
+    
+    cli = VibeCLI(hard_exit=True)
     cli.run(argv)
 
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from pathlib import Path
 
 
 class VibeCLI:
@@ -44,7 +43,7 @@ class VibeCLI:
         generate_parser.add_argument("--dry-run", action="store_true", help="Show what would be generated without creating files")
         
         # Status command
-        status_parser = subparsers.add_parser("status", help="Show VIBE status")
+        subparsers.add_parser("status", help="Show VIBE status")
         
         return parser
     
@@ -71,11 +70,54 @@ class VibeCLI:
         print(f"Generating project: {args.name}")
         if args.dry_run:
             print("(Dry run mode - no files will be created)")
-        print("Project generation functionality will be implemented soon!")
-        return 0
+        
+        try:
+            # Import here to avoid circular imports during CLI initialization
+            from ..workflows.generate import GenerationWorkflow, WorkflowOptions
+            
+            # Create a basic project config from the command line arguments
+            config_data = {
+                "project_name": args.name,
+                "project_description": f"Generated project: {args.name}",
+                "architecture_style": "monolith",  # Default value
+                "cloud_provider": "aws"  # Default value
+            }
+            
+            # Create workflow options
+            workflow_options = WorkflowOptions(
+                config_dict=config_data,
+                dry_run=args.dry_run,
+                verbose=args.verbose if hasattr(args, 'verbose') else False
+            )
+            
+            # Initialize and run workflow
+            workflow = GenerationWorkflow()
+            result = workflow.run(workflow_options)
+            
+            if result.success:
+                print("✓ Project generation completed successfully!")
+                if not args.dry_run and result.generation_result:
+                    if result.generation_result.project_path:
+                        print(f"Project created at: {result.generation_result.project_path}")
+                    if result.generation_result.archive_path:
+                        print(f"Archive created at: {result.generation_result.archive_path}")
+                return 0
+            else:
+                print("✗ Project generation failed:")
+                for error in result.errors:
+                    print(f"  - {error}")
+                return 1
+                
+        except Exception as e:
+            print(f"Error during generation: {e}")
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
     
     def handle_status(self, args):
         """Handle the status command."""
+        del args  # status takes no options
         print("VIBE Core Status:")
         print("✓ CLI is working")
         print("✓ Basic functionality available")
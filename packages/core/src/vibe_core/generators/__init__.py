@@ -1,7 +1,26 @@
-"""Generators package for VIBE Core."""
+"""Generators package for VIBE Core.
 
-from .architect import CodeArchitect
-from .merger import PromptMerger, PromptTemplate, MergedPrompt, create_prompt_merger
+Names are re-exported lazily (PEP 562) so that importing the merger does not
+also load the architect and its model clients.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Public name -> (submodule, attribute)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "CodeArchitect": ("architect", "CodeArchitect"),
+    "PromptMerger": ("merger", "PromptMerger"),
+    "PromptTemplate": ("merger", "PromptTemplate"),
+    "MergedPrompt": ("merger", "MergedPrompt"),
+    "create_prompt_merger": ("merger", "create_prompt_merger"),
+}
+
+if TYPE_CHECKING:
+    from .architect import CodeArchitect
+    from .merger import MergedPrompt, PromptMerger, PromptTemplate, create_prompt_merger
 
 __all__ = [
     "CodeArchitect",
@@ -10,3 +29,20 @@ __all__ = [
     "MergedPrompt",
     "create_prompt_merger",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them in the package."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
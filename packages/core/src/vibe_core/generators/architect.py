@@ -2,21 +2,102 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from collections import Counter
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from zipfile import ZipFile
+from typing import Any, Dict, List, Optional, Set, TextIO
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import anthropic
 
+from .. import _json
+from .._fs import relpath_key, walk_files
 from ..models import ProjectConfig, DryRunResponse, GenerationResponse
 from ..parsers.claude import ClaudeResponseParser, FileObject
 from ..utils.context import ContextManager
 from ..utils.env import load_api_keys
 from ..utils.memory import JsonVectorMemory
 
+# Streamed Claude output is written out once this much text is pending or
+# this long has passed since the last write
+_STREAM_FLUSH_CHARS = 16 * 1024
+_STREAM_FLUSH_INTERVAL = 0.12  # seconds
+
+# File count from which write_files writes concurrently, and the cap on
+# writes in flight
+_CONCURRENT_WRITE_THRESHOLD = 16
+_MAX_CONCURRENT_WRITES = 32
+
+# Up to this many files, verify_files checks each path instead of walking
+# the whole output tree
+_VERIFY_STAT_LIMIT = 64
+
+# Fast deflate level for project archives, and directories left out of them
+_ARCHIVE_COMPRESSLEVEL = 1
+_ARCHIVE_SKIP_DIRS = frozenset({"__pycache__"})
+
+
+class _StreamSink:
+    """Batch streamed response text before writing it to a file and stdout.
+    
+    Writing every token chunk costs a write (and a stdout flush) per chunk;
+    batching on size or elapsed time keeps the echo live while issuing far
+    fewer calls.
+    """
+
+    def __init__(self, file: TextIO, echo: bool = True) -> None:
+        """Initialize the sink.
+        
+        Args:
+            file: Open text file receiving the response
+            echo: Also write the response to stdout
+        """
+        self._file = file
+        self._echo = echo
+        self._pending: List[str] = []
+        self._size = 0
+        self._last_write = time.monotonic()
+
+    def add(self, chunk: str) -> bool:
+        """Buffer a chunk.
+        
+        Args:
+            chunk: Text received from the stream
+            
+        Returns:
+            True if the buffered text should now be written
+        """
+        self._pending.append(chunk)
+        self._size += len(chunk)
+        return (
+            self._size >= _STREAM_FLUSH_CHARS
+            or time.monotonic() - self._last_write >= _STREAM_FLUSH_INTERVAL
+        )
+
+    def take(self) -> str:
+        """Return and clear the buffered text."""
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._size = 0
+        self._last_write = time.monotonic()
+        return text
+
+    def write(self, text: str) -> None:
+        """Write text to the file and, if echoing, to stdout."""
+        if not text:
+            return
+        self._file.write(text)
+        if self._echo:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    def flush(self) -> None:
+        """Write any buffered text."""
+        self.write(self.take())
+
 
 class CodeArchitect:
     """AI-powered code architecture generator using Claude.
@@ -42,8 +123,9 @@ class CodeArchitect:
         # Load API keys
         load_api_keys()
         
-        # Initialize Claude client
+        # Initialize Claude client; the async client is created on first use
         self.client = anthropic.Anthropic()
+        self._async_client: Optional[anthropic.AsyncAnthropic] = None
         
         # Initialize parser
         self.parser = ClaudeResponseParser()
@@ -63,8 +145,7 @@ class CodeArchitect:
         Returns:
             Configuration dictionary
         """
-        with open(config_path) as f:
-            return json.load(f)
+        return _json.loads(Path(config_path).read_bytes())
 
     def read_template(self, template_path: Path) -> str:
         """Read template file content.
@@ -93,7 +174,7 @@ class CodeArchitect:
         Raises:
             anthropic.APIError: If API call fails
         """
-        response_text = ""
+        chunks: List[str] = []
         
         try:
             with self.client.messages.stream(
@@ -104,15 +185,72 @@ class CodeArchitect:
             ) as stream:
                 if output_file:
                     with output_file.open("w") as f:
+                        sink = _StreamSink(f)
                         for chunk in stream.text_stream:
-                            print(chunk, end="", flush=True)
-                            f.write(chunk)
-                            response_text += chunk
+                            chunks.append(chunk)
+                            if sink.add(chunk):
+                                sink.flush()
+                        sink.flush()
                 else:
                     for chunk in stream.text_stream:
-                        response_text += chunk
+                        chunks.append(chunk)
+                        
+            return "".join(chunks)
+            
+        except anthropic.APIError as exc:
+            self.logger.error("Anthropic API request failed: %s", exc)
+            raise
+        except Exception as exc:
+            self.logger.error("Unexpected error calling Anthropic: %s", exc)
+            raise
+
+    async def acall_claude(
+        self, system_prompt: str, user_prompt: str, output_file: Optional[Path] = None
+    ) -> str:
+        """Call Claude API with streaming response without blocking the event loop.
+        
+        Async counterpart of :meth:`call_claude` for use from async hosts.
+        File and stdout writes are batched and run in a worker thread.
+        
+        Args:
+            system_prompt: System prompt for Claude
+            user_prompt: User prompt with project details
+            output_file: Optional file to stream response to
+            
+        Returns:
+            Complete response text
+        
+        Raises:
+            anthropic.APIError: If API call fails
+        """
+        if self._async_client is None:
+            self._async_client = anthropic.AsyncAnthropic()
+        
+        chunks: List[str] = []
+        
+        try:
+            async with self._async_client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_prompt}],
+            ) as stream:
+                if output_file:
+                    f = await asyncio.to_thread(output_file.open, "w")
+                    try:
+                        sink = _StreamSink(f)
+                        async for chunk in stream.text_stream:
+                            chunks.append(chunk)
+                            if sink.add(chunk):
+                                await asyncio.to_thread(sink.write, sink.take())
+                        await asyncio.to_thread(sink.write, sink.take())
+                    finally:
+                        await asyncio.to_thread(f.close)
+                else:
+                    async for chunk in stream.text_stream:
+                        chunks.append(chunk)
                         
-            return response_text
+            return "".join(chunks)
             
         except anthropic.APIError as exc:
             self.logger.error("Anthropic API request failed: %s", exc)
@@ -126,25 +264,70 @@ class CodeArchitect:
     ) -> None:
         """Write generated files to output directory.
         
+        Larger batches are written concurrently through
+        :meth:`write_files_async` when no event loop is running in this
+        thread; otherwise files are written one after another.
+        
+        Args:
+            files: List of FileObject instances to write
+            output_dir: Directory to write files to
+            dry_run: If True, only preview without writing
+        """
+        if dry_run or len(files) < _CONCURRENT_WRITE_THRESHOLD:
+            for file_obj in files:
+                file_obj.write_to(output_dir, dry_run)
+            return
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.write_files_async(files, output_dir))
+        else:
+            for file_obj in files:
+                file_obj.write_to(output_dir)
+
+    async def write_files_async(
+        self, files: List[FileObject], output_dir: Path, dry_run: bool = False
+    ) -> None:
+        """Write generated files to output directory concurrently.
+        
+        Uses the parser's writer with at most ``_MAX_CONCURRENT_WRITES``
+        writes in flight.
+        
         Args:
             files: List of FileObject instances to write
             output_dir: Directory to write files to
             dry_run: If True, only preview without writing
         """
-        for file_obj in files:
-            file_obj.write_to(output_dir, dry_run)
+        await self.parser.awrite_files(
+            files, output_dir, dry_run, max_in_flight=_MAX_CONCURRENT_WRITES
+        )
 
     def create_archive(self, project_dir: Path, archive_path: Path) -> None:
         """Create ZIP archive from project directory.
         
+        Files are deflated at a low compression level, which shrinks
+        generated source considerably for little CPU. ``ZipFile.write``
+        streams each file in chunks, so files are never read whole.
+        Bytecode caches are left out.
+        
         Args:
             project_dir: Source directory to archive
             archive_path: Path for the created archive
         """
-        with ZipFile(archive_path, "w") as zf:
-            for path in project_dir.rglob("*"):
-                if path.is_file():
-                    zf.write(path, path.relative_to(project_dir))
+        with ZipFile(
+            archive_path,
+            "w",
+            compression=ZIP_DEFLATED,
+            compresslevel=_ARCHIVE_COMPRESSLEVEL,
+            allowZip64=True,
+        ) as zf:
+            for root, dirs, filenames in os.walk(project_dir):
+                dirs[:] = sorted(d for d in dirs if d not in _ARCHIVE_SKIP_DIRS)
+                root_path = Path(root)
+                for name in sorted(filenames):
+                    path = root_path / name
+                    zf.write(path, path.relative_to(project_dir).as_posix())
         self.logger.info("Archive created at %s", archive_path)
 
     def verify_files(
@@ -152,6 +335,11 @@ class CodeArchitect:
     ) -> bool:
         """Verify that all generated files exist.
         
+        Up to ``_VERIFY_STAT_LIMIT`` files are checked one by one. For more,
+        the output tree is walked once and the expected paths are checked
+        against that set, instead of one ``stat`` per file. Either way only
+        regular files count, following symlinks.
+        
         Args:
             files: List of FileObject instances to verify
             output_dir: Directory where files should exist
@@ -159,11 +347,15 @@ class CodeArchitect:
         Returns:
             True if all files exist, False otherwise
         """
-        missing = []
-        for file_obj in files:
-            file_path = output_dir / file_obj.path
-            if not file_path.exists():
-                missing.append(file_obj.path)
+        if len(files) <= _VERIFY_STAT_LIMIT:
+            missing = [
+                file_obj.path for file_obj in files if not (output_dir / file_obj.path).is_file()
+            ]
+        else:
+            existing = walk_files(output_dir)
+            missing = [
+                file_obj.path for file_obj in files if relpath_key(file_obj.path) not in existing
+            ]
                 
         if missing:
             self.logger.error("Missing files: %s", ", ".join(missing))
@@ -205,15 +397,21 @@ class CodeArchitect:
         # Parse response
         files = self.parser.parse(response_text)
         
-        # Create preview data
-        preview_files = [
-            {"path": f.path, "content": f.content[:100] + "..." if len(f.content) > 100 else f.content}
-            for f in files
-        ]
-        
-        # Check for conflicts
-        file_counts = Counter(f.path for f in files)
-        conflicts = [path for path, count in file_counts.items() if count > 1]
+        # Build previews and find paths generated more than once in one pass;
+        # conflicts keep the order of their first repeat
+        preview_files = []
+        seen: Set[str] = set()
+        duplicates: Dict[str, None] = {}
+        for f in files:
+            content = f.content
+            if len(content) > 100:
+                content = content[:100] + "..."
+            preview_files.append({"path": f.path, "content": content})
+            if f.path in seen:
+                duplicates[f.path] = None
+            else:
+                seen.add(f.path)
+        conflicts = list(duplicates)
         
         return DryRunResponse(
             files=preview_files,
@@ -8,15 +8,66 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+# Template count from which files are loaded on a thread pool
+_PARALLEL_LOAD_THRESHOLD = 8
+_MAX_LOAD_WORKERS = 8
+
+# (prompt dir as given, resolved prompt dir) -> (file signature, templates)
+# shared by all mergers. The spelling is part of the key because the cached
+# templates carry paths built from it. Mergers only ever get copies of the
+# cached templates, so edits made through one merger stay local to it.
+_TEMPLATE_DIR_CACHE: "OrderedDict[Tuple[Path, Path], Tuple[Tuple[Tuple[str, int, int], ...], List[PromptTemplate]]]" = OrderedDict()
+
+# Number of prompt directories kept in _TEMPLATE_DIR_CACHE
+_TEMPLATE_DIR_CACHE_SIZE = 32
+
+# Number of merge results memoized per PromptMerger
+_MERGE_CACHE_SIZE = 128
+
+# Pattern for variable substitution: {{variable.name}}
+_VAR_RE = re.compile(r"{{\s*([\w\.]+)\s*}}")
+
+
+def _variable_spans(content: str) -> List[Tuple[int, int, str]]:
+    """Return the ``(start, end, name)`` of every variable in ``content``."""
+    # A substring search is far cheaper than a regex scan of the whole text
+    if "{{" not in content:
+        return []
+    return [(m.start(), m.end(), m.group(1)) for m in _VAR_RE.finditer(content)]
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode UTF-8 bytes with the newline translation of ``read_text``."""
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces for use in a ``str.format`` template."""
+    return text.replace("{", "{{").replace("}", "}}")
+
 
 class PromptMetadata(BaseModel):
     """Metadata for a prompt template."""
@@ -27,6 +78,43 @@ class PromptMetadata(BaseModel):
     priority: int = Field(0, description="Prompt priority for ordering")
     conditions: Dict[str, Any] = Field(default_factory=dict, description="Conditional requirements")
 
+    # Selection rule derived on first use (see _rule_for); dropped whenever a
+    # field is assigned. Lists and dicts edited in place must be reassigned.
+    _rule: Optional[_SelectionRule] = PrivateAttr(None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping the selection rule derived from the old value."""
+        super().__setattr__(name, value)
+        if name != "_rule":
+            self._rule = None
+
+
+@dataclass(frozen=True, slots=True)
+class _SelectionRule:
+    """Slotted snapshot of the metadata that template selection reads.
+    
+    Selection runs for every template on every merge; reading plain slots
+    (with stacks already lower-cased) avoids pydantic attribute access and
+    per-call list building in that loop.
+    """
+
+    stacks: Optional[FrozenSet[str]]
+    auth_required: bool
+    database_required: bool
+    priority: int
+    conditions: Tuple[Tuple[str, Any], ...]
+
+    @classmethod
+    def from_metadata(cls, metadata: PromptMetadata) -> _SelectionRule:
+        """Build a rule from template metadata."""
+        return cls(
+            stacks=frozenset(s.lower() for s in metadata.stack) if metadata.stack else None,
+            auth_required=metadata.auth_required,
+            database_required=metadata.database_required,
+            priority=metadata.priority,
+            conditions=tuple(metadata.conditions.items()),
+        )
+
 
 class PromptTemplate(BaseModel):
     """A prompt template with metadata and content."""
@@ -35,6 +123,87 @@ class PromptTemplate(BaseModel):
     metadata: PromptMetadata = Field(..., description="Template metadata")
     content: str = Field(..., description="Template content")
     variables: List[str] = Field(default_factory=list, description="Variables found in template")
+    spans: Optional[List[Tuple[int, int, str]]] = Field(
+        None, description="Precomputed (start, end, variable) positions in content"
+    )
+
+    # (format string, variable names by positional index) built on first render
+    # and dropped whenever content or spans are assigned
+    _compiled: Optional[Tuple[str, Tuple[str, ...]]] = PrivateAttr(None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping render state derived from the old content."""
+        super().__setattr__(name, value)
+        if name == "content":
+            # Spans locate variables in the old content
+            super().__setattr__("spans", None)
+            self._compiled = None
+        elif name == "spans":
+            self._compiled = None
+
+    def render(self, flat_config: Dict[str, Any]) -> tuple[str, Dict[str, str]]:
+        """Substitute variables from a flattened config into the content.
+        
+        On first use the content is compiled into a positional ``str.format``
+        template from the precomputed ``spans`` (computed here for templates
+        built without them). Each render then looks values up with
+        ``map``/``zip`` and substitutes them with one C-level format call,
+        so no Python loop runs per variable.
+        
+        Args:
+            flat_config: Flattened configuration (dot-notation keys)
+            
+        Returns:
+            Tuple of (rendered content, variables replaced dict)
+        """
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = self._compile()
+        fmt, names = compiled
+        if not names:
+            # Without variables _compile keeps the content as-is
+            return fmt, {}
+        
+        values = list(map(str, map(flat_config.get, names, repeat(""))))
+        return fmt.format(*values), dict(zip(names, values, strict=True))
+
+    def _compile(self) -> Tuple[str, Tuple[str, ...]]:
+        """Build the format string and variable order for ``render``.
+        
+        Literal braces are escaped and each distinct variable becomes a
+        positional field (``{0}``, ``{1}``...), so dotted names never reach
+        the format parser.
+        """
+        spans = self.spans
+        if spans is None:
+            spans = self.spans = _variable_spans(self.content)
+        
+        content = self.content
+        if not spans:
+            return content, ()
+        indexes: Dict[str, int] = {}
+        parts: List[str] = []
+        cursor = 0
+        for start, end, name in spans:
+            index = indexes.setdefault(name, len(indexes))
+            parts.append(_escape_braces(content[cursor:start]))
+            parts.append(f"{{{index}}}")
+            cursor = end
+        parts.append(_escape_braces(content[cursor:]))
+        return "".join(parts), tuple(indexes)
+
+
+def _rule_for(template: PromptTemplate) -> _SelectionRule:
+    """Return the selection rule of the template's current metadata.
+
+    The rule is cached on the metadata object, so assigning new metadata or
+    a metadata field is seen by the next selection.
+    """
+    metadata = template.metadata
+    rule = metadata._rule
+    if rule is None:
+        rule = metadata._rule = _SelectionRule.from_metadata(metadata)
+    return rule
 
 
 class MergedPrompt(BaseModel):
@@ -60,7 +229,7 @@ class PromptMerger:
     """
 
     # Pattern for variable substitution: {{variable.name}}
-    VARIABLE_PATTERN = re.compile(r"{{\s*([\w\.]+)\s*}}")
+    VARIABLE_PATTERN = _VAR_RE
     
     def __init__(self, prompt_dir: Union[str, Path]) -> None:
         """Initialize the prompt merger.
@@ -70,6 +239,7 @@ class PromptMerger:
         """
         self.prompt_dir = Path(prompt_dir)
         self.templates: List[PromptTemplate] = []
+        self._merge_cache: "OrderedDict[Tuple[Any, ...], MergedPrompt]" = OrderedDict()
         
         if not self.prompt_dir.exists():
             logger.warning(f"Prompt directory does not exist: {self.prompt_dir}")
@@ -77,19 +247,81 @@ class PromptMerger:
             self._load_templates()
 
     def _load_templates(self) -> None:
-        """Load all prompt templates from the prompt directory."""
-        self.templates = []
-        
-        for template_path in sorted(self.prompt_dir.glob("*.md")):
-            try:
-                template = self._load_template(template_path)
-                self.templates.append(template)
-                logger.debug(f"Loaded template: {template_path.name}")
-            except Exception as e:
-                logger.error(f"Failed to load template {template_path}: {e}")
+        """Load all prompt templates from the prompt directory.
         
+        Templates loaded from a directory are shared process-wide: when the
+        directory's ``*.md`` files still have the same names, sizes and
+        mtimes, the previous templates are reused without reading any file.
+        Otherwise larger directories are read on a small thread pool so file
+        reads and libyaml parsing overlap; results keep the sorted path order.
+        """
+        self.clear_cache()
+        signature = self._scan_prompt_dir()
+        key = (self.prompt_dir, self.prompt_dir.resolve())
+        
+        cached = _TEMPLATE_DIR_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _TEMPLATE_DIR_CACHE.move_to_end(key)
+            self.templates = [t.model_copy(deep=True) for t in cached[1]]
+            logger.debug(f"Reusing {len(self.templates)} cached prompt templates")
+            return
+        
+        paths = [self.prompt_dir / name for name, _, _ in signature]
+        
+        if len(paths) < _PARALLEL_LOAD_THRESHOLD:
+            loaded = map(self._try_load_template, paths)
+            self.templates = [t for t in loaded if t is not None]
+        else:
+            workers = min(_MAX_LOAD_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = executor.map(self._try_load_template, paths)
+                self.templates = [t for t in loaded if t is not None]
+        
+        _TEMPLATE_DIR_CACHE[key] = (
+            signature,
+            [t.model_copy(deep=True) for t in self.templates],
+        )
+        _TEMPLATE_DIR_CACHE.move_to_end(key)
+        if len(_TEMPLATE_DIR_CACHE) > _TEMPLATE_DIR_CACHE_SIZE:
+            _TEMPLATE_DIR_CACHE.popitem(last=False)
         logger.info(f"Loaded {len(self.templates)} prompt templates")
 
+    def _scan_prompt_dir(self) -> Tuple[Tuple[str, int, int], ...]:
+        """List the ``*.md`` files of the prompt directory with one scandir.
+        
+        Entries that cannot be stat'ed, such as broken symlinks, are logged
+        and left out without affecting the others.
+        
+        Returns:
+            Sorted ``(name, mtime_ns, size)`` tuples, used both as the file
+            list and as the cache signature
+        """
+        entries = []
+        try:
+            with os.scandir(self.prompt_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".md"):
+                        try:
+                            st = entry.stat()
+                        except OSError as e:
+                            logger.error(f"Failed to load template {entry.path}: {e}")
+                            continue
+                        entries.append((entry.name, st.st_mtime_ns, st.st_size))
+        except (FileNotFoundError, NotADirectoryError):
+            return ()
+        entries.sort()
+        return tuple(entries)
+
+    def _try_load_template(self, template_path: Path) -> Optional[PromptTemplate]:
+        """Load a template, logging and returning None on failure."""
+        try:
+            template = self._load_template(template_path)
+        except Exception as e:
+            logger.error(f"Failed to load template {template_path}: {e}")
+            return None
+        logger.debug(f"Loaded template: {template_path.name}")
+        return template
+
     def _load_template(self, template_path: Path) -> PromptTemplate:
         """Load a single prompt template file.
         
@@ -99,17 +331,19 @@ class PromptMerger:
         Returns:
             Loaded PromptTemplate instance
         """
-        content = template_path.read_text(encoding='utf-8')
-        metadata, template_content = self._parse_frontmatter(content)
+        metadata, template_content = self._parse_frontmatter_bytes(template_path.read_bytes())
         
-        # Extract variables from template content
-        variables = self._extract_variables(template_content)
+        # Locate variables once; merges render from these spans
+        spans = _variable_spans(template_content)
         
-        return PromptTemplate(
+        # Frontmatter is untrusted and still validated; the remaining fields
+        # are built here with the right types, so skip revalidating them
+        return PromptTemplate.model_construct(
             path=template_path,
             metadata=PromptMetadata(**metadata),
             content=template_content,
-            variables=variables
+            variables=sorted({var for _, _, var in spans}),
+            spans=spans
         )
 
     def _parse_frontmatter(self, content: str) -> tuple[Dict[str, Any], str]:
@@ -130,12 +364,48 @@ class PromptMerger:
             
         try:
             _, frontmatter, template_content = parts
-            metadata = yaml.safe_load(frontmatter) or {}
+            metadata = self._load_frontmatter(frontmatter)
             return metadata, template_content.lstrip()
         except yaml.YAMLError as e:
             logger.warning(f"Failed to parse frontmatter: {e}")
             return {}, content
 
+    def _parse_frontmatter_bytes(self, raw: bytes) -> tuple[Dict[str, Any], str]:
+        """Parse YAML frontmatter from raw template file bytes.
+        
+        Equivalent to decoding the file as text and calling
+        :meth:`_parse_frontmatter`, but the delimiters are found on the
+        bytes, so only the frontmatter and body are decoded and the full
+        text is never split into copies. The whole file is decoded only
+        when the frontmatter turns out to be invalid.
+        
+        Args:
+            raw: Template file content as UTF-8 bytes
+            
+        Returns:
+            Tuple of (metadata dict, content without frontmatter)
+        """
+        if not raw.startswith(b"---"):
+            return {}, _decode_text(raw)
+        
+        end = raw.find(b"---", 3)
+        if end == -1:
+            return {}, _decode_text(raw)
+        
+        try:
+            metadata = self._load_frontmatter(_decode_text(raw[3:end]))
+        except yaml.YAMLError as e:
+            logger.warning(f"Failed to parse frontmatter: {e}")
+            return {}, _decode_text(raw)
+        return metadata, _decode_text(raw[end + 3:]).lstrip()
+
+    @staticmethod
+    def _load_frontmatter(frontmatter: str) -> Dict[str, Any]:
+        """Load a frontmatter block, skipping the YAML loader when blank."""
+        if not frontmatter.strip():
+            return {}
+        return yaml.load(frontmatter, Loader=_YamlLoader) or {}
+
     def _extract_variables(self, content: str) -> List[str]:
         """Extract variable names from template content.
         
@@ -145,79 +415,110 @@ class PromptMerger:
         Returns:
             List of unique variable names found
         """
+        if "{{" not in content:
+            return []
         variables = set()
-        for match in self.VARIABLE_PATTERN.finditer(content):
+        for match in _VAR_RE.finditer(content):
             variables.add(match.group(1))
         return sorted(list(variables))
 
-    def select_templates(self, config: Dict[str, Any]) -> List[PromptTemplate]:
+    def select_templates(
+        self,
+        config: Dict[str, Any],
+        flat_config: Optional[Dict[str, Any]] = None
+    ) -> List[PromptTemplate]:
         """Select templates based on configuration and metadata conditions.
         
         Args:
             config: Configuration data
+            flat_config: Already flattened ``config``, if the caller has it
             
         Returns:
             List of selected templates
         """
+        if flat_config is None:
+            flat_config = self._flatten_config(config)
         selected = []
         
         for template in self.templates:
-            if self._should_include_template(template.metadata, config):
+            if self._rule_matches(_rule_for(template), flat_config):
                 selected.append(template)
                 logger.debug(f"Selected template: {template.path.name}")
             else:
                 logger.debug(f"Skipped template: {template.path.name}")
         
         # Sort by priority
-        selected.sort(key=lambda t: t.metadata.priority, reverse=True)
+        selected.sort(key=lambda t: _rule_for(t).priority, reverse=True)
         return selected
 
     def _should_include_template(
         self, 
         metadata: PromptMetadata, 
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        flat_config: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Determine if a template should be included based on metadata and config.
         
         Args:
             metadata: Template metadata
             config: Configuration data
+            flat_config: Already flattened ``config``, if the caller has it
             
         Returns:
             True if template should be included
         """
+        if flat_config is None:
+            flat_config = self._flatten_config(config)
+        
+        return self._rule_matches(_SelectionRule.from_metadata(metadata), flat_config)
+
+    @staticmethod
+    def _rule_matches(rule: _SelectionRule, flat: Dict[str, Any]) -> bool:
+        """Check a selection rule against a flattened config.
+        
+        Looks up the flattened config directly: the first key present wins,
+        as in ``_get_config_value``, without a method call per check.
+        
+        Args:
+            rule: Selection rule of a template
+            flat: Flattened configuration
+            
+        Returns:
+            True if the template should be included
+        """
         # Check stack requirements
-        if metadata.stack:
-            current_stack = self._get_config_value(
-                config, "backend.stack", "backend_stack", default=""
+        if rule.stacks is not None:
+            current_stack = (
+                flat["backend.stack"] if "backend.stack" in flat
+                else flat.get("backend_stack", "")
             ).lower()
             
-            allowed_stacks = [s.lower() for s in metadata.stack]
-            if current_stack and current_stack not in allowed_stacks:
+            if current_stack and current_stack not in rule.stacks:
                 return False
         
         # Check authentication requirements
-        if metadata.auth_required:
-            auth_type = self._get_config_value(
-                config, "auth.type", "auth_type", default="none"
+        if rule.auth_required:
+            auth_type = (
+                flat["auth.type"] if "auth.type" in flat
+                else flat.get("auth_type", "none")
             ).lower()
             
             if auth_type == "none":
                 return False
         
         # Check database requirements
-        if metadata.database_required:
-            db_type = self._get_config_value(
-                config, "database.type", "database_type", default="none"
+        if rule.database_required:
+            db_type = (
+                flat["database.type"] if "database.type" in flat
+                else flat.get("database_type", "none")
             ).lower()
             
             if db_type == "none":
                 return False
         
         # Check custom conditions
-        for condition_key, expected_value in metadata.conditions.items():
-            actual_value = self._get_config_value(config, condition_key)
-            if actual_value != expected_value:
+        for condition_key, expected_value in rule.conditions:
+            if flat.get(condition_key, "") != expected_value:
                 return False
         
         return True
@@ -226,7 +527,8 @@ class PromptMerger:
         self, 
         config: Dict[str, Any], 
         *keys: str, 
-        default: Any = ""
+        default: Any = "",
+        flat_config: Optional[Dict[str, Any]] = None
     ) -> Any:
         """Get configuration value with fallback keys.
         
@@ -234,11 +536,13 @@ class PromptMerger:
             config: Configuration dictionary
             *keys: Possible keys to check (in order)
             default: Default value if no keys found
+            flat_config: Already flattened ``config``, if the caller has it
             
         Returns:
             First found value or default
         """
-        flat_config = self._flatten_config(config)
+        if flat_config is None:
+            flat_config = self._flatten_config(config)
         
         for key in keys:
             if key in flat_config:
@@ -249,6 +553,11 @@ class PromptMerger:
     def _flatten_config(self, data: Any, parent: str = "") -> Dict[str, Any]:
         """Flatten nested configuration using dot notation.
         
+        Walks the structure depth-first with an explicit stack of iterators,
+        writing straight into one result dict, so deep configs need neither
+        recursion nor intermediate dicts. Keys are produced in the same
+        order as a recursive walk.
+        
         Args:
             data: Data to flatten
             parent: Parent key path
@@ -256,67 +565,141 @@ class PromptMerger:
         Returns:
             Flattened dictionary with dot notation keys
         """
-        items = {}
+        items: Dict[str, Any] = {}
+        stack = [(parent, self._config_entries(data))]
         
-        if isinstance(data, dict):
-            for key, value in data.items():
-                path = f"{parent}.{key}" if parent else key
-                if isinstance(value, (dict, list)):
-                    items.update(self._flatten_config(value, path))
-                else:
-                    items[path] = value
-                    if not parent:  # Maintain top-level keys
-                        items.setdefault(key, value)
-        elif isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
-            for idx, value in enumerate(data):
-                path = f"{parent}.{idx}" if parent else str(idx)
+        while stack:
+            prefix, entries = stack[-1]
+            for key, value in entries:
+                path = f"{prefix}.{key}" if prefix else key
                 if isinstance(value, (dict, list)):
-                    items.update(self._flatten_config(value, path))
-                else:
-                    items[path] = value
+                    stack.append((path, self._config_entries(value)))
+                    break
+                items[path] = value
+            else:
+                stack.pop()
         
         return items
 
+    @staticmethod
+    def _config_entries(data: Any) -> Iterator[tuple[Any, Any]]:
+        """Iterate the ``(key, value)`` pairs of a config mapping or sequence.
+        
+        Sequence indexes are yielded as strings; scalars yield nothing.
+        """
+        if isinstance(data, dict):
+            return iter(data.items())
+        if isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
+            return ((str(idx), value) for idx, value in enumerate(data))
+        return iter(())
+
     def replace_variables(
         self, 
         content: str, 
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        flat_config: Optional[Dict[str, Any]] = None
     ) -> tuple[str, Dict[str, str]]:
         """Replace variables in content with configuration values.
         
         Args:
             content: Content with variables to replace
             config: Configuration data
+            flat_config: Already flattened ``config``, if the caller has it
             
         Returns:
             Tuple of (processed content, variables replaced dict)
         """
-        flat_config = self._flatten_config(config)
-        variables_replaced = {}
-        
-        def replace_func(match):
+        if "{{" not in content:
+            return content, {}
+        if flat_config is None:
+            flat_config = self._flatten_config(config)
+        variables_replaced: Dict[str, str] = {}
+        
+        # Lookups are bound once and passed as defaults so the per-match
+        # callback does no attribute or closure lookups
+        def replace_func(
+            match: re.Match,
+            _get=flat_config.get,
+            _record=variables_replaced.__setitem__,
+        ) -> str:
             variable_name = match.group(1)
-            replacement = str(flat_config.get(variable_name, ""))
-            variables_replaced[variable_name] = replacement
+            replacement = _get(variable_name, "")
+            if not isinstance(replacement, str):
+                replacement = str(replacement)
+            _record(variable_name, replacement)
             return replacement
         
-        processed_content = self.VARIABLE_PATTERN.sub(replace_func, content)
+        processed_content = _VAR_RE.sub(replace_func, content)
         return processed_content, variables_replaced
 
     def merge_prompts(self, config: Dict[str, Any]) -> MergedPrompt:
         """Merge selected prompt templates into a single prompt.
         
+        Results are memoized per flattened configuration in a bounded LRU,
+        so a recurring config skips selection and rendering. Call
+        :meth:`clear_cache` after changing ``templates`` directly.
+        
         Args:
             config: Configuration data for template selection and variables
             
         Returns:
             MergedPrompt with combined content and metadata
         """
-        selected_templates = self.select_templates(config)
+        # Flatten once and share it across selection and every template
+        flat_config = self._flatten_config(config)
+        
+        key = self._merge_cache_key(flat_config)
+        if key is not None:
+            cached = self._merge_cache.get(key)
+            if cached is not None:
+                self._merge_cache.move_to_end(key)
+                return cached.model_copy(update={
+                    "templates_used": list(cached.templates_used),
+                    "variables_replaced": dict(cached.variables_replaced),
+                    "config_used": config,
+                })
+        
+        result = self._merge_uncached(config, flat_config)
+        
+        if key is not None:
+            self._merge_cache[key] = result.model_copy(update={
+                "templates_used": list(result.templates_used),
+                "variables_replaced": dict(result.variables_replaced),
+            })
+            if len(self._merge_cache) > _MERGE_CACHE_SIZE:
+                self._merge_cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop memoized merge results, e.g. after templates change."""
+        self._merge_cache.clear()
+
+    @staticmethod
+    def _merge_cache_key(flat_config: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """Build a hashable cache key for a flattened config.
+        
+        Value types are part of the key so that e.g. ``True`` and ``1``,
+        which render differently, do not share an entry.
+        
+        Returns:
+            The key, or None when a value is unhashable
+        """
+        key = tuple((name, type(value), value) for name, value in flat_config.items())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _merge_uncached(
+        self, config: Dict[str, Any], flat_config: Dict[str, Any]
+    ) -> MergedPrompt:
+        """Select and render templates for an already flattened config."""
+        selected_templates = self.select_templates(config, flat_config)
         
         if not selected_templates:
             logger.warning("No templates selected for merging")
-            return MergedPrompt(
+            return MergedPrompt.model_construct(
                 content="",
                 templates_used=[],
                 variables_replaced={},
@@ -328,9 +711,7 @@ class PromptMerger:
         templates_used = []
         
         for template in selected_templates:
-            processed_content, variables_replaced = self.replace_variables(
-                template.content, config
-            )
+            processed_content, variables_replaced = template.render(flat_config)
             
             sections.append(processed_content.strip())
             all_variables_replaced.update(variables_replaced)
@@ -340,7 +721,8 @@ class PromptMerger:
         
         logger.info(f"Merged {len(selected_templates)} templates into prompt")
         
-        return MergedPrompt(
+        # All fields are built here; skip pydantic validation
+        return MergedPrompt.model_construct(
             content=merged_content,
             templates_used=templates_used,
             variables_replaced=all_variables_replaced,
@@ -356,9 +738,16 @@ class PromptMerger:
         Returns:
             Generated plan section content
         """
-        stack = self._get_config_value(config, "backend.stack", "backend_stack", default="FastAPI")
-        auth_type = self._get_config_value(config, "auth.type", "auth_type", default="none")
-        db_type = self._get_config_value(config, "database.type", "database_type", default="none")
+        flat_config = self._flatten_config(config)
+        stack = self._get_config_value(
+            config, "backend.stack", "backend_stack", default="FastAPI", flat_config=flat_config
+        )
+        auth_type = self._get_config_value(
+            config, "auth.type", "auth_type", default="none", flat_config=flat_config
+        )
+        db_type = self._get_config_value(
+            config, "database.type", "database_type", default="none", flat_config=flat_config
+        )
         
         steps = [
             "Create the project structure and configuration",
@@ -400,16 +789,18 @@ class PromptMerger:
             metadata: Optional metadata dictionary
         """
         template_metadata = PromptMetadata(**(metadata or {}))
-        variables = self._extract_variables(content)
+        spans = _variable_spans(content)
         
-        template = PromptTemplate(
+        template = PromptTemplate.model_construct(
             path=Path(name),
             metadata=template_metadata,
             content=content,
-            variables=variables
+            variables=sorted({var for _, _, var in spans}),
+            spans=spans
         )
         
         self.templates.append(template)
+        self.clear_cache()
         logger.debug(f"Added template from string: {name}")
 
     def get_template_info(self) -> List[Dict[str, Any]]:
@@ -2,24 +2,72 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+# Result dataclass type returned by _ModelCompat.model_validate
+_T = TypeVar("_T", bound="_ModelCompat")
+
+# pydantic adapters by result class, built on first model_validate
+_ADAPTERS: Dict[type, TypeAdapter[Any]] = {}
 
 
 class ProjectConfig(BaseModel):
     """Configuration for project generation.
     
     This model represents the configuration sent from the frontend
-    or provided via CLI for project generation.
+    or provided via CLI for project generation. It is the single
+    definition shared by ``vibe_core.models`` and the validators.
     """
     
     project_name: str = Field(..., min_length=1, description="Name of the project to generate")
-    architecture_style: Optional[str] = Field(None, description="Architecture pattern to use")
-    cloud_provider: Optional[str] = Field(None, description="Target cloud provider")
+    project_description: Optional[str] = Field(
+        None, description="Brief description of the project"
+    )
     description: Optional[str] = Field(None, description="Project description")
+    architecture_style: Optional[str] = Field(
+        None, description="Architecture pattern (e.g., 'microservices', 'monolith')"
+    )
+    cloud_provider: Optional[str] = Field(
+        None, description="Target cloud provider (e.g., 'aws', 'azure', 'gcp')"
+    )
+    
+    # Technology stack
+    backend_framework: Optional[str] = Field(
+        None, description="Backend framework (e.g., 'fastapi', 'django', 'express')"
+    )
+    frontend_framework: Optional[str] = Field(
+        None, description="Frontend framework (e.g., 'react', 'vue', 'angular')"
+    )
+    database_type: Optional[str] = Field(
+        None, description="Database type (e.g., 'postgresql', 'mongodb', 'mysql')"
+    )
     technology_stack: Optional[List[str]] = Field(default_factory=list, description="Technologies to use")
-    features: Optional[List[str]] = Field(default_factory=list, description="Features to implement")
+    
+    # Features and requirements
+    features: Optional[Union[Dict[str, Any], List[str]]] = Field(
+        default_factory=dict,
+        description="Feature flags and configurations, or a list of features to implement"
+    )
+    requirements: Optional[List[str]] = Field(
+        default_factory=list, description="List of project requirements"
+    )
+    
+    # Deployment and infrastructure
+    deployment_target: Optional[str] = Field(
+        None, description="Deployment target (e.g., 'docker', 'kubernetes', 'serverless')"
+    )
+    ci_cd_platform: Optional[str] = Field(
+        None, description="CI/CD platform (e.g., 'github-actions', 'gitlab-ci', 'jenkins')"
+    )
+    
+    # Team and project metadata
+    team_size: Optional[int] = Field(None, ge=1, description="Size of the development team")
+    project_timeline: Optional[str] = Field(
+        None, description="Project timeline or deadline"
+    )
     
     # Allow additional fields for flexibility
     model_config = {"extra": "allow"}
@@ -31,25 +79,83 @@ class ProjectConfig(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProjectConfig":
         """Create instance from dictionary."""
-        return cls(**data)
+        return cls.model_validate(data)
 
 
-class GenerationMetadata(BaseModel):
-    """Metadata for a generation session."""
+class _ModelCompat:
+    """pydantic-style ``model_dump``/``model_validate`` for result dataclasses.
     
-    timestamp: str = Field(..., description="Generation timestamp")
-    model_used: str = Field(..., description="AI model used for generation")
-    config_hash: str = Field(..., description="Hash of the configuration")
-    files_generated: int = Field(0, description="Number of files generated")
-    success: bool = Field(True, description="Whether generation was successful")
+    The result types used to be pydantic models; this keeps code written
+    against that API working. Validation is done by pydantic on demand, so
+    plain construction stays cheap.
+    """
     
-    model_config = {"extra": "allow"}
+    __slots__ = ()
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Convert to a dictionary, like ``BaseModel.model_dump``."""
+        data: Dict[str, Any] = asdict(self)  # type: ignore[call-overload]
+        return data
+    
+    @classmethod
+    def model_validate(cls: Type[_T], data: Any) -> _T:
+        """Validate a dictionary or instance, like ``BaseModel.model_validate``.
+        
+        Args:
+            data: Field values, or an instance of the class
+            
+        Returns:
+            Validated instance
+            
+        Raises:
+            ValidationError: If the data does not match the fields
+        """
+        adapter = _ADAPTERS.get(cls)
+        if adapter is None:
+            adapter = _ADAPTERS[cls] = TypeAdapter(cls)
+        result: _T = adapter.validate_python(data)
+        return result
+
 
+@dataclass(slots=True, kw_only=True)
+class GenerationMetadata(_ModelCompat):
+    """Metadata for a generation session.
+    
+    Attributes:
+        timestamp: Generation timestamp
+        model_used: AI model used for generation
+        config_hash: Hash of the configuration
+        files_generated: Number of files generated
+        success: Whether generation was successful
+    """
+    
+    timestamp: str
+    model_used: str
+    config_hash: str
+    files_generated: int = 0
+    success: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
 
-class ValidationResult(BaseModel):
-    """Result of project validation."""
+
+@dataclass(slots=True, kw_only=True)
+class ValidationResult(_ModelCompat):
+    """Result of project validation.
+    
+    Attributes:
+        valid: Whether project is valid
+        errors: Validation errors
+        warnings: Validation warnings
+        score: Validation score between 0.0 and 1.0
+    """
     
-    valid: bool = Field(..., description="Whether project is valid")
-    errors: List[str] = Field(default_factory=list, description="Validation errors")
-    warnings: List[str] = Field(default_factory=list, description="Validation warnings")
-    score: float = Field(0.0, ge=0.0, le=1.0, description="Validation score")
+    valid: bool
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    score: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
@@ -3,6 +3,7 @@
 from .claude_response import (
     ClaudeResponseParser, 
     FileObject, 
+    ParsedFiles,
     parse_claude_response,
     create_parser
 )
@@ -10,6 +11,7 @@ from .claude_response import (
 __all__ = [
     "ClaudeResponseParser",
     "FileObject",
+    "ParsedFiles",
     "parse_claude_response",
     "create_parser",
 ]
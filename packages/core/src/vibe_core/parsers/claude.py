@@ -9,10 +9,24 @@ Fichier: path/to/file
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
+
+from .claude_response import finalize_content
+
+# Prefix of the header line that starts each file
+_FILE_MARKER = "Fichier:"
+
+# File count from which parse_and_write writes on a thread pool, and the
+# default number of writer threads
+_PARALLEL_WRITE_THRESHOLD = 16
+_MAX_WRITE_WORKERS = 8
 
 
 @dataclass
@@ -26,6 +40,11 @@ class FileObject:
 
     path: str
     content: str
+
+    @cached_property
+    def encoded(self) -> bytes:
+        """UTF-8 encoding of ``content``, computed once per file object."""
+        return self.content.encode("utf-8")
     
     def write_to(self, base_dir: Path, dry_run: bool = False) -> Path:
         """Write the file to the specified base directory.
@@ -44,10 +63,14 @@ class FileObject:
             return target
             
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(self.content)
-        logging.info("Wrote %s", target)
+        self._write(target)
         return target
 
+    def _write(self, target: Path) -> None:
+        """Write the content to ``target``, whose directory must exist."""
+        target.write_bytes(self.encoded)
+        logging.info("Wrote %s", target)
+
 
 class ClaudeResponseParser:
     """Parser for Claude API responses containing file generation instructions."""
@@ -68,68 +91,181 @@ class ClaudeResponseParser:
         Returns:
             List of FileObject instances
         """
-        files: List[FileObject] = []
+        return list(self.iter_parse(text.splitlines()))
+    
+    def iter_parse(self, lines: Iterable[str]) -> Iterator[FileObject]:
+        """Parse response lines, yielding each file as soon as it is complete.
+        
+        Accepts any iterable of lines, including an open text file, so large
+        responses can be processed without holding the whole text in memory.
+        Trailing newline characters on the lines are ignored.
+
+        Args:
+            lines: Lines of the raw response text
+
+        Yields:
+            FileObject instances in response order
+        """
         current_path: str | None = None
         buffer: List[str] = []
-        stray: List[str] = []
-
-        for line_no, line in enumerate(text.splitlines(), 1):
-            if line.startswith("Fichier:"):
-                if stray:
-                    self.logger.warning(
-                        "Ignoring %d stray lines before header at line %d", 
-                        len(stray), line_no
-                    )
-                    stray = []
-                    
-                if current_path is not None:
-                    files.append(FileObject(current_path, "\n".join(buffer).rstrip()))
-                    buffer = []
-                    
-                path = line.split(":", 1)[1].strip()
-                if not path:
-                    self.logger.warning("Missing file path at line %d", line_no)
-                    current_path = None
-                else:
-                    current_path = path
-            else:
+        # Lines outside any file are only counted for the warnings
+        stray = 0
+        # Bound once: the loop body runs for every line of the response.
+        # The buffer is cleared rather than replaced so the binding stays valid.
+        add_line = buffer.append
+        marker = _FILE_MARKER
+        marker_len = len(marker)
+
+        for line_no, line in enumerate(lines, 1):
+            line = line.rstrip("\r\n")
+            if not line.startswith(marker):
                 if current_path is None:
-                    stray.append(line)
+                    stray += 1
                 else:
-                    buffer.append(line)
+                    add_line(line)
+                continue
+
+            if stray:
+                self.logger.warning(
+                    "Ignoring %d stray lines before header at line %d", 
+                    stray, line_no
+                )
+                stray = 0
+                
+            if current_path is not None:
+                yield FileObject(current_path, finalize_content(buffer))
+                buffer.clear()
+                
+            path = line[marker_len:].strip()
+            if not path:
+                self.logger.warning("Missing file path at line %d", line_no)
+                current_path = None
+            else:
+                current_path = path
 
         if stray:
-            self.logger.warning("Ignoring %d stray lines at end of response", len(stray))
+            self.logger.warning("Ignoring %d stray lines at end of response", stray)
             
         if current_path is not None:
-            files.append(FileObject(current_path, "\n".join(buffer).rstrip()))
+            yield FileObject(current_path, finalize_content(buffer))
         elif buffer:
             self.logger.warning(
                 "Ignoring %d trailing lines without file header", len(buffer)
             )
-
-        return files
     
     def parse_and_write(
-        self, text: str, output_dir: Path, dry_run: bool = False
+        self,
+        text: str,
+        output_dir: Path,
+        dry_run: bool = False,
+        max_workers: int = _MAX_WRITE_WORKERS,
     ) -> List[FileObject]:
         """Parse response and write files to output directory.
         
+        Each distinct parent directory is created once up front. Batches of
+        ``_PARALLEL_WRITE_THRESHOLD`` files or more are then written on a
+        thread pool so the write syscalls overlap.
+        
         Args:
             text: Raw response text from Claude
             output_dir: Directory to write files to
             dry_run: If True, don't actually write files
+            max_workers: Maximum number of writer threads
             
         Returns:
             List of FileObject instances that were processed
         """
         files = self.parse(text)
         
-        for file_obj in files:
-            file_obj.write_to(output_dir, dry_run)
+        if dry_run:
+            for file_obj in files:
+                file_obj.write_to(output_dir, dry_run)
+            return files
+        
+        targets = _prepare_targets(files, output_dir)
+        if len(targets) < _PARALLEL_WRITE_THRESHOLD or max_workers <= 1:
+            for file_obj, target in targets:
+                file_obj._write(target)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(lambda item: item[0]._write(item[1]), targets):
+                    pass
             
         return files
 
+    async def aparse_and_write(
+        self, text: str, output_dir: Path, dry_run: bool = False
+    ) -> List[FileObject]:
+        """Parse response and write files without blocking the event loop.
+        
+        Args:
+            text: Raw response text from Claude
+            output_dir: Directory to write files to
+            dry_run: If True, don't actually write files
+            
+        Returns:
+            List of FileObject instances that were processed
+        """
+        files = self.parse(text)
+        await self.awrite_files(files, output_dir, dry_run)
+        return files
+
+    async def awrite_files(
+        self,
+        files: List[FileObject],
+        output_dir: Path,
+        dry_run: bool = False,
+        max_in_flight: int = _MAX_WRITE_WORKERS,
+    ) -> None:
+        """Write parsed files without blocking the event loop.
+        
+        Directory creation and the file writes run on worker threads via
+        ``asyncio.to_thread``, with at most ``max_in_flight`` writes in
+        flight. When several files share a path only the last is written.
+        
+        Args:
+            files: Files to write
+            output_dir: Directory to write files to
+            dry_run: If True, don't actually write files
+            max_in_flight: Maximum number of concurrent writes
+        """
+        if dry_run:
+            for file_obj in files:
+                file_obj.write_to(output_dir, dry_run)
+            return
+        
+        targets = await asyncio.to_thread(_prepare_targets, files, output_dir)
+        semaphore = asyncio.Semaphore(max_in_flight)
+        
+        async def write_one(file_obj: FileObject, target: Path) -> None:
+            async with semaphore:
+                await asyncio.to_thread(file_obj._write, target)
+        
+        await asyncio.gather(*(write_one(file_obj, target) for file_obj, target in targets))
+
+
+def _prepare_targets(
+    files: List[FileObject], output_dir: Path
+) -> List[Tuple[FileObject, Path]]:
+    """Resolve target paths and create each distinct parent directory once.
+    
+    When several files share a path only the last is kept, so concurrent
+    writes never race on one file and the result matches a sequential write.
+    
+    Args:
+        files: Files to be written
+        output_dir: Directory the files are written to
+        
+    Returns:
+        ``(file, target path)`` pairs, one per distinct path, in order of
+        first appearance
+    """
+    unique = {os.path.normpath(output_dir / file_obj.path): file_obj for file_obj in files}
+    targets = [(file_obj, Path(target)) for target, file_obj in unique.items()]
+    for parent in dict.fromkeys(target.parent for _, target in targets):
+        parent.mkdir(parents=True, exist_ok=True)
+    return targets
+
 
 # Backward compatibility functions
 def parse_claude_response(text: str) -> List[FileObject]:
@@ -147,6 +283,18 @@ def parse_claude_response(text: str) -> List[FileObject]:
     return parser.parse(text)
 
 
+def parse_claude_response_stream(lines: Iterable[str]) -> Iterator[FileObject]:
+    """Parse Claude response lines lazily into file objects.
+    
+    Args:
+        lines: Lines of the response, e.g. an open text file
+        
+    Yields:
+        FileObject instances in response order
+    """
+    return ClaudeResponseParser().iter_parse(lines)
+
+
 def parse_response_file(source: Path, out_dir: Path, dry_run: bool = False) -> None:
     """Parse source text file and write files to out_dir.
     
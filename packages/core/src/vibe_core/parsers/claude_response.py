@@ -3,24 +3,125 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import os
+import sys
+from dataclasses import dataclass, field
+from itertools import pairwise
 from pathlib import Path
-from typing import List
+from typing import (
+    AnyStr,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 logger = logging.getLogger(__name__)
 
+# Line boundaries recognised by str.splitlines other than "\n"
+_OTHER_LINE_BREAKS = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+_OTHER_LINE_BREAKS_UTF8 = tuple(brk.encode("utf-8") for brk in _OTHER_LINE_BREAKS)
 
-@dataclass
+# Number of response files from which parse_many parses in worker processes
+_PARALLEL_PARSE_THRESHOLD = 4
+
+
+def finalize_content(lines: List[str]) -> str:
+    """Join buffered content lines, dropping trailing whitespace.
+    
+    Equivalent to ``"\\n".join(lines).rstrip()``, but blank lines are
+    trimmed from the list first, so a large body is not copied a second
+    time by ``rstrip``. ``lines`` is modified in place.
+    
+    Args:
+        lines: Content lines of one file
+        
+    Returns:
+        The file content
+    """
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if lines:
+        lines[-1] = lines[-1].rstrip()
+    return "\n".join(lines)
+
+
+def _ensure_dir(path: Path, created: Set[str]) -> None:
+    """Create ``path`` and its parents unless already done in this batch.
+    
+    The cache is supplied by the caller and lives for one batch of writes,
+    so directories removed between batches are created again.
+    
+    Args:
+        path: Directory to create
+        created: Directories already created in this batch
+    """
+    key = os.fspath(path)
+    if key not in created:
+        os.makedirs(key, exist_ok=True)  # noqa: PTH103  # str key, as kept in created
+        created.add(key)
+
+
+def _skip_unmarked(line_count: int) -> None:
+    """Log the lines of a response that contains no file marker at all.
+    
+    Args:
+        line_count: Number of lines in the response
+    """
+    if line_count:
+        logger.warning("Ignoring %d stray lines at end of response", line_count)
+
+
+@dataclass(slots=True)
 class FileObject:
-    """Represents a file parsed from Claude's output."""
+    """Represents a file parsed from Claude's output.
+    
+    The parser only creates file objects for headers with a non-empty path.
+    """
 
     path: str
     content: str
 
-    def __post_init__(self):
-        """Validate the file object."""
-        if not self.path:
-            raise ValueError("File path cannot be empty")
+
+@dataclass(slots=True)
+class ParsedFiles:
+    """Parsed files stored as parallel lists of paths and contents.
+    
+    Avoids one object per file for large responses. Iterating yields
+    ``(path, content)`` pairs; indexing builds a FileObject on demand.
+    """
+
+    paths: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_files(cls, files: Iterable[FileObject]) -> "ParsedFiles":
+        """Build the columns from file objects."""
+        parsed = cls()
+        for file_obj in files:
+            parsed.paths.append(file_obj.path)
+            parsed.contents.append(file_obj.content)
+        return parsed
+
+    def __len__(self) -> int:
+        """Number of parsed files."""
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over ``(path, content)`` pairs."""
+        return zip(self.paths, self.contents, strict=True)
+
+    def __getitem__(self, index: int) -> FileObject:
+        """Build the FileObject at ``index``."""
+        return FileObject(self.paths[index], self.contents[index])
+
+    def to_list(self) -> List[FileObject]:
+        """Return the files as FileObject instances."""
+        return list(map(FileObject, self.paths, self.contents))
 
 
 class ClaudeResponseParser:
@@ -32,7 +133,8 @@ class ClaudeResponseParser:
         Args:
             file_marker: The marker that indicates a new file definition
         """
-        self.file_marker = file_marker
+        # Interned: the marker is compared against every header candidate
+        self.file_marker = sys.intern(file_marker)
 
     def parse(self, text: str) -> List[FileObject]:
         """Parse Claude response text into file objects.
@@ -40,6 +142,139 @@ class ClaudeResponseParser:
         Lines beginning with ``Fichier:`` signal a new file. The following lines
         until the next ``Fichier:`` are considered the file content.
 
+        Header lines are located with ``str.find`` and each file body is
+        sliced out of the text directly, so the work in Python is per file
+        rather than per line. Text with line breaks other than ``\\n``
+        (which ``str.splitlines`` also honours) goes through the
+        line-by-line parser. Responses without any marker, such as error
+        or refusal replies, are rejected after a single substring search.
+
+        Args:
+            text: Raw response text from Claude.
+
+        Returns:
+            List of FileObject instances representing parsed files.
+        """
+        if self.file_marker not in text:
+            _skip_unmarked(len(text.splitlines()))
+            return []
+        if any(brk in text for brk in _OTHER_LINE_BREAKS):
+            return self._parse_lines(text)
+
+        return self._parse_sections(text, self.file_marker, "\n", str).to_list()
+
+    def parse_columns(self, text: str) -> ParsedFiles:
+        """Parse Claude response text into parallel path and content lists.
+        
+        Same files as ``parse``, without creating a FileObject per file.
+
+        Args:
+            text: Raw response text from Claude.
+
+        Returns:
+            ParsedFiles holding the paths and contents in response order.
+        """
+        if self.file_marker not in text:
+            _skip_unmarked(len(text.splitlines()))
+            return ParsedFiles()
+        if any(brk in text for brk in _OTHER_LINE_BREAKS):
+            return ParsedFiles.from_files(self._parse_lines(text))
+
+        return self._parse_sections(text, self.file_marker, "\n", str)
+
+    def parse_bytes(self, data: bytes) -> List[FileObject]:
+        """Parse UTF-8 encoded response text into file objects.
+        
+        Same result as ``parse(data.decode("utf-8"))``, but headers are
+        located in the raw bytes and only file paths and bodies are decoded.
+
+        Args:
+            data: Raw response text from Claude, UTF-8 encoded.
+
+        Returns:
+            List of FileObject instances representing parsed files.
+        """
+        if self.file_marker.encode("utf-8") not in data:
+            _skip_unmarked(len(data.decode("utf-8").splitlines()))
+            return []
+        if any(brk in data for brk in _OTHER_LINE_BREAKS_UTF8):
+            return self._parse_lines(data.decode("utf-8"))
+        return self._parse_sections(
+            data, self.file_marker.encode("utf-8"), b"\n", bytes.decode
+        ).to_list()
+
+    def _parse_sections(
+        self,
+        text: AnyStr,
+        marker: AnyStr,
+        newline: AnyStr,
+        decode: Callable[[AnyStr], str],
+    ) -> ParsedFiles:
+        """Slice file sections out of text whose only line break is ``\\n``.
+        
+        Works on ``str`` and ``bytes`` alike; ``decode`` turns a header line
+        or body into text.
+
+        Args:
+            text: Response text or UTF-8 bytes.
+            marker: File marker, of the same type as ``text``.
+            newline: ``"\\n"`` of the same type as ``text``.
+            decode: Conversion of a slice of ``text`` to ``str``.
+
+        Returns:
+            ParsedFiles holding the parsed paths and contents.
+        """
+        find = text.find
+        
+        # Offsets of all header lines
+        starts: List[int] = [0] if text.startswith(marker) else []
+        needle = newline + marker
+        pos = find(needle)
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find(needle, pos + 1)
+        starts.append(len(text))
+
+        parsed = ParsedFiles()
+        add_path = parsed.paths.append
+        add_content = parsed.contents.append
+        # Lines before the first header are stray
+        stray = len(text[:starts[0]].splitlines())
+
+        for start, next_start in pairwise(starts):
+            if stray:
+                logger.warning(
+                    "Ignoring %d stray lines before header at line %d",
+                    stray, text.count(newline, 0, start) + 1
+                )
+                stray = 0
+
+            line_end = find(newline, start, next_start)
+            if line_end == -1:
+                line_end = next_start
+            path = decode(text[start:line_end]).partition(":")[2].strip()
+            # Body: from after the header's newline up to the next header
+            body = text[line_end + 1:next_start]
+
+            if not path:
+                logger.warning(
+                    "Missing file path at line %d", text.count(newline, 0, start) + 1
+                )
+                stray += len(body.splitlines())
+            else:
+                add_path(path)
+                add_content(decode(body).rstrip())
+
+        if stray:
+            logger.warning("Ignoring %d stray lines at end of response", stray)
+
+        return parsed
+
+    def _parse_lines(self, text: str) -> List[FileObject]:
+        """Parse response text line by line.
+        
+        Used for text containing line breaks other than ``\\n``.
+
         Args:
             text: Raw response text from Claude.
 
@@ -49,38 +284,44 @@ class ClaudeResponseParser:
         files: List[FileObject] = []
         current_path: str | None = None
         buffer: list[str] = []
-        stray: list[str] = []
+        # Lines outside any file are only counted for the warnings
+        stray = 0
+        # Bound once: the loop body runs for every line of the response.
+        # The buffer is cleared rather than replaced so the binding stays valid.
+        marker = self.file_marker
+        add_line = buffer.append
 
         for line_no, line in enumerate(text.splitlines(), 1):
-            if line.startswith(self.file_marker):
-                if stray:
-                    logger.warning(
-                        "Ignoring %d stray lines before header at line %d", 
-                        len(stray), line_no
-                    )
-                    stray = []
-                
-                if current_path is not None:
-                    files.append(FileObject(current_path, "\n".join(buffer).rstrip()))
-                    buffer = []
-                
-                path = line.split(":", 1)[1].strip()
-                if not path:
-                    logger.warning("Missing file path at line %d", line_no)
-                    current_path = None
-                else:
-                    current_path = path
-            else:
+            if not line.startswith(marker):
                 if current_path is None:
-                    stray.append(line)
+                    stray += 1
                 else:
-                    buffer.append(line)
+                    add_line(line)
+                continue
+
+            if stray:
+                logger.warning(
+                    "Ignoring %d stray lines before header at line %d", 
+                    stray, line_no
+                )
+                stray = 0
+            
+            if current_path is not None:
+                files.append(FileObject(current_path, finalize_content(buffer)))
+                buffer.clear()
+            
+            path = line.partition(":")[2].strip()
+            if not path:
+                logger.warning("Missing file path at line %d", line_no)
+                current_path = None
+            else:
+                current_path = path
 
         if stray:
-            logger.warning("Ignoring %d stray lines at end of response", len(stray))
+            logger.warning("Ignoring %d stray lines at end of response", stray)
         
         if current_path is not None:
-            files.append(FileObject(current_path, "\n".join(buffer).rstrip()))
+            files.append(FileObject(current_path, finalize_content(buffer)))
         elif buffer:
             logger.warning("Ignoring %d trailing lines without file header", len(buffer))
 
@@ -105,22 +346,119 @@ class ClaudeResponseParser:
         if not source.exists():
             raise FileNotFoundError(f"Response file not found: {source}")
             
-        text = source.read_text(encoding='utf-8')
-        files = self.parse(text)
+        files = self.parse_bytes(_read_response(source))
+        self.write_files(files, out_dir, dry_run)
+        return files
+
+    def parse_many(
+        self,
+        sources: List[Path],
+        out_dir: Path,
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[Path, List[FileObject]]:
+        """Parse several response files and write their files to one directory.
+        
+        From ``_PARALLEL_PARSE_THRESHOLD`` sources on, the files are parsed
+        in worker processes, since parsing is CPU-bound. Writes happen in
+        this process, in source order, so a later response overwrites files
+        of the same path from an earlier one.
+        
+        Args:
+            sources: Paths to the response files
+            out_dir: Directory to write parsed files
+            dry_run: If True, only log what would be done
+            max_workers: Maximum number of worker processes; defaults to
+                the number of CPUs
+            
+        Returns:
+            Parsed FileObject instances per source, in source order
+            
+        Raises:
+            FileNotFoundError: If a response file does not exist
+        """
+        for source in sources:
+            if not source.exists():
+                raise FileNotFoundError(f"Response file not found: {source}")
+        
+        markers = [self.file_marker] * len(sources)
+        if len(sources) < _PARALLEL_PARSE_THRESHOLD or max_workers == 1:
+            parsed = list(map(_parse_source, sources, markers))
+        else:
+            # Imported here: it loads multiprocessing, which the CLI's parse
+            # path does not need
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(_parse_source, sources, markers))
         
+        results: Dict[Path, List[FileObject]] = {}
+        for source, (paths, contents) in zip(sources, parsed, strict=True):
+            files = list(map(FileObject, paths, contents))
+            self.write_files(files, out_dir, dry_run)
+            results[source] = files
+        return results
+
+    def write_files(
+        self,
+        files: List[FileObject],
+        out_dir: Path,
+        dry_run: bool = False
+    ) -> None:
+        """Write parsed files to an output directory.
+        
+        Args:
+            files: Parsed files to write
+            out_dir: Directory to write parsed files
+            dry_run: If True, only log what would be done
+        """
+        # Each distinct directory is created once per call
+        created: Set[str] = set()
         if not dry_run:
-            out_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(out_dir, created)
             
         for file_obj in files:
             target = out_dir / file_obj.path
             if dry_run:
                 logger.info("[dry-run] Would write %s", target)
             else:
-                target.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_dir(target.parent, created)
                 target.write_text(file_obj.content, encoding='utf-8')
                 logger.info("Wrote %s", target)
-                
-        return files
+
+
+def _read_response(source: Path) -> bytes:
+    """Read a response file with the same newline translation as ``read_text``.
+    
+    Args:
+        source: Path to the response file
+        
+    Returns:
+        File contents with ``\\r\\n`` and ``\\r`` replaced by ``\\n``
+    """
+    data = source.read_bytes()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+def _parse_source(source: Path, file_marker: str) -> Tuple[List[str], List[str]]:
+    """Parse one response file; runs in parse_many's worker processes.
+    
+    Returns plain lists rather than file objects to keep the results cheap
+    to send back to the parent process.
+    
+    Args:
+        source: Path to the response file
+        file_marker: The marker that indicates a new file definition
+        
+    Returns:
+        Paths and contents of the parsed files
+    """
+    parsed = ParsedFiles.from_files(
+        ClaudeResponseParser(file_marker).parse_bytes(_read_response(source))
+    )
+    return parsed.paths, parsed.contents
 
 
 # Convenience function for backwards compatibility
@@ -1,11 +1,42 @@
-"""Utilities package for VIBE Core."""
+"""Utilities package for VIBE Core.
 
-from .context import ContextManager, MemoryContext
-from .env import load_api_keys
-from .executor import TaskExecutor, FileOperation, TaskExecutionResult, create_executor
-from .memory import JsonVectorMemory, MemoryEntry, MemorySearchResult, create_memory
-from .prompt_merger import PromptMerger, create_merger
-from .snapshot import SnapshotManager, MemorySnapshot, dump_memory_snapshot, create_snapshot_manager
+Names are re-exported lazily (PEP 562) so that using one utility, such as
+``load_api_keys``, does not also load the memory store and its OpenAI client.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Public name -> (submodule, attribute)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "ContextManager": ("context", "ContextManager"),
+    "MemoryContext": ("context", "MemoryContext"),
+    "load_api_keys": ("env", "load_api_keys"),
+    "TaskExecutor": ("executor", "TaskExecutor"),
+    "FileOperation": ("executor", "FileOperation"),
+    "TaskExecutionResult": ("executor", "TaskExecutionResult"),
+    "create_executor": ("executor", "create_executor"),
+    "JsonVectorMemory": ("memory", "JsonVectorMemory"),
+    "MemoryEntry": ("memory", "MemoryEntry"),
+    "MemorySearchResult": ("memory", "MemorySearchResult"),
+    "create_memory": ("memory", "create_memory"),
+    "PromptMerger": ("prompt_merger", "PromptMerger"),
+    "create_merger": ("prompt_merger", "create_merger"),
+    "SnapshotManager": ("snapshot", "SnapshotManager"),
+    "MemorySnapshot": ("snapshot", "MemorySnapshot"),
+    "dump_memory_snapshot": ("snapshot", "dump_memory_snapshot"),
+    "create_snapshot_manager": ("snapshot", "create_snapshot_manager"),
+}
+
+if TYPE_CHECKING:
+    from .context import ContextManager, MemoryContext
+    from .env import load_api_keys
+    from .executor import TaskExecutor, FileOperation, TaskExecutionResult, create_executor
+    from .memory import JsonVectorMemory, MemoryEntry, MemorySearchResult, create_memory
+    from .prompt_merger import PromptMerger, create_merger
+    from .snapshot import SnapshotManager, MemorySnapshot, dump_memory_snapshot, create_snapshot_manager
 
 __all__ = [
     "ContextManager",
@@ -26,3 +57,20 @@ __all__ = [
     "dump_memory_snapshot",
     "create_snapshot_manager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them in the package."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+# Maximum number of (query, top_k) results kept by ContextManager
+_SEARCH_CACHE_SIZE = 128
 
 
 class MemoryContext:
@@ -12,17 +16,26 @@ class MemoryContext:
     relevant memory chunks based on a query.
     """
 
-    def __init__(self, memory: Any, query: str, top_k: int = 3) -> None:
+    def __init__(
+        self,
+        memory: Any,
+        query: str,
+        top_k: int = 3,
+        cache: Optional[OrderedDict[Tuple[str, int], List[Any]]] = None,
+    ) -> None:
         """Initialize the memory context.
         
         Args:
             memory: Memory store instance
             query: Search query string
             top_k: Number of top results to return
+            cache: Optional LRU of earlier search results, shared with
+                the owning ContextManager
         """
         self.memory = memory
         self.query = query
         self.top_k = top_k
+        self.cache = cache
         self.results: Iterable[Any] = []
 
     def __enter__(self) -> Iterable[Any]:
@@ -31,7 +44,22 @@ class MemoryContext:
         Returns:
             Search results from memory
         """
-        self.results = self.memory.search(self.query, self.top_k)
+        cache = self.cache
+        if cache is None:
+            self.results = self.memory.search(self.query, self.top_k)
+            return self.results
+
+        key = (self.query, self.top_k)
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+        else:
+            cached = list(self.memory.search(self.query, self.top_k))
+            cache[key] = cached
+            if len(cache) > _SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        # Copy so callers cannot alter the cached entry
+        self.results = list(cached)
         return self.results
 
     def __exit__(self, exc_type, exc, tb) -> bool:
@@ -47,7 +75,9 @@ class ContextManager:
     """Manage context retrieval from memory stores.
     
     Provides utilities for querying memory and hydrating memory
-    from text content.
+    from text content. Search results are cached per ``(query, top_k)``
+    until memory is hydrated through this manager; call ``invalidate()``
+    after adding to the memory store directly.
     """
 
     def __init__(self, memory: Any, top_k: int = 3) -> None:
@@ -59,6 +89,11 @@ class ContextManager:
         """
         self.memory = memory
         self.top_k = top_k
+        self._search_cache: OrderedDict[Tuple[str, int], List[Any]] = OrderedDict()
+
+    def invalidate(self) -> None:
+        """Drop cached search results."""
+        self._search_cache.clear()
 
     def for_query(self, query: str) -> MemoryContext:
         """Create a memory context for a specific query.
@@ -69,7 +104,7 @@ class ContextManager:
         Returns:
             MemoryContext instance for the query
         """
-        return MemoryContext(self.memory, query, self.top_k)
+        return MemoryContext(self.memory, query, self.top_k, cache=self._search_cache)
 
     def hydrate_from_text(
         self, text: str, author: str = "system", context: str = ""
@@ -81,6 +116,13 @@ class ContextManager:
             author: Author of the content
             context: Context category for the content
         """
-        for line in filter(None, (l.strip() for l in text.splitlines())):
-            if line:  # Skip empty lines
+        lines = [line for line in (l.strip() for l in text.splitlines()) if line]
+        if not lines:
+            return
+        if hasattr(self.memory, "add_many"):
+            # Batch the embeddings when the store supports it
+            self.memory.add_many(lines, author=author, context=context)
+        else:
+            for line in lines:
                 self.memory.add(line, author=author, context=context)
+        self.invalidate()
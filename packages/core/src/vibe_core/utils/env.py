@@ -4,21 +4,32 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 from typing import Tuple
 
 from dotenv import load_dotenv
 
+# Keys returned by load_api_keys, in order
+_API_KEY_NAMES = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY")
 
+
+@lru_cache(maxsize=1)
 def load_api_keys() -> Tuple[str, str]:
     """Load API keys from .env into environment and return them.
     
+    The result is cached for the life of the process; call
+    ``load_api_keys.cache_clear()`` after changing the environment.
+    Failed lookups raise and are not cached. ``.env`` is only read when
+    one of the keys is missing from the environment.
+    
     Returns:
         Tuple of (openai_key, anthropic_key)
         
     Raises:
         ValueError: If required API keys are missing
     """
-    load_dotenv()
+    if not all(name in os.environ for name in _API_KEY_NAMES):
+        load_dotenv()
     openai_key = os.getenv("OPENAI_API_KEY")
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
 
@@ -7,14 +7,35 @@ handling, logging, and validation for VIBE code generation workflows.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Union
 
 from pydantic import BaseModel, Field, validator
 
 logger = logging.getLogger(__name__)
 
+# os.open flags for the _write_text modes, named after their open() equivalents
+_WRITE_FLAGS = {
+    "w": os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    "x": os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+    "r+": os.O_WRONLY | os.O_TRUNC,
+}
+
+# Batch size from which execute_operations runs on a thread pool, and the
+# default number of worker threads
+_PARALLEL_OPERATION_THRESHOLD = 16
+_MAX_OPERATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Default number of results kept in the operation history
+_HISTORY_LIMIT = 1024
+
 
 class FileOperation(BaseModel):
     """Represents a file operation to be executed."""
@@ -24,6 +45,7 @@ class FileOperation(BaseModel):
     content: Optional[str] = Field(None, description="File content for create/modify operations")
     source: Optional[str] = Field(None, description="Source path for copy/move operations")
     backup: bool = Field(default=True, description="Whether to create backup before modifying")
+    overwrite: bool = Field(default=True, description="Whether create may replace an existing file")
     
     @validator('operation')
     def validate_operation(cls, v):
@@ -57,16 +79,33 @@ class TaskExecutor:
         ...     print(f"Created file: {result.path}")
     """
 
-    def __init__(self, base_dir: Union[str, Path], create_backups: bool = True) -> None:
+    def __init__(
+        self,
+        base_dir: Union[str, Path],
+        create_backups: bool = True,
+        history_limit: Optional[int] = _HISTORY_LIMIT,
+        track_history: bool = True,
+    ) -> None:
         """Initialize the task executor.
         
         Args:
             base_dir: Base directory for all file operations
             create_backups: Whether to create backups before modifying files
+            history_limit: Maximum number of results kept in the operation
+                history, oldest dropped first; None keeps all of them
+            track_history: Whether to record successful operations at all
         """
         self.base_dir = Path(base_dir).resolve()
+        # String form used to build paths with os.path in the file operations
+        self._base = os.fspath(self.base_dir)
+        self._backup_dir = os.path.join(self._base, ".vibe_backups")
+        # Directories already created or seen by this executor
+        self._ensured_dirs: Set[str] = set()
+        # Guards _ensured_dirs when operations run on worker threads
+        self._dirs_lock = threading.Lock()
         self.create_backups = create_backups
-        self.executed_operations: List[TaskExecutionResult] = []
+        self.track_history = track_history
+        self.executed_operations: Deque[TaskExecutionResult] = deque(maxlen=history_limit)
         
         # Ensure base directory exists
         self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -81,6 +120,56 @@ class TaskExecutor:
         Returns:
             Result of the operation execution
         """
+        result = self._run_operation(operation)
+        # Store successful results for potential rollback
+        if result.success and self.track_history:
+            self.executed_operations.append(result)
+        return result
+
+    def execute_operations(
+        self,
+        operations: List[FileOperation],
+        max_workers: int = _MAX_OPERATION_WORKERS,
+    ) -> List[TaskExecutionResult]:
+        """Execute a batch of file operations.
+        
+        Batches of ``_PARALLEL_OPERATION_THRESHOLD`` operations or more run
+        on a thread pool, since file I/O releases the GIL. Operations that
+        share a path, as target or copy/move source, form one group that a
+        single worker runs in input order, so chains such as create then
+        modify or move behave as in a sequential run. Results and history
+        entries keep the input order.
+        
+        Args:
+            operations: File operations to execute
+            max_workers: Maximum number of worker threads
+            
+        Returns:
+            Results of the operations, in input order
+        """
+        if len(operations) < _PARALLEL_OPERATION_THRESHOLD or max_workers <= 1:
+            return [self.execute_operation(operation) for operation in operations]
+        
+        groups = _group_by_path(operations)
+        if len(groups) == 1:
+            return [self.execute_operation(operation) for operation in operations]
+        
+        results: List[Optional[TaskExecutionResult]] = [None] * len(operations)
+        
+        def run_group(indexes: List[int]) -> None:
+            for index in indexes:
+                results[index] = self._run_operation(operations[index])
+        
+        workers = min(max_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(run_group, groups):
+                pass
+        if self.track_history:
+            self.executed_operations.extend(result for result in results if result.success)
+        return results
+
+    def _run_operation(self, operation: FileOperation) -> TaskExecutionResult:
+        """Execute a file operation without recording it in the history."""
         try:
             if operation.operation == "create":
                 return self._create_file(operation)
@@ -110,10 +199,6 @@ class TaskExecutor:
                 message=f"Operation failed: {str(e)}",
                 error=str(e)
             )
-        finally:
-            # Store the result for potential rollback
-            if hasattr(self, '_last_result'):
-                self.executed_operations.append(self._last_result)
 
     def create_file(self, path: str, content: str, overwrite: bool = False) -> TaskExecutionResult:
         """Create a new file with the specified content.
@@ -129,20 +214,9 @@ class TaskExecutor:
         operation = FileOperation(
             operation="create",
             path=path,
-            content=content
+            content=content,
+            overwrite=overwrite
         )
-        
-        # Check if file already exists
-        target_path = self.base_dir / path
-        if target_path.exists() and not overwrite:
-            return TaskExecutionResult(
-                success=False,
-                operation="create",
-                path=path,
-                message=f"File already exists: {path}",
-                error="File exists and overwrite=False"
-            )
-            
         return self.execute_operation(operation)
 
     def modify_file(
@@ -222,13 +296,28 @@ class TaskExecutor:
 
     def _create_file(self, operation: FileOperation) -> TaskExecutionResult:
         """Internal method to create a file."""
-        target_path = self.base_dir / operation.path
+        target_path = os.path.join(self._base, operation.path)
         
-        # Create parent directories if they don't exist
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write content to file
-        target_path.write_text(operation.content or "", encoding='utf-8')
+        # Write content to file, creating parent directories if needed.
+        # Without overwrite the file is opened exclusively, which fails if
+        # it exists without a separate existence check.
+        try:
+            self._in_dir(
+                target_path,
+                partial(
+                    self._write_text,
+                    content=operation.content or "",
+                    mode="w" if operation.overwrite else "x",
+                ),
+            )
+        except FileExistsError:
+            return TaskExecutionResult(
+                success=False,
+                operation="create",
+                path=operation.path,
+                message=f"File already exists: {operation.path}",
+                error="File exists and overwrite=False"
+            )
         
         result = TaskExecutionResult(
             success=True,
@@ -237,15 +326,32 @@ class TaskExecutor:
             message=f"Created file: {operation.path}"
         )
         
-        self._last_result = result
         logger.info(f"Created file: {target_path}")
         return result
 
     def _modify_file(self, operation: FileOperation) -> TaskExecutionResult:
         """Internal method to modify a file."""
-        target_path = self.base_dir / operation.path
+        target_path = os.path.join(self._base, operation.path)
+        
+        # A symlink is kept and the file it points to is modified instead
+        real_path = target_path
+        if os.path.islink(target_path):
+            real_path = os.path.realpath(target_path)
         
-        if not target_path.exists():
+        # The backup link or the "r+" open fails if the file is missing;
+        # ENOENT for any other path is a genuine error
+        try:
+            backup_path = None
+            if operation.backup:
+                backup_path = self._create_backup(target_path)
+                # The backup may share the file's inode, so the new content
+                # goes to a new file renamed over the target
+                self._replace_text(real_path, operation.content or "")
+            else:
+                self._write_text(target_path, operation.content or "", mode="r+")
+        except FileNotFoundError as e:
+            if e.filename not in (target_path, real_path):
+                raise
             return TaskExecutionResult(
                 success=False,
                 operation="modify",
@@ -254,30 +360,22 @@ class TaskExecutor:
                 error="File does not exist"
             )
         
-        backup_path = None
-        if operation.backup:
-            backup_path = self._create_backup(target_path)
-        
-        # Write new content
-        target_path.write_text(operation.content or "", encoding='utf-8')
-        
         result = TaskExecutionResult(
             success=True,
             operation="modify",
             path=operation.path,
             message=f"Modified file: {operation.path}",
-            backup_path=str(backup_path) if backup_path else None
+            backup_path=backup_path
         )
         
-        self._last_result = result
         logger.info(f"Modified file: {target_path}")
         return result
 
     def _delete_file(self, operation: FileOperation) -> TaskExecutionResult:
         """Internal method to delete a file."""
-        target_path = self.base_dir / operation.path
+        target_path = os.path.join(self._base, operation.path)
         
-        if not target_path.exists():
+        if not os.path.exists(target_path):
             return TaskExecutionResult(
                 success=False,
                 operation="delete",
@@ -291,26 +389,25 @@ class TaskExecutor:
             backup_path = self._create_backup(target_path)
         
         # Delete the file
-        target_path.unlink()
+        os.unlink(target_path)
         
         result = TaskExecutionResult(
             success=True,
             operation="delete",
             path=operation.path,
             message=f"Deleted file: {operation.path}",
-            backup_path=str(backup_path) if backup_path else None
+            backup_path=backup_path
         )
         
-        self._last_result = result
         logger.info(f"Deleted file: {target_path}")
         return result
 
     def _copy_file(self, operation: FileOperation) -> TaskExecutionResult:
         """Internal method to copy a file."""
-        source_path = self.base_dir / operation.source
-        target_path = self.base_dir / operation.path
+        source_path = os.path.join(self._base, operation.source)
+        target_path = os.path.join(self._base, operation.path)
         
-        if not source_path.exists():
+        if not os.path.exists(source_path):
             return TaskExecutionResult(
                 success=False,
                 operation="copy",
@@ -319,11 +416,8 @@ class TaskExecutor:
                 error="Source file does not exist"
             )
         
-        # Create parent directories if they don't exist
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Copy the file
-        shutil.copy2(source_path, target_path)
+        # Copy the file, creating parent directories if needed
+        self._in_dir(target_path, partial(shutil.copy2, source_path))
         
         result = TaskExecutionResult(
             success=True,
@@ -332,16 +426,15 @@ class TaskExecutor:
             message=f"Copied {operation.source} to {operation.path}"
         )
         
-        self._last_result = result
         logger.info(f"Copied {source_path} to {target_path}")
         return result
 
     def _move_file(self, operation: FileOperation) -> TaskExecutionResult:
         """Internal method to move a file."""
-        source_path = self.base_dir / operation.source
-        target_path = self.base_dir / operation.path
+        source_path = os.path.join(self._base, operation.source)
+        target_path = os.path.join(self._base, operation.path)
         
-        if not source_path.exists():
+        if not os.path.exists(source_path):
             return TaskExecutionResult(
                 success=False,
                 operation="move",
@@ -350,11 +443,8 @@ class TaskExecutor:
                 error="Source file does not exist"
             )
         
-        # Create parent directories if they don't exist
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Move the file
-        shutil.move(str(source_path), str(target_path))
+        # Move the file, creating parent directories if needed
+        self._in_dir(target_path, partial(shutil.move, source_path))
         
         result = TaskExecutionResult(
             success=True,
@@ -363,34 +453,143 @@ class TaskExecutor:
             message=f"Moved {operation.source} to {operation.path}"
         )
         
-        self._last_result = result
         logger.info(f"Moved {source_path} to {target_path}")
         return result
 
-    def _create_backup(self, file_path: Path) -> Path:
-        """Create a backup of the specified file."""
-        backup_dir = self.base_dir / ".vibe_backups"
-        backup_dir.mkdir(exist_ok=True)
+    def _ensure_dir(self, directory: str) -> None:
+        """Create ``directory`` and its parents once per executor.
+        
+        Args:
+            directory: Absolute directory path
+        """
+        if directory in self._ensured_dirs:
+            return
+        with self._dirs_lock:
+            if directory not in self._ensured_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._ensured_dirs.add(directory)
+
+    def _in_dir(self, target_path: str, action: Callable[[str], Any]) -> None:
+        """Run ``action(target_path)`` once the parent directory exists.
         
+        The directory is only created the first time it is seen. If it has
+        been removed since, the action fails with FileNotFoundError; the
+        directory is then created again and the action retried.
+        
+        Args:
+            target_path: Absolute path of the file being written
+            action: Operation writing ``target_path``
+        """
+        directory = os.path.dirname(target_path)
+        cached = directory in self._ensured_dirs
+        self._ensure_dir(directory)
+        try:
+            action(target_path)
+        except FileNotFoundError:
+            if not cached or os.path.isdir(directory):
+                raise
+            with self._dirs_lock:
+                self._ensured_dirs.discard(directory)
+            self._ensure_dir(directory)
+            action(target_path)
+
+    @staticmethod
+    def _write_text(target_path: str, content: str, mode: str = "w") -> None:
+        """Write ``content`` to ``target_path`` as UTF-8.
+        
+        The encoded content is written straight to a file descriptor,
+        normally in a single write call, without a text-mode file object.
+        
+        Args:
+            target_path: File to write
+            content: New file content
+            mode: "w" to create or replace, "x" to create only, or "r+" to
+                replace an existing file only
+        """
+        fd = os.open(target_path, _WRITE_FLAGS[mode], 0o666)
+        try:
+            _write_all(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _replace_text(target_path: str, content: str) -> None:
+        """Replace the existing ``target_path`` with a new file holding ``content``.
+        
+        The content is written to a temporary file in the same directory,
+        given the target's permissions and renamed over it, so the old inode
+        is left untouched. Ownership and extended attributes are not carried
+        over. ``target_path`` must not be a symlink.
+        
+        Args:
+            target_path: Existing file to replace
+            content: New file content
+        """
+        directory, name = os.path.split(target_path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            try:
+                shutil.copymode(target_path, tmp_path)
+                _write_all(fd, content.encode("utf-8"))
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _create_backup(self, file_path: str) -> str:
+        """Create a backup of the specified file.
+        
+        The backup is a hard link to the file, so no data is copied. It is
+        copied instead where hard links are not supported, e.g. across
+        filesystems.
+        
+        Args:
+            file_path: Absolute path of the file to back up
+            
+        Returns:
+            Path of the backup file
+        """
         # Create backup filename with timestamp
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{file_path.name}.{timestamp}.backup"
-        backup_path = backup_dir / backup_name
+        backup_name = f"{os.path.basename(file_path)}.{timestamp}.backup"
+        backup_path = os.path.join(self._backup_dir, backup_name)
+        
+        # A symlink is backed up as the file it points to
+        source = file_path
+        if os.path.islink(file_path):
+            source = os.path.realpath(file_path)
         
-        # Copy the file to backup location
-        shutil.copy2(file_path, backup_path)
+        # Through _in_dir so a backup dir removed since it was cached is
+        # created again
+        self._in_dir(backup_path, partial(self._link_backup, source))
         logger.debug(f"Created backup: {backup_path}")
         
         return backup_path
 
+    @staticmethod
+    def _link_backup(file_path: str, backup_path: str) -> None:
+        """Hard-link ``file_path`` at ``backup_path``, copying if links fail."""
+        try:
+            os.link(file_path, backup_path)
+        except FileExistsError:
+            # Same file backed up twice within a second: keep the latest state
+            os.unlink(backup_path)
+            os.link(file_path, backup_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copy2(file_path, backup_path)
+
     def get_operation_history(self) -> List[TaskExecutionResult]:
         """Get the history of executed operations.
         
         Returns:
-            List of execution results in chronological order
+            List of the most recent execution results in chronological order
         """
-        return self.executed_operations.copy()
+        return list(self.executed_operations)
 
     def clear_history(self) -> None:
         """Clear the operation history."""
@@ -413,15 +612,66 @@ class TaskExecutor:
             return False
 
 
+def _group_by_path(operations: List[FileOperation]) -> List[List[int]]:
+    """Group the indexes of operations that touch a common path.
+    
+    Operations are linked through their target and source paths, so a
+    group holds every operation that may depend on another one in it.
+    
+    Args:
+        operations: File operations of a batch
+        
+    Returns:
+        Index groups, each in input order
+    """
+    parent = list(range(len(operations)))
+    
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+    
+    # Normalized path -> index of the first operation touching it
+    owners: Dict[str, int] = {}
+    for index, operation in enumerate(operations):
+        for path in (operation.path, operation.source):
+            if path is None:
+                continue
+            owner = owners.setdefault(os.path.normpath(path), index)
+            if owner != index:
+                parent[find(index)] = find(owner)
+    
+    groups: Dict[int, List[int]] = {}
+    for index in range(len(operations)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to the open file descriptor ``fd``."""
+    view = memoryview(data)
+    # os.write may accept only part of a large buffer
+    while view:
+        view = view[os.write(fd, view):]
+
+
 # Backward compatibility function
-def create_executor(base_dir: Union[str, Path], create_backups: bool = True) -> TaskExecutor:
+def create_executor(
+    base_dir: Union[str, Path],
+    create_backups: bool = True,
+    history_limit: Optional[int] = _HISTORY_LIMIT,
+    track_history: bool = True,
+) -> TaskExecutor:
     """Create a TaskExecutor instance.
     
     Args:
         base_dir: Base directory for file operations
         create_backups: Whether to create backups by default
+        history_limit: Maximum number of results kept in the operation history
+        track_history: Whether to record successful operations at all
         
     Returns:
         Configured TaskExecutor instance
     """
-    return TaskExecutor(base_dir, create_backups)
+    return TaskExecutor(base_dir, create_backups, history_limit, track_history)
@@ -1,22 +1,89 @@
 """Persistent memory using a JSON vector store.
 
 This module provides a persistent memory system that stores text chunks with
-embeddings in a JSON file, enabling semantic search and context management.
+embeddings in a JSON-lines file, enabling semantic search and context management.
 """
 
 from __future__ import annotations
 
-import json
+import base64
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 from openai import OpenAI
 from pydantic import BaseModel, Field
 
+from .. import _json
+
 logger = logging.getLogger(__name__)
 
+# Number of texts sent per embeddings request by add_many
+_EMBED_BATCH_SIZE = 128
+
+# Number of embeddings kept by each store's in-process LRU cache
+_EMBED_CACHE_SIZE = 1024
+
+# On-disk embedding encoding: base64 of little-endian float16 values
+_EMBEDDING_DTYPE = np.dtype("<f2")
+
+
+def _encode_embedding(embedding: List[float]) -> str:
+    """Encode an embedding as base64 float16 for the memory file.
+    
+    Args:
+        embedding: Embedding values
+        
+    Returns:
+        ASCII text of the packed float16 values
+    """
+    packed = np.asarray(embedding, dtype=_EMBEDDING_DTYPE).tobytes()
+    return base64.b64encode(packed).decode("ascii")
+
+
+def _decode_embedding(encoded: str) -> np.ndarray:
+    """Decode an embedding written by ``_encode_embedding``.
+    
+    Args:
+        encoded: Base64 text of packed float16 values
+        
+    Returns:
+        The embedding as a float32 array
+    """
+    return np.frombuffer(base64.b64decode(encoded), dtype=_EMBEDDING_DTYPE).astype(np.float32)
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Select the indices of the ``top_k`` highest scores.
+    
+    The k-th largest score is found by partial partition, in linear time,
+    and only the selected indices are sorted. Ties keep index order, as a
+    stable full sort would.
+    
+    Args:
+        scores: One score per entry
+        top_k: Number of indices to return
+        
+    Returns:
+        Indices of the best scores, highest first
+    """
+    n = len(scores)
+    k = min(top_k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        selected = np.concatenate((above, ties))
+    else:
+        selected = np.arange(n)
+    return selected[np.lexsort((selected, -scores[selected]))]
+
 
 class MemoryEntry(BaseModel):
     """A single memory entry with text, embedding, and metadata."""
@@ -37,7 +104,7 @@ class MemorySearchResult(BaseModel):
 
 
 class JsonVectorMemory:
-    """Store text chunks with embeddings in a JSON file.
+    """Store text chunks with embeddings in a JSON-lines file.
     
     This class provides persistent storage for text chunks with vector embeddings,
     enabling semantic search capabilities for context-aware AI interactions.
@@ -59,7 +126,7 @@ class JsonVectorMemory:
         """Initialize the memory store.
         
         Args:
-            path: Path to the JSON file for persistent storage
+            path: Path to the JSON-lines file for persistent storage
             model: OpenAI embedding model to use
             client: Optional OpenAI client instance
         """
@@ -67,6 +134,18 @@ class JsonVectorMemory:
         self.model = model
         self.client = client or OpenAI()
         self.entries: List[MemoryEntry] = []
+        # Embedding matrix (N, D) and row norms used by search; synced with
+        # self.entries on demand by _search_matrix. The entries the rows were
+        # built from detect any change to the list other than appends.
+        self._matrix: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+        self._matrix_rows: Optional[List[MemoryEntry]] = None
+        # LRU of embeddings by (model, text digest); values are float64 so
+        # they convert back to the exact floats returned by the API
+        self._embed_cache: OrderedDict[Tuple[str, bytes], np.ndarray] = OrderedDict()
+        # Set when the file is not a clean JSON-lines log (older JSON array
+        # format or unreadable); the next write then rewrites it in full
+        self._rewrite_on_write = False
         
         # Create parent directories if they don't exist
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -75,10 +154,17 @@ class JsonVectorMemory:
             self._load()
 
     def _load(self) -> None:
-        """Load memory entries from the JSON file."""
+        """Load memory entries from the JSON-lines file.
+        
+        Files in the older single-array JSON format are read as well and
+        converted on the next write. Embeddings are read from float16
+        ``embedding_f16`` fields, or from plain ``embedding`` lists.
+        """
         try:
-            data = json.loads(self.path.read_text(encoding='utf-8'))
+            data = self._read_records()
             self.entries = []
+            # Decoded float16 rows, reused as the search matrix when complete
+            rows: List[np.ndarray] = []
             
             for item in data:
                 # Handle legacy format
@@ -89,10 +175,18 @@ class JsonVectorMemory:
                         "timestamp": item.get("timestamp", datetime.now(timezone.utc).isoformat())
                     }
                 
-                # Create MemoryEntry from the data
-                entry = MemoryEntry(
+                if "embedding" in item:
+                    embedding = item["embedding"]
+                else:
+                    row = _decode_embedding(item["embedding_f16"])
+                    rows.append(row)
+                    embedding = row.tolist()
+                
+                # Records are written by _save/_append, so fields are not
+                # re-validated
+                entry = MemoryEntry.model_construct(
                     text=item["text"],
-                    embedding=item["embedding"],
+                    embedding=embedding,
                     metadata=item.get("metadata", {}),
                     timestamp=item.get("timestamp", datetime.now(timezone.utc).isoformat()),
                     author=item.get("author", "system"),
@@ -100,37 +194,137 @@ class JsonVectorMemory:
                 )
                 self.entries.append(entry)
                 
+            if rows and len(rows) == len(self.entries) and len({len(r) for r in rows}) == 1:
+                matrix = np.vstack(rows)
+                self._matrix, self._norms = matrix, np.linalg.norm(matrix, axis=1)
+                self._matrix_rows = list(self.entries)
+                
             logger.info(f"Loaded {len(self.entries)} memory entries from {self.path}")
             
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (KeyError, TypeError, ValueError) as e:
             logger.warning(f"Failed to parse memory store {self.path}: {e}. Starting fresh.")
             self.entries = []
+            self._rewrite_on_write = True
+
+    def _read_records(self) -> List[Dict[str, Any]]:
+        """Read the raw entry records from the memory file.
+        
+        Lines that do not decode, such as a line cut short by an interrupted
+        append, are skipped with a warning.
+        
+        Returns:
+            Entry records in file order
+        """
+        raw = self.path.read_bytes()
+        if raw.lstrip().startswith(b"["):
+            self._rewrite_on_write = True
+            records: List[Dict[str, Any]] = _json.loads(raw)
+            return records
+        
+        records = []
+        for line_no, line in enumerate(raw.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(_json.loads(line))
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable line {line_no} of {self.path}: {e}")
+                self._rewrite_on_write = True
+        return records
+
+    @staticmethod
+    def _encode_entry(entry: MemoryEntry) -> bytes:
+        """Serialize an entry as one JSON line.
+        
+        Args:
+            entry: Memory entry
+            
+        Returns:
+            UTF-8 JSON record terminated by a newline
+        """
+        record = {
+            "text": entry.text,
+            "embedding_f16": _encode_embedding(entry.embedding),
+            "metadata": entry.metadata,
+            "timestamp": entry.timestamp,
+            "author": entry.author,
+            "context": entry.context
+        }
+        return _json.dumps_bytes(record) + b"\n"
 
     def _save(self) -> None:
-        """Save memory entries to the JSON file."""
+        """Rewrite the memory file with all current entries.
+        
+        Embeddings are stored as base64 float16, a quarter of the size of
+        the decimal lists and ample precision for cosine ranking.
+        """
         try:
-            # Convert to dictionary format for JSON serialization
-            data = []
-            for entry in self.entries:
-                data.append({
-                    "text": entry.text,
-                    "embedding": entry.embedding,
-                    "metadata": entry.metadata,
-                    "timestamp": entry.timestamp,
-                    "author": entry.author,
-                    "context": entry.context
-                })
-            
-            self.path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            self.path.write_bytes(b"".join(map(self._encode_entry, self.entries)))
+            self._rewrite_on_write = False
             logger.debug(f"Saved {len(self.entries)} memory entries to {self.path}")
             
         except Exception as e:
             logger.error(f"Failed to save memory store to {self.path}: {e}")
             raise
 
+    def _append(self, entries: List[MemoryEntry]) -> None:
+        """Append new entries to the memory file, one JSON line each.
+        
+        The rest of the file is left untouched, so the cost of an add does
+        not grow with the size of the store.
+        
+        Args:
+            entries: Entries just added to ``self.entries``
+        """
+        if self._rewrite_on_write:
+            self._save()
+            return
+        
+        try:
+            with self.path.open("ab") as f:
+                f.write(b"".join(map(self._encode_entry, entries)))
+            logger.debug(f"Appended {len(entries)} memory entries to {self.path}")
+            
+        except Exception as e:
+            logger.error(f"Failed to append to memory store {self.path}: {e}")
+            raise
+
+    def compact(self) -> None:
+        """Rewrite the memory file from the entries currently in memory."""
+        self._save()
+
+    def _embed_key(self, text: str) -> Tuple[str, bytes]:
+        """Build the embedding cache key for ``text`` under the current model."""
+        return self.model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cached_embedding(self, key: Tuple[str, bytes]) -> Optional[List[float]]:
+        """Return a cached embedding and mark it as recently used.
+        
+        Args:
+            key: Key from ``_embed_key``
+            
+        Returns:
+            A fresh list of the embedding values, or None on a miss
+        """
+        cached = self._embed_cache.get(key)
+        if cached is None:
+            return None
+        self._embed_cache.move_to_end(key)
+        values: List[float] = cached.tolist()
+        return values
+
+    def _cache_embedding(self, key: Tuple[str, bytes], embedding: List[float]) -> None:
+        """Store an embedding, evicting the least recently used one if full."""
+        self._embed_cache[key] = np.array(embedding, dtype=np.float64)
+        if len(self._embed_cache) > _EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+
     def _embed(self, text: str) -> List[float]:
         """Generate embedding for the given text.
         
+        Embeddings are deterministic for a given model, so results are kept
+        in a per-store LRU and repeated texts or queries skip the request.
+        
         Args:
             text: Text to embed
             
@@ -140,16 +334,66 @@ class JsonVectorMemory:
         Raises:
             Exception: If embedding generation fails
         """
+        key = self._embed_key(text)
+        cached = self._cached_embedding(key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.client.embeddings.create(
                 model=self.model,
                 input=text
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
             
         except Exception as e:
             logger.error(f"Failed to generate embedding for text: {e}")
             raise
+        
+        self._cache_embedding(key, embedding)
+        return embedding
+
+    def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts in one request.
+        
+        Only texts missing from the embedding cache are sent.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding per text, in input order
+            
+        Raises:
+            Exception: If embedding generation fails
+        """
+        keys = [self._embed_key(text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [self._cached_embedding(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            try:
+                response = self.client.embeddings.create(
+                    model=self.model,
+                    input=[texts[i] for i in missing]
+                )
+                fetched = [item.embedding for item in response.data]
+                
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings for {len(missing)} texts: {e}")
+                raise
+            
+            if len(fetched) != len(missing):
+                raise ValueError(
+                    f"Expected {len(missing)} embeddings, got {len(fetched)}"
+                )
+            for i, embedding in zip(missing, fetched, strict=True):
+                embeddings[i] = embedding
+                self._cache_embedding(keys[i], embedding)
+        
+        filled = [embedding for embedding in embeddings if embedding is not None]
+        # Every cache miss was filled from the response above
+        assert len(filled) == len(texts)
+        return filled
 
     def add(
         self,
@@ -184,7 +428,7 @@ class JsonVectorMemory:
             )
             
             self.entries.append(entry)
-            self._save()
+            self._append([entry])
             
             logger.debug(f"Added memory entry with {len(embedding)} dimensions")
             
@@ -192,6 +436,62 @@ class JsonVectorMemory:
             logger.error(f"Failed to add memory entry: {e}")
             raise
 
+    def add_many(
+        self,
+        texts: Iterable[Union[str, Tuple[str, Dict[str, Any]]]],
+        author: str = "system",
+        context: str = "",
+        metadata: Optional[Dict[str, Any]] = None,
+        batch_size: int = _EMBED_BATCH_SIZE,
+    ) -> None:
+        """Add several texts to memory, embedding them in batches.
+        
+        Texts are embedded ``batch_size`` at a time and the new entries are
+        appended to the file in one write at the end. Nothing is added if
+        any batch fails.
+        
+        Args:
+            texts: The text contents to store, each either a string or a
+                ``(text, metadata)`` pair whose metadata is merged over
+                ``metadata``
+            author: Author of the memory entries
+            context: Context information for the entries
+            metadata: Additional metadata stored with each entry
+            batch_size: Maximum number of texts per embeddings request
+        """
+        pairs: List[Tuple[str, Optional[Dict[str, Any]]]] = [
+            (item, None) if isinstance(item, str) else item for item in texts
+        ]
+        items = [(text, extra) for text, extra in pairs if text.strip()]
+        if not items:
+            logger.warning("Attempted to add empty text to memory")
+            return
+        contents = [text for text, _ in items]
+            
+        try:
+            embeddings: List[List[float]] = []
+            for start in range(0, len(contents), batch_size):
+                embeddings.extend(self._embed_many(contents[start:start + batch_size]))
+            
+            new_entries = [
+                MemoryEntry(
+                    text=text,
+                    embedding=embedding,
+                    metadata={**(metadata or {}), **(extra or {})},
+                    author=author,
+                    context=context
+                )
+                for (text, extra), embedding in zip(items, embeddings, strict=True)
+            ]
+            self.entries.extend(new_entries)
+            self._append(new_entries)
+            
+            logger.debug(f"Added {len(new_entries)} memory entries")
+            
+        except Exception as e:
+            logger.error(f"Failed to add memory entries: {e}")
+            raise
+
     def search(self, query: str, top_k: int = 3) -> List[MemorySearchResult]:
         """Search for similar entries using semantic similarity.
         
@@ -212,16 +512,15 @@ class JsonVectorMemory:
             
         try:
             query_embedding = self._embed(query)
-            scored_results = []
+            scores = self._scores(query_embedding)
             
-            for entry in self.entries:
-                score = self._cosine_similarity(query_embedding, entry.embedding)
-                result = MemorySearchResult(entry=entry, score=score)
-                scored_results.append(result)
-            
-            # Sort by score (highest first) and return top_k
-            scored_results.sort(key=lambda x: x.score, reverse=True)
-            results = scored_results[:top_k]
+            order = _top_k_indices(scores, top_k)
+            # Entries are already validated; skip re-validating them
+            entries = self.entries
+            results = [
+                MemorySearchResult.model_construct(entry=entries[i], score=float(scores[i]))
+                for i in order
+            ]
             
             logger.debug(f"Found {len(results)} memory results for query: {query[:50]}...")
             return results
@@ -230,6 +529,87 @@ class JsonVectorMemory:
             logger.error(f"Failed to search memory: {e}")
             return []
 
+    def _search_matrix(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return the float32 embedding matrix and its row norms.
+        
+        Entries appended since the last call are added to the matrix. Any
+        other change to ``self.entries``, such as a replaced, removed or
+        reordered entry, rebuilds it. Only fields edited on an entry in place
+        are not noticed.
+        
+        Returns:
+            ``(matrix, norms)``, or None if the stored embeddings do not all
+            have the same dimension
+        """
+        entries = self.entries
+        matrix, norms, covered = self._matrix, self._norms, self._matrix_rows
+        # List comparison checks identity first, so this runs at C speed;
+        # a replaced entry only passes when it is equal, embedding included
+        if (
+            matrix is not None
+            and norms is not None
+            and covered is not None
+            and entries[:len(covered)] == covered
+        ):
+            if len(covered) == len(entries):
+                return matrix, norms
+        else:
+            matrix = norms = None
+        
+        start = 0 if matrix is None else len(matrix)
+        try:
+            rows = np.array([e.embedding for e in entries[start:]], dtype=np.float32)
+        except ValueError:  # embeddings of different dimensions
+            rows = None
+        if rows is None or rows.ndim != 2 or (
+            matrix is not None and rows.shape[1] != matrix.shape[1]
+        ):
+            self._reset_matrix()
+            return None
+        
+        row_norms = np.linalg.norm(rows, axis=1)
+        if matrix is not None and norms is not None:
+            rows = np.vstack((matrix, rows))
+            row_norms = np.concatenate((norms, row_norms))
+        self._matrix, self._norms, self._matrix_rows = rows, row_norms, list(entries)
+        return rows, row_norms
+
+    def _reset_matrix(self) -> None:
+        """Drop the search matrix so the next search rebuilds it."""
+        self._matrix = self._norms = self._matrix_rows = None
+
+    def _scores(self, query_embedding: List[float]) -> np.ndarray:
+        """Compute the cosine similarity of the query with every entry.
+        
+        Args:
+            query_embedding: Embedding of the query
+            
+        Returns:
+            One score per entry, in entry order
+        """
+        arrays = self._search_matrix()
+        if arrays is None:
+            return np.array(
+                [self._cosine_similarity(query_embedding, e.embedding) for e in self.entries]
+            )
+        
+        matrix, norms = arrays
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (matrix.shape[1],):
+            logger.warning("Vector dimension mismatch in similarity calculation")
+            return np.zeros(len(matrix), dtype=np.float32)
+        
+        denominator = norms * np.linalg.norm(query)
+        scores = np.divide(
+            matrix @ query,
+            denominator,
+            out=np.zeros(len(matrix), dtype=np.float32),
+            where=denominator != 0,
+        )
+        # float32 rounding can leave identical vectors just above 1
+        clipped: np.ndarray = np.clip(scores, -1.0, 1.0, out=scores)
+        return clipped
+
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors.
         
@@ -256,6 +636,7 @@ class JsonVectorMemory:
     def clear(self) -> None:
         """Clear all memory entries."""
         self.entries.clear()
+        self._reset_matrix()
         self._save()
         logger.info("Cleared all memory entries")
 
@@ -9,11 +9,17 @@ from typing import Dict, Any, List, Optional
 
 from pydantic import BaseModel, Field
 
+from .._debug import DEBUG
 from ..models.project import ProjectConfig
 from ..generators.merger import PromptMerger
 
 logger = logging.getLogger(__name__)
 
+# Scores are clamped by _calculate_quality_score; the bounds are only
+# re-checked on construction in debug mode (None leaves a side unchecked)
+_SCORE_MIN: Optional[float] = 0.0 if DEBUG else None
+_SCORE_MAX: Optional[float] = 1.0 if DEBUG else None
+
 
 class PromptValidationResult(BaseModel):
     """Result of prompt validation."""
@@ -22,7 +28,9 @@ class PromptValidationResult(BaseModel):
     issues: List[str] = Field(default_factory=list, description="Validation issues")
     suggestions: List[str] = Field(default_factory=list, description="Improvement suggestions")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Prompt metadata")
-    quality_score: float = Field(0.0, ge=0.0, le=1.0, description="Quality score")
+    quality_score: float = Field(
+        0.0, description="Quality score", ge=_SCORE_MIN, le=_SCORE_MAX
+    )
 
 
 class PromptValidator:
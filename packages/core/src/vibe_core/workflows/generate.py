@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from .. import _json
 from ..models import ProjectConfig
 from ..utils import PromptMerger, create_merger
 from ..generators.architect import CodeArchitect
@@ -20,14 +21,15 @@ logger = logging.getLogger(__name__)
 class WorkflowOptions(BaseModel):
     """Options for generation workflow."""
     
-    config_file: Optional[Path] = Field(None, description="Path to configuration file")
-    config_json: Optional[str] = Field(None, description="Configuration as JSON string")
+    config_file: Optional[Path] = Field(default=None, description="Path to configuration file")
+    config_json: Optional[str] = Field(default=None, description="Configuration as JSON string")
+    config_dict: Optional[Dict[str, Any]] = Field(default=None, description="Configuration as a dictionary")
     dry_run: bool = Field(default=False, description="Run in dry-run mode")
     json_output: bool = Field(default=False, description="Return JSON output")
     verbose: bool = Field(default=False, description="Enable verbose logging")
     model: str = Field(default="claude-3-5-sonnet-20241022", description="Claude model to use")
-    output_dir: Optional[Path] = Field(None, description="Output directory")
-    templates_dir: Optional[Path] = Field(None, description="Templates directory")
+    output_dir: Optional[Path] = Field(default=None, description="Output directory")
+    templates_dir: Optional[Path] = Field(default=None, description="Templates directory")
 
 
 class WorkflowResult(BaseModel):
@@ -189,24 +191,23 @@ class GenerationWorkflow:
         Raises:
             ValueError: If no configuration provided or invalid
         """
-        if not options.config_file and not options.config_json:
-            raise ValueError("Either config_file or config_json must be provided")
-        
-        if options.config_file:
+        if options.config_dict is not None:
+            config_data = options.config_dict
+        elif options.config_file:
             if not options.config_file.exists():
                 raise ValueError(f"Configuration file not found: {options.config_file}")
             
             try:
-                config_data = json.loads(options.config_file.read_text())
+                config_data = _json.loads(options.config_file.read_bytes())
             except Exception as e:
                 raise ValueError(f"Failed to parse configuration file: {e}")
         elif options.config_json:
             try:
-                config_data = json.loads(options.config_json)
+                config_data = _json.loads(options.config_json)
             except Exception as e:
                 raise ValueError(f"Failed to parse configuration JSON: {e}")
         else:
-            raise ValueError("Either config_file or config_json must be provided")
+            raise ValueError("One of config_dict, config_file or config_json must be provided")
         
         return ProjectConfig.from_dict(config_data)
     
@@ -123,6 +123,22 @@ class TestWorkflowIntegration:
         assert config.project_name == "test-project"
         assert config.project_description == "Test description"
     
+    @patch('vibe_core.generators.architect.load_api_keys')
+    def test_workflow_config_loading_from_dict(self, mock_load_api_keys):
+        """Test workflow configuration loading from a dictionary."""
+        mock_load_api_keys.return_value = ("fake-openai-key", "fake-anthropic-key")
+        
+        options = WorkflowOptions(
+            config_dict={"project_name": "dict-project"},
+            dry_run=True
+        )
+        
+        workflow = GenerationWorkflow()
+        config = workflow._load_config(options)
+        
+        assert isinstance(config, ProjectConfig)
+        assert config.project_name == "dict-project"
+    
     @patch('vibe_core.utils.env.load_api_keys')
     def test_workflow_prompt_merging(self, mock_load_api_keys):
         """Test workflow prompt merging."""
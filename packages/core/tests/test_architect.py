@@ -0,0 +1,171 @@
+"""Tests for the Claude-backed code architect."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from vibe_core.generators.architect import CodeArchitect
+
+
+@pytest.fixture
+def architect(monkeypatch):
+    """Code architect with a mocked, streaming Anthropic client."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic")
+    architect = CodeArchitect()
+    architect.client = MagicMock()
+    stream = architect.client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = ["Hello", " world", "!"]
+    return architect
+
+
+def test_call_claude_returns_full_text(architect):
+    """Test that the streamed chunks are joined into the response."""
+    assert architect.call_claude("system", "user") == "Hello world!"
+
+
+def test_call_claude_streams_to_file(architect, temp_dir, capsys):
+    """Test that the response is written to the output file and echoed."""
+    output_file = temp_dir / "response.txt"
+
+    result = architect.call_claude("system", "user", output_file)
+
+    assert result == "Hello world!"
+    assert output_file.read_text() == "Hello world!"
+    assert capsys.readouterr().out == "Hello world!"
+
+
+def test_acall_claude_streams_to_file(architect, temp_dir):
+    """Test the async variant against a mocked async stream."""
+
+    async def text_stream():
+        for chunk in ["Hello", " world", "!"]:
+            yield chunk
+
+    stream = MagicMock()
+    stream.text_stream = text_stream()
+    context = MagicMock()
+    context.__aenter__.return_value = stream
+    context.__aexit__.return_value = False
+    architect._async_client = MagicMock()
+    architect._async_client.messages.stream.return_value = context
+    output_file = temp_dir / "response.txt"
+
+    result = asyncio.run(architect.acall_claude("system", "user", output_file))
+
+    assert result == "Hello world!"
+    assert output_file.read_text() == "Hello world!"
+
+
+def test_create_archive_deflates_and_skips_caches(architect, temp_dir):
+    """Test that archives are compressed and leave out bytecode caches."""
+    from zipfile import ZIP_DEFLATED, ZipFile
+
+    project = temp_dir / "project"
+    (project / "pkg" / "__pycache__").mkdir(parents=True)
+    (project / "pkg" / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"\0")
+    (project / "pkg" / "mod.py").write_text("x = 1\n" * 100)
+    (project / "README.md").write_text("# Demo\n")
+
+    archive = temp_dir / "project.zip"
+    architect.create_archive(project, archive)
+
+    with ZipFile(archive) as zf:
+        assert zf.namelist() == ["README.md", "pkg/mod.py"]
+        info = zf.getinfo("pkg/mod.py")
+        assert info.compress_type == ZIP_DEFLATED
+        assert info.compress_size < info.file_size
+        assert zf.read("pkg/mod.py") == b"x = 1\n" * 100
+
+
+def test_write_files_concurrently(architect, temp_dir):
+    """Test that large batches are written through the async writer."""
+    from vibe_core.parsers.claude import FileObject
+
+    files = [FileObject(f"pkg{i % 3}/mod{i}.py", f"VALUE = {i}\n") for i in range(40)]
+
+    architect.write_files(files, temp_dir / "out")
+
+    for i in range(40):
+        assert (temp_dir / "out" / f"pkg{i % 3}" / f"mod{i}.py").read_text() == f"VALUE = {i}\n"
+
+
+def test_write_files_async_repeated_path(architect, temp_dir):
+    """Test that the last file for a repeated path is the one written."""
+    from vibe_core.parsers.claude import FileObject
+
+    files = [FileObject(f"f{i % 2}.py", f"V = {i}\n") for i in range(20)]
+    files.append(FileObject("./f0.py", "last\n"))
+
+    asyncio.run(architect.write_files_async(files, temp_dir / "out"))
+
+    assert (temp_dir / "out" / "f0.py").read_text() == "last\n"
+    assert (temp_dir / "out" / "f1.py").read_text() == "V = 19\n"
+
+
+def test_write_files_async_dry_run(architect, temp_dir):
+    """Test that the async writer leaves the disk untouched in dry-run mode."""
+    from vibe_core.parsers.claude import FileObject
+
+    asyncio.run(
+        architect.write_files_async([FileObject("a/b.py", "x")], temp_dir / "out", dry_run=True)
+    )
+
+    assert not (temp_dir / "out").exists()
+
+
+def test_load_config(architect, temp_dir):
+    """Test that configuration files are decoded from UTF-8 JSON."""
+    path = temp_dir / "config.json"
+    path.write_text('{"project_name": "démo", "features": ["api"]}', encoding="utf-8")
+
+    assert architect.load_config(path) == {"project_name": "démo", "features": ["api"]}
+
+
+def test_verify_files(architect, temp_dir):
+    """Test that verification finds nested files and reports missing ones."""
+    from vibe_core.parsers.claude import FileObject
+
+    files = [FileObject("README.md", "# Demo"), FileObject("src/app/main.py", "x = 1")]
+    architect.write_files(files, temp_dir)
+
+    assert architect.verify_files(files, temp_dir)
+    assert architect.verify_files([FileObject("./src/app/main.py", "")], temp_dir)
+    assert not architect.verify_files(files + [FileObject("src/missing.py", "")], temp_dir)
+    assert not architect.verify_files(files, temp_dir / "absent")
+
+
+@pytest.mark.parametrize("count", [3, 100])
+def test_verify_files_through_symlinked_dir(architect, temp_dir, count):
+    """Test that files under a symlinked dir verify for small and large inputs."""
+    from vibe_core.parsers.claude import FileObject
+
+    real = temp_dir / "real"
+    out_dir = temp_dir / "out"
+    out_dir.mkdir()
+    files = [FileObject(f"f{i}.py", "") for i in range(count)]
+    architect.write_files(files, real)
+    (out_dir / "linked").symlink_to(real)
+    (real / "loop").symlink_to(out_dir)
+    linked = [FileObject(f"linked/f{i}.py", "") for i in range(count)]
+
+    assert architect.verify_files(linked, out_dir)
+    assert not architect.verify_files(linked + [FileObject("linked/nope.py", "")], out_dir)
+
+
+def test_generate_dry_run_conflicts(architect):
+    """Test that repeated paths are reported once and previews are truncated."""
+    from vibe_core.models import ProjectConfig
+
+    stream = architect.client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = [
+        "Fichier: a.py\n" + "x" * 150 + "\n\n",
+        "Fichier: b.py\nb\n\nFichier: a.py\na\n\nFichier: b.py\nb\n\nFichier: a.py\na\n",
+    ]
+
+    result = architect.generate_dry_run(ProjectConfig(project_name="demo"), "prompt", "system")
+
+    assert result.conflicts == ["a.py", "b.py"]
+    assert result.files[0]["content"] == "x" * 100 + "..."
+    assert result.files[1] == {"path": "b.py", "content": "b"}
@@ -0,0 +1,59 @@
+"""Tests for the streaming Claude parser used by the architect."""
+
+import asyncio
+
+from vibe_core.parsers.claude import ClaudeResponseParser
+
+
+def _response(count):
+    """Build a response with ``count`` files spread over a few directories."""
+    return "".join(f"Fichier: pkg{i % 3}/mod{i}.py\nVALUE = {i}\n\n" for i in range(count))
+
+
+def test_parse_and_write_many_files(temp_dir):
+    """Test that large batches are written on the thread pool."""
+    files = ClaudeResponseParser().parse_and_write(_response(40), temp_dir)
+
+    assert len(files) == 40
+    for i in range(40):
+        assert (temp_dir / f"pkg{i % 3}" / f"mod{i}.py").read_text() == f"VALUE = {i}"
+
+
+def test_parse_and_write_dry_run(temp_dir):
+    """Test that dry runs create nothing."""
+    files = ClaudeResponseParser().parse_and_write(_response(20), temp_dir / "out", dry_run=True)
+
+    assert len(files) == 20
+    assert not (temp_dir / "out").exists()
+
+
+def test_aparse_and_write(temp_dir):
+    """Test that the async variant writes every file."""
+    files = asyncio.run(ClaudeResponseParser().aparse_and_write(_response(5), temp_dir))
+
+    assert [f.path for f in files] == [f"pkg{i % 3}/mod{i}.py" for i in range(5)]
+    assert (temp_dir / "pkg1" / "mod4.py").read_text() == "VALUE = 4"
+
+
+def test_repeated_path_keeps_last_file(temp_dir):
+    """Test that parallel and async writes keep the last file per path."""
+    text = "".join(f"Fichier: pkg/mod{i % 4}.py\nVALUE = {i}\n" for i in range(40))
+    parser = ClaudeResponseParser()
+
+    parser.parse_and_write(text, temp_dir / "sync")
+    asyncio.run(parser.aparse_and_write(text, temp_dir / "async"))
+
+    for out in ("sync", "async"):
+        for i in range(4):
+            assert (temp_dir / out / "pkg" / f"mod{i}.py").read_text() == f"VALUE = {36 + i}"
+
+
+def test_write_to_uses_utf8_bytes(temp_dir):
+    """Test that files are written as UTF-8 without newline translation."""
+    from vibe_core.parsers.claude import FileObject
+
+    file_obj = FileObject("docs/é.md", "# Café\nligne\n")
+    target = file_obj.write_to(temp_dir)
+
+    assert target.read_bytes() == b"# Caf\xc3\xa9\nligne\n"
+    assert file_obj.encoded is file_obj.encoded
@@ -0,0 +1,131 @@
+"""Tests for the Claude response parser."""
+
+import logging
+
+import pytest
+
+from vibe_core.parsers.claude_response import ClaudeResponseParser
+
+RESPONSES = [
+    "",
+    "no headers\nat all\n",
+    "intro\n\nFichier: a.py\nx = 1\n\n\nFichier: b/c.txt\n  indented\ntrailing   \n",
+    "Fichier:\norphan line\nFichier: ok.py\nbody",
+    "Fichier: last.py",
+    "Fichier: crlf.py\r\nline\r\n",
+    " Fichier: not-a-header\nFichier: a.py\n",
+    "Fichier: caf\u00e9.md\n# Caf\u00e9\u00a0\n",
+    "Fichier: \u2028split.py\nbody\n",
+    "I cannot help with that.\r\nSorry\u2028again",
+]
+
+
+@pytest.mark.parametrize("text", RESPONSES)
+def test_parse_matches_line_parser(text, caplog):
+    """Test that the slicing parser matches the line-by-line parser, warnings included."""
+    parser = ClaudeResponseParser()
+
+    with caplog.at_level(logging.WARNING):
+        fast = [(f.path, f.content) for f in parser.parse(text)]
+        fast_logs = [r.getMessage() for r in caplog.records]
+        caplog.clear()
+        slow = [(f.path, f.content) for f in parser._parse_lines(text)]
+        slow_logs = [r.getMessage() for r in caplog.records]
+
+    assert fast == slow
+    assert fast_logs == slow_logs
+
+
+@pytest.mark.parametrize("text", RESPONSES)
+def test_parse_bytes_matches_parse(text, caplog):
+    """Test that parsing UTF-8 bytes gives the same files and warnings."""
+    parser = ClaudeResponseParser()
+
+    with caplog.at_level(logging.WARNING):
+        expected = [(f.path, f.content) for f in parser.parse(text)]
+        expected_logs = [r.getMessage() for r in caplog.records]
+        caplog.clear()
+        actual = [(f.path, f.content) for f in parser.parse_bytes(text.encode("utf-8"))]
+        actual_logs = [r.getMessage() for r in caplog.records]
+
+    assert actual == expected
+    assert actual_logs == expected_logs
+
+
+def test_parse_response_file_translates_newlines(temp_dir):
+    """Test that response files are read with universal newlines."""
+    source = temp_dir / "response.txt"
+    source.write_bytes(b"Fichier: a.py\r\nx = 1\r\nFichier: b.py\ry\r")
+
+    files = ClaudeResponseParser().parse_response_file(source, temp_dir / "out", dry_run=True)
+
+    assert [(f.path, f.content) for f in files] == [("a.py", "x = 1"), ("b.py", "y")]
+
+
+def test_parse_file_contents():
+    """Test that file bodies are split on headers and right-stripped."""
+    files = ClaudeResponseParser().parse(RESPONSES[2])
+
+    assert [(f.path, f.content) for f in files] == [
+        ("a.py", "x = 1"),
+        ("b/c.txt", "  indented\ntrailing"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [[], [""], ["a", "", "  "], ["  a  ", "b\t", "", "\t"], ["x", "", "y  "]],
+)
+def test_finalize_content_matches_join_rstrip(lines):
+    """Test that trimming before joining gives the same content."""
+    from vibe_core.parsers.claude_response import finalize_content
+
+    assert finalize_content(list(lines)) == "\n".join(lines).rstrip()
+
+
+def test_write_files_creates_each_directory_once(temp_dir):
+    """Test that shared parent directories are created once per call."""
+    from unittest.mock import patch
+
+    import vibe_core.parsers.claude_response as claude_response
+
+    files = ClaudeResponseParser().parse(
+        "Fichier: src/a.py\na\nFichier: src/b.py\nb\nFichier: tests/c.py\nc\n"
+    )
+    out_dir = temp_dir / "out"
+    with patch.object(claude_response.os, "makedirs", wraps=claude_response.os.makedirs) as mock_makedirs:
+        ClaudeResponseParser().write_files(files, out_dir)
+
+    assert mock_makedirs.call_count == 3
+    assert (out_dir / "src" / "b.py").read_text(encoding="utf-8") == "b"
+
+
+@pytest.mark.parametrize("text", RESPONSES)
+def test_parse_columns_matches_parse(text):
+    """Test that the column layout holds the same files as parse."""
+    parser = ClaudeResponseParser()
+    files = parser.parse(text)
+    columns = parser.parse_columns(text)
+
+    assert len(columns) == len(files)
+    assert list(columns) == [(f.path, f.content) for f in files]
+    assert columns.to_list() == files
+    if files:
+        assert columns[-1] == files[-1]
+
+
+@pytest.mark.parametrize("count", [2, 6])
+def test_parse_many(temp_dir, count):
+    """Test that several responses are parsed, in processes for larger batches."""
+    sources = []
+    for i in range(count):
+        source = temp_dir / f"response{i}.txt"
+        source.write_text(f"Fichier: mod{i}.py\nVALUE = {i}\n", encoding="utf-8")
+        sources.append(source)
+
+    results = ClaudeResponseParser().parse_many(sources, temp_dir / "out")
+
+    assert list(results) == sources
+    for i, source in enumerate(sources):
+        assert [(f.path, f.content) for f in results[source]] == [(f"mod{i}.py", f"VALUE = {i}")]
+        assert (temp_dir / "out" / f"mod{i}.py").read_text(encoding="utf-8") == f"VALUE = {i}"
@@ -0,0 +1,141 @@
+"""Tests for the VIBE Core CLI commands."""
+
+import pytest
+
+from vibe_core.cli.main import VibeCLI, main
+
+
+@pytest.fixture
+def response_file(temp_dir, sample_claude_response):
+    """Claude response file written to a temporary directory."""
+    path = temp_dir / "response.txt"
+    path.write_text(sample_claude_response)
+    return path
+
+
+@pytest.fixture
+def project_dir(temp_dir, response_file):
+    """Project directory generated from the sample response."""
+    out_dir = temp_dir / "project"
+    assert VibeCLI().run(["parse", str(response_file), str(out_dir)]) == 0
+    return out_dir
+
+
+def test_verify_matching_project(response_file, project_dir, capsys):
+    """Test that an unmodified generated project verifies."""
+    result = VibeCLI().run(["verify", str(response_file), str(project_dir)])
+
+    assert result == 0
+    assert "all files match" in capsys.readouterr().out
+
+
+def test_verify_ignores_surrounding_whitespace(response_file, project_dir):
+    """Test that leading and trailing whitespace is not a mismatch."""
+    main_py = project_dir / "main.py"
+    main_py.write_text("\n\n" + main_py.read_text() + "\n   \n")
+
+    assert VibeCLI().run(["verify", str(response_file), str(project_dir)]) == 0
+
+
+def test_verify_reports_mismatch_and_missing(response_file, project_dir, capsys):
+    """Test that changed and deleted files are reported."""
+    (project_dir / "main.py").write_text("print('changed')\n")
+    (project_dir / "requirements.txt").unlink()
+
+    result = VibeCLI().run(["verify", str(response_file), str(project_dir)])
+    out = capsys.readouterr().out
+
+    assert result == 1
+    assert "Missing files (1):" in out
+    assert "    - requirements.txt" in out
+    assert "Content mismatches (1):" in out
+    assert "    - main.py" in out
+
+
+def test_main_version_fast_path(capsys):
+    """Test that --version is answered without the argument parser."""
+    assert main(["--version"]) == 0
+    assert capsys.readouterr().out == "VIBE Core 0.1.0\n"
+
+
+def test_main_status_fast_path(capsys):
+    """Test that the status command runs through main()."""
+    assert main(["status"]) == 0
+    assert "VIBE Core Status:" in capsys.readouterr().out
+
+
+def test_verify_rejects_truncated_file(response_file, project_dir, capsys):
+    """Test that a file shorter than the expected content is a mismatch."""
+    main_py = project_dir / "main.py"
+    main_py.write_text(main_py.read_text()[:10])
+
+    assert VibeCLI().run(["verify", str(response_file), str(project_dir)]) == 1
+    assert "    - main.py" in capsys.readouterr().out
+
+
+def test_verify_nested_paths(temp_dir, capsys):
+    """Test that files in subdirectories are found and reported by path."""
+    response = temp_dir / "nested.txt"
+    response.write_text(
+        "Fichier: src/app/main.py\nprint('hi')\n\n"
+        "Fichier: src/app/util.py\nVALUE = 1\n"
+    )
+    out_dir = temp_dir / "nested"
+    assert VibeCLI().run(["parse", str(response), str(out_dir)]) == 0
+    assert VibeCLI().run(["verify", str(response), str(out_dir)]) == 0
+
+    (out_dir / "src" / "app" / "util.py").unlink()
+    assert VibeCLI().run(["verify", str(response), str(out_dir)]) == 1
+    assert "    - src/app/util.py" in capsys.readouterr().out
+
+
+def test_parse_reuses_cached_response(response_file, project_dir, sample_claude_response):
+    """Test that an unchanged response is not parsed again, but an edit is."""
+    from unittest.mock import patch
+
+    import vibe_core.parsers
+
+    with patch.object(
+        vibe_core.parsers,
+        "parse_claude_response",
+        wraps=vibe_core.parsers.parse_claude_response,
+    ) as parse:
+        assert VibeCLI().run(["verify", str(response_file), str(project_dir)]) == 0
+        assert parse.call_count == 0
+
+        response_file.write_text(sample_claude_response + "\nFichier: extra.txt\nx\n")
+        assert VibeCLI().run(["verify", str(response_file), str(project_dir)]) == 1
+        assert parse.call_count == 1
+
+
+def test_create_parser_builds_only_requested_command():
+    """Test that a known command only gets its own subparser."""
+    cli = VibeCLI()
+
+    args = cli.create_parser("generate").parse_args(["generate", "demo", "--dry-run"])
+    assert (args.command, args.name, args.dry_run) == ("generate", "demo", True)
+
+    with pytest.raises(SystemExit):
+        cli.create_parser("generate").parse_args(["status"])
+
+    args = cli.create_parser(None).parse_args(["status"])
+    assert args.command == "status"
+
+
+def test_verify_terminates_on_symlink_cycles(project_dir, response_file):
+    """Test that directory links pointing back up the tree are walked once."""
+    (project_dir / "a").mkdir()
+    (project_dir / "a" / "l1").symlink_to("..")
+    (project_dir / "a" / "l2").symlink_to("..")
+
+    assert VibeCLI().run(["verify", str(response_file), str(project_dir)]) == 0
+
+
+def test_load_response_returns_independent_files(response_file):
+    """Test that editing a loaded file does not change the next load."""
+    from vibe_core.cli.main import _load_response
+
+    first = _load_response(response_file)
+    first[0].content = "changed"
+
+    assert _load_response(response_file)[0].content != "changed"
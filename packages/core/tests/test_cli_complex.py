@@ -0,0 +1,301 @@
+"""Tests for the full-featured VIBE CLI in ``main_complex``."""
+
+import pytest
+
+from vibe_core.cli.main_complex import VibeCLI
+
+
+@pytest.fixture
+def cli(monkeypatch):
+    """CLI instance with dummy API keys in the environment."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic")
+    return VibeCLI()
+
+
+@pytest.fixture
+def response_file(temp_dir, sample_claude_response):
+    """Claude response file written to a temporary directory."""
+    path = temp_dir / "response.txt"
+    path.write_text(sample_claude_response)
+    return path
+
+
+def test_workflow_created_lazily(cli):
+    """Test that constructing the CLI does not build the workflow."""
+    assert cli._workflow is None
+    assert cli.workflow is cli.workflow
+    assert not hasattr(cli, "__dict__")
+
+
+def test_parse_then_verify(cli, response_file, temp_dir, capsys):
+    """Test that parsed files verify against the same response."""
+    out_dir = temp_dir / "project"
+
+    cli.run(["parse", str(response_file), str(out_dir)])
+    assert (out_dir / "main.py").read_text().startswith("def main():")
+
+    cli.run(["verify", str(response_file), str(out_dir)])
+    assert "All 3 files found" in capsys.readouterr().out
+
+
+def test_verify_reports_missing(cli, response_file, temp_dir, capsys):
+    """Test that verify exits non-zero and lists missing files."""
+    out_dir = temp_dir / "project"
+    cli.run(["parse", str(response_file), str(out_dir)])
+    (out_dir / "requirements.txt").unlink()
+
+    with pytest.raises(SystemExit) as exc:
+        cli.run(["verify", str(response_file), str(out_dir)])
+
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    assert "Missing 1 files:" in out
+    assert "  - requirements.txt" in out
+
+
+def test_create_parser_builds_only_sniffed_command(cli):
+    """Test that only the named subcommand gets its arguments."""
+    parser = cli.create_parser(["-v", "verify", "a.txt", "out"])
+    args = parser.parse_args(["-v", "verify", "a.txt", "out"])
+    assert args.func == cli.cmd_verify
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["parse", "a.txt", "out"])
+
+
+def test_help_lists_all_commands(cli, capsys):
+    """Test that top-level help still lists every subcommand."""
+    with pytest.raises(SystemExit):
+        cli.create_parser(["--help"]).parse_args(["--help"])
+
+    out = capsys.readouterr().out
+    for name in ("generate", "parse", "validate", "merge", "verify"):
+        assert name in out
+
+
+def test_verify_fail_fast_stops_after_display_limit(cli, temp_dir, capsys):
+    """Test that --fail-fast stops once the listing limit is exceeded."""
+    response = temp_dir / "many.txt"
+    response.write_text("".join(f"Fichier: f{i}.txt\n{i}\n" for i in range(30)))
+    out_dir = temp_dir / "empty"
+    out_dir.mkdir()
+
+    with pytest.raises(SystemExit):
+        cli.run(["verify", "--fail-fast", str(response), str(out_dir)])
+
+    out = capsys.readouterr().out
+    assert "Missing more than 10 files" in out
+    assert "  - f9.txt" in out
+    assert "f10.txt" not in out
+
+
+def test_parse_writes_nested_files(cli, temp_dir):
+    """Test that files sharing and nesting directories are all written."""
+    response = temp_dir / "nested.txt"
+    response.write_text(
+        "Fichier: src/a.py\nA = 1\n"
+        "Fichier: src/b.py\nB = 'é'\n"
+        "Fichier: src/pkg/c.py\nC = 3\n"
+    )
+    out_dir = temp_dir / "out"
+
+    cli.run(["parse", str(response), str(out_dir)])
+
+    assert (out_dir / "src" / "a.py").read_text() == "A = 1"
+    assert (out_dir / "src" / "b.py").read_text(encoding="utf-8") == "B = 'é'"
+    assert (out_dir / "src" / "pkg" / "c.py").read_text() == "C = 3"
+
+
+def test_parse_writes_nothing_for_bad_response(cli, temp_dir):
+    """Test that a response failing late in the file leaves no output."""
+    response = temp_dir / "bad.txt"
+    response.write_bytes(
+        b"Fichier: a.py\nA = 1\nFichier: b.py\n" + b"# pad\n" * 4000 + b"\xff\n"
+    )
+    out_dir = temp_dir / "out"
+
+    with pytest.raises(SystemExit):
+        cli.run(["parse", str(response), str(out_dir)])
+
+    assert not out_dir.exists()
+
+
+def test_verify_nested_project(cli, temp_dir, capsys):
+    """Test that verify finds files in nested directories."""
+    response = temp_dir / "nested.txt"
+    response.write_text("Fichier: src/pkg/a.py\nA = 1\nFichier: ./b.py\nB = 2\n")
+    out_dir = temp_dir / "out"
+    cli.run(["parse", str(response), str(out_dir)])
+
+    cli.run(["verify", str(response), str(out_dir)])
+    assert "All 2 files found" in capsys.readouterr().out
+
+
+def test_run_reuses_parser_per_command(cli, response_file, temp_dir):
+    """Test that repeated runs of a command reuse its parser."""
+    out_dir = temp_dir / "project"
+    cli.run(["parse", str(response_file), str(out_dir)])
+    parser = cli._parsers["parse"]
+
+    cli.run(["parse", "--dry-run", str(response_file), str(out_dir)])
+    assert cli._parsers["parse"] is parser
+    assert list(cli._parsers) == ["parse"]
+
+
+def test_missing_source_reports_on_stderr(cli, temp_dir, capsys):
+    """Test that a missing response file fails with a message on stderr."""
+    with pytest.raises(SystemExit) as exc:
+        cli.run(["parse", str(temp_dir / "nope.txt"), str(temp_dir / "out")])
+
+    assert exc.value.code == 1
+    assert "Source file not found" in capsys.readouterr().err
+
+
+def test_main_hard_exit_status(temp_dir, monkeypatch):
+    """Test that main() exits the process with status 1 on failure."""
+    import subprocess
+    import sys
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic")
+    proc = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys; from vibe_core.cli.main_complex import main; main(sys.argv[1:])",
+            "verify", str(temp_dir / "nope.txt"), str(temp_dir),
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 1
+    assert "Response file not found" in proc.stderr
+
+
+def test_parse_many_files_on_thread_pool(cli, temp_dir, capsys):
+    """Test that a batch above the serial threshold is fully written."""
+    response = temp_dir / "many.txt"
+    response.write_text(
+        "".join(f"Fichier: d{i % 3}/f{i}.txt\ncontent {i}\n" for i in range(40))
+    )
+    out_dir = temp_dir / "out"
+
+    cli.run(["parse", str(response), str(out_dir)])
+
+    assert "Parsed 40 files" in capsys.readouterr().out
+    for i in range(40):
+        assert (out_dir / f"d{i % 3}" / f"f{i}.txt").read_text() == f"content {i}"
+
+
+def test_parse_does_not_require_api_keys(response_file, temp_dir, monkeypatch):
+    """Test that commands which never call the models run without keys."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    VibeCLI().run(["parse", str(response_file), str(temp_dir / "out")])
+
+    assert (temp_dir / "out" / "README.md").exists()
+
+
+def test_static_help_matches_argparse(monkeypatch, capsys):
+    """Test that the pre-rendered help is what argparse would print."""
+    from vibe_core.cli.main_complex import main
+
+    monkeypatch.setenv("COLUMNS", "80")
+    expected = VibeCLI().create_parser(["--help"]).format_help()
+
+    main(["--help"])
+    assert capsys.readouterr().out == expected
+
+    main([])
+    assert capsys.readouterr().out == expected
+
+
+def test_main_version(capsys):
+    """Test that --version is answered without building the CLI."""
+    from vibe_core.cli.main_complex import main
+
+    main(["--version"])
+    assert capsys.readouterr().out == "VIBE Core 0.1.0\n"
+
+
+def test_parse_dry_run_lists_files(cli, response_file, temp_dir, capsys):
+    """Test that a dry run lists the files without writing them."""
+    cli.run(["parse", "--dry-run", str(response_file), str(temp_dir / "out")])
+
+    assert capsys.readouterr().out == (
+        "Would parse 3 files:\n  README.md\n  main.py\n  requirements.txt\n"
+    )
+    assert not (temp_dir / "out").exists()
+
+
+def test_verify_large_response_switches_to_walk(cli, temp_dir, capsys):
+    """Test that verify gives the same result past the per-file stat limit."""
+    response = temp_dir / "many.txt"
+    response.write_text(
+        "".join(f"Fichier: d{i % 5}/f{i}.txt\n{i}\n" for i in range(250))
+    )
+    out_dir = temp_dir / "out"
+    cli.run(["parse", str(response), str(out_dir)])
+    (out_dir / "d1" / "f246.txt").unlink()
+    (out_dir / "d2" / "f7.txt").unlink()
+
+    with pytest.raises(SystemExit):
+        cli.run(["verify", str(response), str(out_dir)])
+
+    out = capsys.readouterr().out
+    assert "Missing 2 files:" in out
+    assert "  - d2/f7.txt" in out
+    assert "  - d1/f246.txt" in out
+
+
+def test_parse_repeated_path_keeps_last_block(cli, temp_dir):
+    """Test that the last block for a repeated path wins on the thread pool."""
+    response = temp_dir / "dupes.txt"
+    response.write_text(
+        "".join(f"Fichier: f{i % 4}.txt\ncontent {i}\n" for i in range(40))
+    )
+    out_dir = temp_dir / "out"
+
+    cli.run(["parse", str(response), str(out_dir)])
+
+    for i in range(4):
+        assert (out_dir / f"f{i}.txt").read_text() == f"content {36 + i}"
+
+
+@pytest.mark.parametrize("count", [5, 250])
+def test_verify_follows_symlinked_dirs(cli, temp_dir, capsys, count):
+    """Test that files under a symlinked dir pass both below and past the stat limit."""
+    real = temp_dir / "real"
+    real.mkdir()
+    out_dir = temp_dir / "out"
+    out_dir.mkdir()
+    (out_dir / "linked").symlink_to(real)
+    (real / "loop").symlink_to(out_dir)
+    for i in range(count):
+        (real / f"f{i}.txt").write_text("x")
+    response = temp_dir / "links.txt"
+    response.write_text("".join(f"Fichier: linked/f{i}.txt\nx\n" for i in range(count)))
+
+    cli.run(["verify", str(response), str(out_dir)])
+    assert f"All {count} files found" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("count", [5, 250])
+def test_verify_counts_only_files(cli, temp_dir, capsys, count):
+    """Test that a directory or broken link is missing below and past the stat limit."""
+    out_dir = temp_dir / "out"
+    out_dir.mkdir()
+    for i in range(count):
+        (out_dir / f"f{i}.txt").write_text("x")
+    (out_dir / "f0.txt").unlink()
+    (out_dir / "f0.txt").mkdir()
+    (out_dir / "f1.txt").unlink()
+    (out_dir / "f1.txt").symlink_to(out_dir / "gone.txt")
+    response = temp_dir / "files.txt"
+    response.write_text("".join(f"Fichier: f{i}.txt\nx\n" for i in range(count)))
+
+    with pytest.raises(SystemExit):
+        cli.run(["verify", str(response), str(out_dir)])
+    assert "Missing 2 files:" in capsys.readouterr().out
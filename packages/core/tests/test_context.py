@@ -0,0 +1,32 @@
+"""Tests for memory context utilities."""
+
+from unittest.mock import Mock
+
+from vibe_core.utils.context import ContextManager
+
+
+def test_for_query_caches_search_results():
+    """Test that repeated queries hit the cache until memory is hydrated."""
+    memory = Mock()
+    memory.search.return_value = ["chunk"]
+    manager = ContextManager(memory, top_k=2)
+
+    with manager.for_query("auth") as results:
+        results.append("mutated")
+    with manager.for_query("auth") as results:
+        assert results == ["chunk"]
+    memory.search.assert_called_once_with("auth", 2)
+
+    manager.hydrate_from_text("new line")
+    with manager.for_query("auth"):
+        pass
+    assert memory.search.call_count == 2
+
+
+def test_hydrate_from_text_uses_add_many():
+    """Test that hydration sends all non-empty lines in one batch."""
+    memory = Mock()
+    ContextManager(memory).hydrate_from_text(" one \n\n  \ntwo", author="me")
+
+    memory.add_many.assert_called_once_with(["one", "two"], author="me", context="")
+    memory.add.assert_not_called()
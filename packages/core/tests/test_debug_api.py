@@ -0,0 +1,172 @@
+"""Tests for the debug API."""
+
+import pytest
+
+from vibe_core.api.debug import DebugAPI
+from vibe_core.models.project import ProjectConfig
+
+
+@pytest.fixture
+def debug_api():
+    """Debug API instance for testing."""
+    return DebugAPI()
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["my-project", "my_project", "Project2", "café"],
+)
+def test_validate_plain_project_names(debug_api, name):
+    """Test that alphanumeric names with '-' or '_' produce no warning."""
+    result = debug_api.validate_project_config(ProjectConfig(project_name=name))
+
+    assert result["valid"]
+    assert result["warnings"] == []
+
+
+@pytest.mark.parametrize("name", ["my project", "app!", "--", "a.b"])
+def test_validate_special_character_names(debug_api, name):
+    """Test that names with special characters produce a warning."""
+    result = debug_api.validate_project_config(ProjectConfig(project_name=name))
+
+    assert "Project name contains special characters" in result["warnings"]
+
+
+def test_validate_unknown_architecture_and_provider(debug_api):
+    """Test warnings for uncommon architecture styles and providers."""
+    config = ProjectConfig(
+        project_name="demo",
+        architecture_style="spaghetti",
+        cloud_provider="Mainframe",
+    )
+    result = debug_api.validate_project_config(config)
+
+    assert len(result["warnings"]) == 2
+    assert result["score"] == pytest.approx(0.8)
+
+
+def test_validate_provider_case_insensitive(debug_api):
+    """Test that cloud providers are matched case-insensitively."""
+    config = ProjectConfig(project_name="demo", cloud_provider="AWS")
+    result = debug_api.validate_project_config(config)
+
+    assert result["warnings"] == []
+
+
+def test_mock_outputs_base_only(debug_api):
+    """Test mock outputs for a config without extra options."""
+    outputs = debug_api._generate_mock_outputs(ProjectConfig(project_name="demo"))
+
+    assert outputs[0] == "README.md"
+    assert len(outputs) == 7
+
+
+def test_mock_outputs_for_full_config(debug_api):
+    """Test that architecture, cloud and technology files are appended."""
+    config = ProjectConfig(
+        project_name="demo",
+        architecture_style="serverless",
+        cloud_provider="gcp",
+        technology_stack=["React", "FastAPI"],
+    )
+    outputs = debug_api._generate_mock_outputs(config)
+
+    assert outputs[7:] == [
+        "functions/handler.py",
+        "serverless.yml",
+        "requirements.txt",
+        "cloudbuild.yaml",
+        "app.yaml",
+        "src/components/App.jsx",
+        "public/index.html",
+        "src/api/routes.py",
+        "src/models/schemas.py",
+    ]
+
+
+def test_debug_agent_endpoint_batched(debug_api):
+    """Test that concurrent requests are answered through the batcher."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from fastapi.testclient import TestClient
+
+    payloads = [
+        {"project_config": {"project_name": f"project-{i}"}} for i in range(8)
+    ]
+    with TestClient(debug_api.get_app()) as client:
+        assert debug_api._batcher.running
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(lambda p: client.post("/debug-agent", json=p), payloads)
+            )
+
+    assert not debug_api._batcher.running
+    for i, response in enumerate(responses):
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"]
+        assert body["metadata"]["project_name"] == f"project-{i}"
+
+
+def test_debug_agent_endpoint_without_lifespan(debug_api):
+    """Test that the endpoint still works when the batcher is not running."""
+    from fastapi.testclient import TestClient
+
+    client = TestClient(debug_api.get_app())
+    response = client.post(
+        "/debug-agent",
+        json={"project_config": {"project_name": "demo"}, "simulate_generation": False},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["outputs"] == []
+
+
+def test_simulation_logs(debug_api):
+    """Test the log lines produced by a full simulation."""
+    from vibe_core.api.debug import DebugRequest
+
+    request = DebugRequest(
+        project_config=ProjectConfig(project_name="demo"),
+        merged_prompt="abc",
+    )
+    response = debug_api._run_simulation(request)
+
+    assert response.logs == [
+        "Configuration parsed for project: demo",
+        "Merged prompt loaded (3 characters)",
+        "Simulating memory recording",
+        "Simulating context hydration",
+        "Simulating plan generation",
+        "Simulating file creation",
+        "Simulated 7 output files",
+    ]
+    assert response.metadata["prompt_length"] == 3
+
+
+def test_responses_use_compact_json(debug_api):
+    """Test that responses are rendered as compact UTF-8 JSON."""
+    from fastapi.testclient import TestClient
+
+    response = TestClient(debug_api.get_app()).get("/health")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b'{"status":"healthy","service":"vibe-core-debug"}'
+
+
+def test_batcher_stop_fails_collected_requests():
+    """Test that stopping fails requests already taken into a batch."""
+    import asyncio
+
+    from vibe_core.api.debug import _DebugBatcher
+
+    async def scenario():
+        batcher = _DebugBatcher(lambda request: None, max_wait=60)
+        batcher.start()
+        pending = asyncio.ensure_future(batcher.submit(object()))
+        await asyncio.sleep(0.01)  # consumer now waits for the batch to fill
+        await batcher.stop()
+        with pytest.raises(RuntimeError, match="stopped"):
+            await asyncio.wait_for(pending, 1)
+
+    asyncio.run(scenario())
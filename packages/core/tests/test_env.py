@@ -0,0 +1,57 @@
+"""Tests for environment configuration utilities."""
+
+from unittest.mock import patch
+
+import pytest
+
+from vibe_core.utils import env
+
+
+@pytest.fixture(autouse=True)
+def clear_key_cache():
+    """Reset the cached keys around each test."""
+    env.load_api_keys.cache_clear()
+    yield
+    env.load_api_keys.cache_clear()
+
+
+def test_load_api_keys_is_cached(monkeypatch):
+    """Test that keys already in the environment skip .env and are cached."""
+    monkeypatch.setenv("OPENAI_API_KEY", "openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "anthropic")
+
+    with patch.object(env, "load_dotenv") as mock_load_dotenv:
+        assert env.load_api_keys() == ("openai", "anthropic")
+        monkeypatch.setenv("OPENAI_API_KEY", "changed")
+        assert env.load_api_keys() == ("openai", "anthropic")
+
+    mock_load_dotenv.assert_not_called()
+    env.load_api_keys.cache_clear()
+    assert env.load_api_keys() == ("changed", "anthropic")
+
+
+def test_load_api_keys_missing_is_not_cached(monkeypatch):
+    """Test that a missing key raises and is looked up again next time."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "anthropic")
+
+    with patch.object(env, "load_dotenv") as mock_load_dotenv:
+        with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+            env.load_api_keys()
+        mock_load_dotenv.assert_called_once()
+
+        monkeypatch.setenv("OPENAI_API_KEY", "openai")
+        assert env.load_api_keys() == ("openai", "anthropic")
+
+
+def test_utils_exports_are_lazy():
+    """Test that importing load_api_keys from utils leaves the memory store unloaded."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from vibe_core.utils import load_api_keys\n"
+        "assert 'vibe_core.utils.memory' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
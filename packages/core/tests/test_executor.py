@@ -0,0 +1,200 @@
+"""Tests for the task executor."""
+
+from pathlib import Path
+
+import pytest
+
+from vibe_core.utils.executor import FileOperation, TaskExecutor
+
+
+def test_create_and_modify_file(temp_dir):
+    """Test creating a nested file, refusing to overwrite it, then modifying it."""
+    executor = TaskExecutor(temp_dir)
+
+    assert executor.create_file("src/app/main.py", "print('hi')\n").success
+    assert (temp_dir / "src" / "app" / "main.py").read_text(encoding="utf-8") == "print('hi')\n"
+    assert not executor.create_file("src/app/main.py", "other").success
+
+    result = executor.modify_file("src/app/main.py", "print('bye')\n")
+    assert result.success
+    assert (temp_dir / "src" / "app" / "main.py").read_text(encoding="utf-8") == "print('bye')\n"
+    assert (temp_dir / ".vibe_backups").is_dir()
+    assert Path(result.backup_path).read_text(encoding="utf-8") == "print('hi')\n"
+
+
+def test_copy_move_and_delete(temp_dir):
+    """Test copying and moving into new directories, then deleting."""
+    executor = TaskExecutor(temp_dir, create_backups=False)
+    executor.create_file("a.txt", "data")
+
+    assert executor.copy_file("a.txt", "copies/b.txt").success
+    assert executor.move_file("a.txt", "moved/c.txt").success
+    assert not (temp_dir / "a.txt").exists()
+    assert (temp_dir / "copies" / "b.txt").read_text(encoding="utf-8") == "data"
+    assert (temp_dir / "moved" / "c.txt").read_text(encoding="utf-8") == "data"
+
+    assert executor.delete_file("moved/c.txt").success
+    assert not executor.delete_file("moved/c.txt").success
+    assert not executor.modify_file("missing.txt", "x").success
+    assert not executor.copy_file("missing.txt", "x.txt").success
+
+
+def test_directories_created_once(temp_dir):
+    """Test that a shared parent directory is created once, and again after removal."""
+    import shutil
+    from unittest.mock import patch
+
+    import vibe_core.utils.executor as executor_module
+
+    executor = TaskExecutor(temp_dir)
+    with patch.object(executor_module.os, "makedirs", wraps=executor_module.os.makedirs) as mock_makedirs:
+        for i in range(5):
+            assert executor.create_file(f"src/mod{i}.py", "").success
+    assert mock_makedirs.call_count == 1
+
+    shutil.rmtree(temp_dir / "src")
+    assert executor.create_file("src/again.py", "").success
+    assert executor.copy_file("src/again.py", "src/copy.py").success
+
+
+def test_create_without_overwrite_and_modify_shorter(temp_dir):
+    """Test exclusive creation and that modify replaces longer content."""
+    executor = TaskExecutor(temp_dir)
+    assert executor.create_file("a.txt", "first version", overwrite=False).success
+
+    result = executor.create_file("a.txt", "second", overwrite=False)
+    assert not result.success
+    assert result.error == "File exists and overwrite=False"
+    assert (temp_dir / "a.txt").read_text(encoding="utf-8") == "first version"
+
+    assert executor.modify_file("a.txt", "short", create_backup=False).success
+    assert (temp_dir / "a.txt").read_text(encoding="utf-8") == "short"
+
+
+def test_create_file_writes_utf8_bytes(temp_dir):
+    """Test that content is written as UTF-8 without newline translation."""
+    content = "café\r\n" * 50000
+    executor = TaskExecutor(temp_dir)
+
+    assert executor.create_file("big.txt", content).success
+    assert (temp_dir / "big.txt").read_bytes() == content.encode("utf-8")
+
+
+@pytest.mark.parametrize("count", [3, 40])
+def test_execute_operations(temp_dir, count):
+    """Test that a batch runs in order, on threads for larger batches."""
+    executor = TaskExecutor(temp_dir)
+    operations = [
+        FileOperation(operation="create", path=f"pkg{i % 4}/mod{i}.py", content=f"VALUE = {i}")
+        for i in range(count)
+    ]
+    operations.append(FileOperation(operation="modify", path="missing.py", content=""))
+
+    results = executor.execute_operations(operations)
+
+    assert [r.path for r in results] == [op.path for op in operations]
+    assert [r.success for r in results] == [True] * count + [False]
+    assert [r.path for r in executor.get_operation_history()] == [op.path for op in operations[:-1]]
+    for i in range(count):
+        assert (temp_dir / f"pkg{i % 4}" / f"mod{i}.py").read_text(encoding="utf-8") == f"VALUE = {i}"
+
+
+def test_operation_history_is_bounded(temp_dir):
+    """Test that the history keeps only the most recent results, or none."""
+    executor = TaskExecutor(temp_dir, history_limit=2)
+    for i in range(4):
+        executor.create_file(f"f{i}.txt", "")
+
+    assert [r.path for r in executor.get_operation_history()] == ["f2.txt", "f3.txt"]
+
+    untracked = TaskExecutor(temp_dir, track_history=False)
+    assert untracked.create_file("g.txt", "").success
+    assert untracked.get_operation_history() == []
+
+
+def test_backup_links_original_content(temp_dir):
+    """Test that backups keep the old content and the new file keeps its mode."""
+    executor = TaskExecutor(temp_dir)
+    executor.create_file("run.sh", "echo old\n")
+    (temp_dir / "run.sh").chmod(0o755)
+
+    result = executor.modify_file("run.sh", "echo new\n")
+
+    assert result.success
+    assert Path(result.backup_path).read_text(encoding="utf-8") == "echo old\n"
+    assert (temp_dir / "run.sh").read_text(encoding="utf-8") == "echo new\n"
+    assert (temp_dir / "run.sh").stat().st_mode & 0o777 == 0o755
+    assert sorted(p.name for p in temp_dir.iterdir()) == [".vibe_backups", "run.sh"]
+
+    deleted = executor.delete_file("run.sh")
+    assert Path(deleted.backup_path).read_text(encoding="utf-8") == "echo new\n"
+
+
+def test_backup_dir_recreated_after_removal(temp_dir):
+    """Test that backups still work after the backup dir is deleted externally."""
+    import shutil
+
+    executor = TaskExecutor(temp_dir)
+    executor.create_file("a.txt", "one")
+    executor.create_file("b.txt", "two")
+    assert executor.modify_file("a.txt", "one v2").success
+
+    shutil.rmtree(temp_dir / ".vibe_backups")
+    assert executor.modify_file("a.txt", "one v3").success
+    shutil.rmtree(temp_dir / ".vibe_backups")
+    deleted = executor.delete_file("b.txt")
+
+    assert deleted.success
+    assert Path(deleted.backup_path).read_text(encoding="utf-8") == "two"
+
+
+def test_modify_reports_other_missing_paths_as_errors(temp_dir, monkeypatch):
+    """Test that only ENOENT on the target itself means the file is missing."""
+    executor = TaskExecutor(temp_dir)
+    executor.create_file("a.txt", "one")
+
+    def fail_backup(file_path):
+        raise FileNotFoundError(2, "No such file or directory", str(temp_dir / "elsewhere"))
+
+    monkeypatch.setattr(executor, "_create_backup", fail_backup)
+    result = executor.modify_file("a.txt", "two")
+
+    assert not result.success
+    assert result.error != "File does not exist"
+    assert "elsewhere" in result.error
+    assert executor.modify_file("missing.txt", "x", create_backup=False).error == "File does not exist"
+
+
+def test_execute_operations_keeps_order_per_path(temp_dir):
+    """Test that dependent operations in a parallel batch run in input order."""
+    from vibe_core.utils.executor import _group_by_path
+
+    operations = []
+    for i in range(10):
+        operations += [
+            FileOperation(operation="create", path=f"f{i}.txt", content="v1"),
+            FileOperation(operation="modify", path=f"f{i}.txt", content=f"v2 {i}", backup=False),
+            FileOperation(operation="move", source=f"f{i}.txt", path=f"moved/f{i}.txt"),
+        ]
+    assert len(_group_by_path(operations)) == 10
+
+    results = TaskExecutor(temp_dir).execute_operations(operations)
+
+    assert all(r.success for r in results)
+    for i in range(10):
+        assert not (temp_dir / f"f{i}.txt").exists()
+        assert (temp_dir / "moved" / f"f{i}.txt").read_text(encoding="utf-8") == f"v2 {i}"
+
+
+def test_modify_writes_through_symlink(temp_dir):
+    """Test that modifying a symlink updates its target and keeps the link."""
+    executor = TaskExecutor(temp_dir)
+    executor.create_file("real.txt", "old")
+    (temp_dir / "link.txt").symlink_to("real.txt")
+
+    result = executor.modify_file("link.txt", "new")
+
+    assert result.success
+    assert (temp_dir / "link.txt").is_symlink()
+    assert (temp_dir / "real.txt").read_text(encoding="utf-8") == "new"
+    assert Path(result.backup_path).read_text(encoding="utf-8") == "old"
@@ -0,0 +1,25 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+from vibe_core import _json
+
+
+def test_round_trip():
+    """Test that text and bytes input decode to the same object."""
+    data = {"name": "café", "items": [1, 2.5, None, True]}
+    text = _json.dumps(data)
+
+    assert _json.loads(text) == data
+    assert _json.loads(text.encode("utf-8")) == data
+    assert "café" in text
+
+
+def test_indented_output():
+    """Test that indented output uses two spaces."""
+    assert _json.dumps({"a": [1]}, indent=True) == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_dumps_bytes_matches_dumps():
+    """Test that the bytes variant is the UTF-8 encoding of dumps."""
+    data = {"files": ["é.md", "b.py"], "ok": True}
+
+    assert _json.dumps_bytes(data) == _json.dumps(data).encode("utf-8")
@@ -154,3 +154,167 @@ def test_get_recent_entries(temp_memory_file, mock_openai_client):
     recent = memory.get_recent(limit=2)
     assert len(recent) == 2
     # Note: In a real test, you'd want to control timestamps to verify order
+
+
+def test_add_many_batches_embeddings(temp_memory_file, mock_openai_client):
+    """Test that add_many embeds in batches and writes once."""
+    mock_openai_client.embeddings.create.side_effect = lambda model, input: Mock(
+        data=[Mock(embedding=[float(len(text)), 1.0]) for text in input]
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    
+    with patch.object(memory, "_append", wraps=memory._append) as mock_append:
+        memory.add_many(["a", "  ", "bb", "ccc"], author="test", batch_size=2)
+    
+    assert mock_openai_client.embeddings.create.call_count == 2
+    mock_append.assert_called_once()
+    assert [(e.text, e.embedding, e.author) for e in memory.entries] == [
+        ("a", [1.0, 1.0], "test"),
+        ("bb", [2.0, 1.0], "test"),
+        ("ccc", [3.0, 1.0], "test"),
+    ]
+
+
+def test_search_ranks_with_embedding_matrix(temp_memory_file, mock_openai_client):
+    """Test that search scores match the scalar cosine and follow appended entries."""
+    vectors = {"x": [1.0, 0.0], "y": [0.0, 1.0], "xy": [1.0, 1.0], "query": [1.0, 0.2]}
+    mock_openai_client.embeddings.create.side_effect = lambda model, input: Mock(
+        data=[Mock(embedding=vectors[input])]
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    memory.add("y")
+    memory.add("x")
+    
+    assert [r.entry.text for r in memory.search("query", top_k=5)] == ["x", "y"]
+    
+    memory.add("xy")
+    results = memory.search("query", top_k=2)
+    assert [r.entry.text for r in results] == ["x", "xy"]
+    for result in results:
+        expected = memory._cosine_similarity(vectors["query"], result.entry.embedding)
+        assert result.score == pytest.approx(expected, rel=1e-6)
+
+
+def test_search_after_clear_and_in_place_edits(temp_memory_file, mock_openai_client):
+    """Test that the search matrix is rebuilt after clear and list edits."""
+    vectors = {"a": [1.0, 0.0], "qa": [1.0, 0.0], "b": [0.0, 1.0], "qb": [0.0, 1.0]}
+    mock_openai_client.embeddings.create.side_effect = lambda model, input: Mock(
+        data=[Mock(embedding=vectors[input])]
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    memory.add("a")
+    memory.search("qa")
+    memory.clear()
+    memory.add("b")
+
+    assert [(r.entry.text, r.score) for r in memory.search("qb")] == [("b", pytest.approx(1.0))]
+
+    memory.entries[0] = memory.entries[0].model_copy(update={"text": "a", "embedding": [1.0, 0.0]})
+    assert [(r.entry.text, r.score) for r in memory.search("qa")] == [("a", pytest.approx(1.0))]
+
+
+def test_search_after_replacing_earlier_entry(temp_memory_file, mock_openai_client):
+    """Test that replacing an entry before the last one rebuilds the matrix."""
+    vectors = {"a": [1.0, 0.0], "b": [1.0, 0.0], "qb": [0.0, 1.0]}
+    mock_openai_client.embeddings.create.side_effect = lambda model, input: Mock(
+        data=[Mock(embedding=vectors[input])]
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    memory.add("a")
+    memory.add("b")
+    memory.search("qb")
+
+    memory.entries[0] = memory.entries[0].model_copy(update={"embedding": [0.0, 1.0]})
+
+    assert memory.search("qb", top_k=1)[0].score == pytest.approx(1.0)
+
+
+def test_embeddings_saved_as_float16(temp_memory_file, mock_openai_client):
+    """Test that embeddings round-trip through the float16 file encoding."""
+    import json
+
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    memory.add("Stored", author="test")
+    
+    item = json.loads(temp_memory_file.read_text(encoding="utf-8"))
+    assert "embedding" not in item
+    
+    reloaded = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    assert reloaded.entries[0].embedding == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5], rel=1e-3)
+    assert reloaded.search("Stored", top_k=1)[0].score == pytest.approx(1.0)
+
+
+def test_load_legacy_embedding_lists(temp_memory_file, mock_openai_client):
+    """Test that files with plain embedding lists still load."""
+    import json
+
+    temp_memory_file.write_text(
+        json.dumps([{"text": "old", "embedding": [0.25, 0.5]}]), encoding="utf-8"
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    
+    assert memory.entries[0].embedding == [0.25, 0.5]
+
+
+def test_add_appends_json_lines(temp_memory_file, mock_openai_client):
+    """Test that adds append lines and legacy array files are converted."""
+    import json
+
+    temp_memory_file.write_text(
+        json.dumps([{"text": "old", "embedding": [0.25, 0.5]}]), encoding="utf-8"
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    memory.add("first")
+    memory.add("second")
+    
+    lines = temp_memory_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["text"] for line in lines] == ["old", "first", "second"]
+    
+    with temp_memory_file.open("a", encoding="utf-8") as f:
+        f.write('{"text": "cut sh')
+    reloaded = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    assert [e.text for e in reloaded.entries] == ["old", "first", "second"]
+
+
+def test_add_many_with_per_item_metadata(temp_memory_file, mock_openai_client):
+    """Test that (text, metadata) pairs carry their own metadata."""
+    mock_openai_client.embeddings.create.side_effect = lambda model, input: Mock(
+        data=[Mock(embedding=[1.0, 0.0]) for _ in input]
+    )
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    
+    memory.add_many(
+        [("a", {"source": "x"}), "b"], metadata={"source": "default", "run": 1}
+    )
+    
+    mock_openai_client.embeddings.create.assert_called_once()
+    assert [e.metadata for e in memory.entries] == [
+        {"source": "x", "run": 1},
+        {"source": "default", "run": 1},
+    ]
+
+
+def test_embeddings_are_cached(temp_memory_file, mock_openai_client):
+    """Test that repeated texts and queries are embedded only once."""
+    memory = JsonVectorMemory(temp_memory_file, client=mock_openai_client)
+    
+    memory.add("Cached text")
+    memory.search("Cached text")
+    memory.search("Cached text")
+    memory.add_many(["Cached text", "Other text"])
+    
+    calls = mock_openai_client.embeddings.create.call_args_list
+    assert [call.kwargs["input"] for call in calls] == ["Cached text", ["Other text"]]
+    assert memory.entries[0].embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
+
+
+@pytest.mark.parametrize("top_k", [0, 1, 3, 6, 10])
+def test_top_k_indices_match_stable_sort(top_k):
+    """Test that partial selection matches a stable descending sort, ties included."""
+    import numpy as np
+
+    from vibe_core.utils.memory import _top_k_indices
+
+    scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9, 0.5], dtype=np.float32)
+    
+    assert list(_top_k_indices(scores, top_k)) == list(np.argsort(-scores, kind="stable")[:top_k])
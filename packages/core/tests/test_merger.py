@@ -167,6 +167,24 @@ def test_config_flattening():
     assert flat["simple"] == "test"
 
 
+def test_config_flattening_deep_nesting():
+    """Test that deeply nested configs flatten without hitting the recursion limit."""
+    import sys
+
+    merger = PromptMerger("dummy")
+    depth = sys.getrecursionlimit() + 100
+    config = value = {}
+    for _ in range(depth - 1):
+        value["k"] = {}
+        value = value["k"]
+    value["k"] = [1, {"x": 2}]
+
+    flat = merger._flatten_config(config)
+    path = ".".join(["k"] * depth)
+
+    assert flat == {f"{path}.0": 1, f"{path}.1.x": 2}
+
+
 def test_plan_generation():
     """Test project plan generation."""
     merger = PromptMerger("dummy")
@@ -231,3 +249,263 @@ def test_empty_prompt_dir():
         result = merger.merge_prompts({})
         assert result.content == ""
         assert len(result.templates_used) == 0
+
+
+def test_merge_flattens_config_once(temp_prompt_dir):
+    """Test that merging flattens the configuration only once."""
+    from unittest.mock import patch
+
+    merger = PromptMerger(temp_prompt_dir)
+    config = {
+        "project": {"name": "test-app"},
+        "backend": {"stack": "fastapi", "framework": "FastAPI"},
+        "auth": {"type": "jwt"}
+    }
+
+    with patch.object(
+        merger, "_flatten_config", wraps=merger._flatten_config
+    ) as flatten:
+        result = merger.merge_prompts(config)
+
+    assert flatten.call_count == 1
+    assert len(result.templates_used) == 3
+
+
+def test_frontmatter_empty_block():
+    """Test that an empty frontmatter block yields no metadata."""
+    merger = PromptMerger("dummy")
+
+    metadata, content = merger._parse_frontmatter("---\n\n---\n# Title\n")
+
+    assert metadata == {}
+    assert content == "# Title\n"
+
+
+def test_load_templates_in_parallel(tmp_path):
+    """Test that large template directories load in path order, skipping bad files."""
+    for i in range(20):
+        (tmp_path / f"t{i:02d}.md").write_text(f"---\npriority: {i}\n---\n# T{i}\n")
+    (tmp_path / "t05.md").write_text("---\npriority: not-a-number\n---\n# Bad\n")
+
+    merger = PromptMerger(tmp_path)
+
+    names = [t.path.name for t in merger.templates]
+    assert len(names) == 19
+    assert "t05.md" not in names
+    assert names == sorted(names)
+
+
+def test_template_render_matches_replace_variables(temp_prompt_dir):
+    """Test that span-based rendering matches regex substitution."""
+    merger = PromptMerger(temp_prompt_dir)
+    config = {"project": {"name": "demo", "port": 8000}, "backend": {"framework": "FastAPI"}}
+    flat = merger._flatten_config(config)
+
+    for template in merger.templates:
+        assert template.spans is not None
+        assert template.render(flat) == merger.replace_variables(template.content, config)
+
+    built = PromptTemplate(
+        path=Path("x.md"),
+        metadata=PromptMetadata(),
+        content="{{ project.port }} and {{missing}}",
+    )
+    assert built.render(flat) == ("8000 and ", {"project.port": "8000", "missing": ""})
+
+
+def test_merge_prompts_cache(temp_prompt_dir):
+    """Test that repeated configs reuse the merge and template changes invalidate it."""
+    from unittest.mock import patch
+
+    merger = PromptMerger(temp_prompt_dir)
+    config = {"project": {"name": "test-app"}, "backend": {"stack": "fastapi"}}
+
+    with patch.object(merger, "select_templates", wraps=merger.select_templates) as select:
+        first = merger.merge_prompts(config)
+        second = merger.merge_prompts({"project": {"name": "test-app"}, "backend": {"stack": "fastapi"}})
+        assert select.call_count == 1
+        assert second.content == first.content
+        assert second.templates_used == first.templates_used
+        assert second.templates_used is not first.templates_used
+
+        merger.merge_prompts({"project": {"name": True}, "backend": {"stack": "fastapi"}})
+        merger.merge_prompts({"project": {"name": 1}, "backend": {"stack": "fastapi"}})
+        assert select.call_count == 3
+
+        merger.add_template_from_string("extra.md", "Extra for {{project.name}}")
+        third = merger.merge_prompts(config)
+        assert select.call_count == 4
+        assert "Extra for test-app" in third.content
+
+
+def test_should_include_template_fallback_keys():
+    """Test that dotted keys take precedence over legacy flat keys."""
+    merger = PromptMerger("dummy")
+    metadata = PromptMetadata(stack=["django"], auth_required=True, conditions={"mode": "api"})
+
+    config = {"backend": {"stack": "Django"}, "backend_stack": "fastapi", "auth_type": "jwt", "mode": "api"}
+    assert merger._should_include_template(metadata, config)
+    assert not merger._should_include_template(metadata, {**config, "mode": "web"})
+    assert not merger._should_include_template(metadata, {**config, "auth": {"type": "none"}})
+    assert not merger._should_include_template(metadata, {"backend_stack": "fastapi", "auth_type": "jwt", "mode": "api"})
+
+
+def test_template_render_escapes_literal_braces():
+    """Test that literal braces survive rendering and dotted names do not collide."""
+    template = PromptTemplate(
+        path=Path("x.md"),
+        metadata=PromptMetadata(),
+        content='{"a": {{a.b}}, "b": "{{a__b}}", "c": {{ a.b }}} {0} {{}}',
+    )
+
+    content, replaced = template.render({"a.b": 1, "a__b": "two"})
+
+    assert content == '{"a": 1, "b": "two", "c": 1} {0} {{}}'
+    assert replaced == {"a.b": "1", "a__b": "two"}
+
+
+def test_constructed_models_round_trip(temp_prompt_dir):
+    """Test that unvalidated templates and merge results still dump and validate."""
+    from vibe_core.generators.merger import MergedPrompt
+
+    merger = PromptMerger(temp_prompt_dir)
+    result = merger.merge_prompts({"project": {"name": "demo"}})
+
+    for template in merger.templates:
+        dumped = template.model_dump()
+        assert PromptTemplate.model_validate(dumped).model_dump() == dumped
+    assert MergedPrompt.model_validate(result.model_dump()) == result
+
+
+def test_selection_rule_snapshot():
+    """Test that selection rules lower-case stacks and are slotted and frozen."""
+    import dataclasses
+
+    from vibe_core.generators.merger import _SelectionRule
+
+    rule = _SelectionRule.from_metadata(PromptMetadata(stack=["FastAPI"], priority=4))
+
+    assert rule.stacks == frozenset({"fastapi"})
+    assert rule.priority == 4
+    assert not hasattr(rule, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rule.priority = 1
+
+
+def test_cached_templates_are_not_shared(tmp_path):
+    """Test that edits through one merger do not reach later mergers."""
+    (tmp_path / "a.md").write_text("Hi {{name}}\n")
+    config = {"name": "Ada"}
+
+    first = PromptMerger(tmp_path)
+    first.templates[0].content = "Bye {{name}}"
+    first.templates[0].metadata.priority = 9
+    assert first.templates[0].render(config)[0] == "Bye Ada"
+
+    second = PromptMerger(tmp_path)
+    assert second.templates[0].render(config)[0] == "Hi Ada\n"
+    assert second.templates[0].metadata.priority == 0
+    assert PromptMerger(tmp_path).templates[0] is not second.templates[0]
+
+
+def test_selection_follows_metadata_changes(temp_prompt_dir):
+    """Test that editing or replacing metadata changes the next selection."""
+    merger = PromptMerger(temp_prompt_dir)
+    config = {"backend": {"stack": "django"}, "auth": {"type": "none"}}
+    base = next(t for t in merger.templates if t.path.name == "base.md")
+    assert merger.select_templates(config) == [base]
+
+    base.metadata.auth_required = True
+    assert merger.select_templates(config) == []
+
+    base.metadata = PromptMetadata(priority=1)
+    assert merger.select_templates(config) == [base]
+
+
+def test_load_templates_reuses_unchanged_directory(tmp_path):
+    """Test that an unchanged prompt dir is not re-read, but an edited one is."""
+    import os
+    from unittest.mock import patch
+
+    (tmp_path / "a.md").write_text("# A {{x}}\n")
+    (tmp_path / "b.md").write_text("# B\n")
+    first = PromptMerger(tmp_path)
+
+    with patch.object(PromptMerger, "_load_template", wraps=first._load_template) as load:
+        second = PromptMerger(tmp_path)
+        assert load.call_count == 0
+        assert [t.path.name for t in second.templates] == ["a.md", "b.md"]
+        assert second.templates is not first.templates
+
+        path = tmp_path / "b.md"
+        path.write_text("# B changed\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = PromptMerger(tmp_path)
+        assert load.call_count == 2
+        assert third.templates[1].content == "# B changed\n"
+
+
+def test_frontmatter_bytes_matches_text_parsing():
+    """Test that parsing raw bytes matches parsing the decoded text."""
+    merger = PromptMerger("dummy")
+
+    for raw in (
+        b"---\r\npriority: 2\r\n---\r\n# T\xc3\xa9 {{x}}\r\n",
+        b"---\nstack: [\n---\nbody\n",
+        b"no frontmatter\n",
+        b"---\nunterminated\n",
+    ):
+        text = raw.decode("utf-8").replace("\r\n", "\n")
+        assert merger._parse_frontmatter_bytes(raw) == merger._parse_frontmatter(text)
+
+
+def test_templates_without_variables_skip_substitution():
+    """Test that content without placeholders is returned untouched."""
+    merger = PromptMerger("dummy")
+    content = "Literal {braces} and {0} stay as-is }}"
+
+    assert merger.replace_variables(content, {"a": 1}) == (content, {})
+    assert merger._extract_variables(content) == []
+
+    merger.add_template_from_string("plain.md", content)
+    template = merger.templates[0]
+    assert template.spans == []
+    assert template.render({"a": 1}) == (content, {})
+
+
+def test_load_templates_skips_broken_symlink(tmp_path):
+    """Test that one unreadable entry does not drop the other templates."""
+    (tmp_path / "a.md").write_text("# A\n")
+    (tmp_path / "b.md").write_text("# B\n")
+    (tmp_path / "broken.md").symlink_to(tmp_path / "missing.md")
+
+    merger = PromptMerger(tmp_path)
+
+    assert [t.path.name for t in merger.templates] == ["a.md", "b.md"]
+
+
+def test_legacy_merge_after_absolute_dir_cached(tmp_path, monkeypatch):
+    """Test that cached templates keep the path spelling of each merger."""
+    from vibe_core.generators.merger import merge_prompts
+
+    prompt_dir = tmp_path / "prompts"
+    prompt_dir.mkdir()
+    (prompt_dir / "a.md").write_text("Hello {{name}}")
+    monkeypatch.chdir(tmp_path)
+
+    PromptMerger(prompt_dir.resolve())
+
+    assert merge_prompts([Path("prompts/a.md")], {"name": "X"}) == "Hello X"
+
+
+def test_render_follows_content_changes(tmp_path):
+    """Test that assigning new content is picked up by later merges."""
+    (tmp_path / "a.md").write_text("Hello {{name}}")
+    merger = PromptMerger(tmp_path)
+    assert merger.merge_prompts({"name": "x"}).content.strip() == "Hello x"
+
+    merger.templates[0].content = "Bye {{name}}"
+    merger.clear_cache()
+
+    assert merger.merge_prompts({"name": "x"}).content.strip() == "Bye x"
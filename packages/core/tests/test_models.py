@@ -60,6 +60,14 @@ class TestProjectConfig:
         new_config = ProjectConfig(**config_dict)
         assert new_config.project_name == sample_config.project_name
 
+    def test_dict_round_trip_keeps_extra_fields(self):
+        """Test that from_dict/to_dict validate and keep extra fields."""
+        config = ProjectConfig.from_dict({"project_name": "test", "custom_field": 1})
+        assert ProjectConfig.from_dict(config.to_dict()) == config
+
+        with pytest.raises(ValidationError):
+            ProjectConfig.from_dict({"project_name": "test", "team_size": 0})
+
 
 class TestGenerationResponse:
     """Test GenerationResponse model."""
@@ -103,6 +111,25 @@ class TestGenerationResponse:
         assert response.logs == []
         assert response.errors == []
 
+    def test_slotted_and_keyword_only(self):
+        """Test that responses are slotted, keyword-only and convert to dicts."""
+        response = GenerationResponse(success=True, files_created=["a.py"])
+
+        assert not hasattr(response, "__dict__")
+        assert response.to_dict()["files_created"] == ["a.py"]
+        with pytest.raises(TypeError):
+            GenerationResponse(True)
+
+
+    def test_pydantic_compatible_api(self):
+        """Test that model_dump/model_validate still work on the dataclass."""
+        response = GenerationResponse(success=True, logs=["done"])
+
+        assert GenerationResponse.model_validate(response.model_dump()) == response
+        assert DryRunResponse.model_validate({"estimated_time": "1.5"}).estimated_time == 1.5
+        with pytest.raises(ValidationError):
+            GenerationResponse.model_validate({"success": "maybe"})
+
 
 class TestDryRunResponse:
     """Test DryRunResponse model."""
@@ -131,3 +158,29 @@ class TestDryRunResponse:
         assert response.files == []
         assert response.estimated_time == 0.0
         assert response.conflicts == []
+
+
+def test_model_schemas_built_at_import():
+    """Test that no model defers schema building to its first use."""
+    from pydantic import BaseModel
+
+    import vibe_core.models as models
+    import vibe_core.models.project as project
+
+    for module in (models, project):
+        for value in vars(module).values():
+            if isinstance(value, type) and issubclass(value, BaseModel) and value is not BaseModel:
+                assert value.__pydantic_complete__, value.__name__
+
+
+def test_single_project_config():
+    """Test that both model modules share one ProjectConfig with both field sets."""
+    import vibe_core.models as models
+    import vibe_core.models.project as project
+
+    assert models.ProjectConfig is project.ProjectConfig
+    config = ProjectConfig(
+        project_name="demo", technology_stack=["fastapi"], features=["api"]
+    )
+    assert config.features == ["api"]
+    assert ProjectConfig(project_name="demo", features={"auth": True}).features == {"auth": True}